@@ -71,6 +71,7 @@ accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 :var registers: Enumerations for action action reversion register types
 """
 
+import importlib
 import re
 import sys
 
@@ -95,10 +96,6 @@ from aeidon.errors import *
 from aeidon.enum import *
 from aeidon.enums import *
 from aeidon import encodings
-from aeidon import languages
-from aeidon import countries
-from aeidon import locales
-from aeidon import scripts
 from aeidon.metadata import *
 from aeidon.calculator import *
 from aeidon.finder import *
@@ -115,6 +112,35 @@ from aeidon.pattern import *
 from aeidon.patternman import *
 from aeidon.clipboard import *
 from aeidon.revertable import *
-from aeidon import agents
-from aeidon.project import *
 from aeidon.unittest import *
+
+# Modules and names that are rarely needed or expensive to set up
+# are imported only once first accessed as attributes of aeidon.
+_lazy_modules = ("agents", "bulk", "countries", "languages", "locales",
+                 "scripts", "subcache")
+
+_lazy_names = {
+    "IntervalIndex": "aeidon.intervals",
+    "Project": "aeidon.project",
+    "ReadingStatistics": "aeidon.readingstats",
+    "SpilledAction": "aeidon.journal",
+    "SubtitleCache": "aeidon.subcache",
+    "UndoJournal": "aeidon.journal",
+    "open_main_files": "aeidon.bulk",
+}
+
+def __getattr__(name):
+    """Import a lazily loaded module or name on first access."""
+    if name in _lazy_modules:
+        return importlib.import_module("aeidon.{}".format(name))
+    if name in _lazy_names:
+        module = importlib.import_module(_lazy_names[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {} has no attribute {}"
+                         .format(repr(__name__), repr(name)))
+
+def __dir__():
+    """Return a list of names including lazily loaded ones."""
+    return sorted(set(globals()) | set(_lazy_modules) | set(_lazy_names))
@@ -17,6 +17,7 @@
 
 """Data editing extension delegates of :class:`aeidon.Project`."""
 
+from .analysis  import AnalysisAgent
 from .clipboard import ClipboardAgent
 from .edit      import EditAgent
 from .format    import FormatAgent
@@ -27,6 +28,7 @@ from .register  import RegisterAgent
 from .save      import SaveAgent
 from .search    import SearchAgent
 from .set       import SetAgent
+from .snapshot  import SnapshotAgent
 from .text      import TextAgent
 from .util      import UtilityAgent
 
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Read-only analysis of subtitle data."""
+
+import aeidon
+
+
+class AnalysisAgent(aeidon.Delegate):
+
+    """
+    Read-only analysis of subtitle data.
+
+    :ivar _interval_index: :class:`aeidon.IntervalIndex` instance or ``None``
+    :ivar _reading_statistics: Dictionary mapping documents to statistics
+
+    Computed statistics are cached until a signal is emitted that indicates
+    a change in positions or texts. Note that changes made by directly setting
+    attributes of subtitles do not emit signals; use the revertable methods
+    of :class:`aeidon.Project` for changes or call
+    :meth:`clear_reading_statistics` after direct changes. The same applies to
+    the interval index and :meth:`clear_interval_index`, except that changes
+    of positions of a few subtitles are updated in place.
+    """
+
+    _clearing_signals = (
+        "action-done",
+        "action-redone",
+        "action-undone",
+        "main-file-opened",
+        "main-texts-changed",
+        "notify::framerate",
+        "notify::subtitles",
+        "positions-changed",
+        "subtitles-changed",
+        "subtitles-inserted",
+        "subtitles-removed",
+        "translation-file-opened",
+        "translation-texts-changed",
+    )
+
+    _interval_clearing_signals = (
+        "main-file-opened",
+        "notify::framerate",
+        "notify::subtitles",
+        "subtitles-changed",
+        "subtitles-inserted",
+        "subtitles-removed",
+    )
+
+    def __init__(self, master):
+        """Initialize an :class:`AnalysisAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._interval_index = None
+        self._reading_statistics = {}
+        for signal in self._clearing_signals:
+            self.connect(signal, self._on_data_changed)
+        for signal in self._interval_clearing_signals:
+            self.connect(signal, self._on_subtitles_changed)
+        self.connect("positions-changed", self._on_positions_changed)
+
+    @aeidon.deco.export
+    def clear_interval_index(self):
+        """Remove cached index of time ranges of subtitles."""
+        self._interval_index = None
+
+    @aeidon.deco.export
+    def clear_reading_statistics(self):
+        """Remove cached reading statistics of all documents."""
+        self._reading_statistics.clear()
+
+    @aeidon.deco.export
+    def get_interval_index(self):
+        """
+        Return an index of time ranges of subtitles.
+
+        Return an instance of :class:`aeidon.IntervalIndex` to find
+        subtitles shown at a position, overlapping a range of positions or
+        nearest to a position. The index is cached and kept current on
+        signals that indicate a change in positions.
+        """
+        if self._interval_index is None:
+            self._interval_index = aeidon.IntervalIndex(self.subtitles)
+        return self._interval_index
+
+    @aeidon.deco.export
+    def get_reading_statistics(self, doc=None):
+        """
+        Return reading speed statistics of all subtitles in `doc`.
+
+        `doc` can be ``None`` to use the main document. Return an instance of
+        :class:`aeidon.ReadingStatistics`. Statistics are computed for all
+        subtitles in one pass and cached until positions or texts change.
+        """
+        doc = doc or aeidon.documents.MAIN
+        if not doc in self._reading_statistics:
+            re_tag = self.get_markup_tag_regex(doc)
+            self._reading_statistics[doc] = aeidon.ReadingStatistics(
+                self.subtitles, doc, re_tag)
+        return self._reading_statistics[doc]
+
+    def _on_data_changed(self, *args):
+        """Remove cached statistics."""
+        self._reading_statistics.clear()
+
+    def _on_positions_changed(self, project, indices):
+        """Update cached interval index."""
+        if self._interval_index is None: return
+        # Rebuilding is faster than updating many in place.
+        if len(indices) > max(16, len(self.subtitles) // 16):
+            self._interval_index = None
+            return
+        for index in indices:
+            subtitle = self.subtitles[index]
+            if not self._interval_index.update(index,
+                                               subtitle.start_seconds,
+                                               subtitle.end_seconds):
+                self._interval_index = None
+                return
+
+    def _on_subtitles_changed(self, *args):
+        """Remove cached interval index."""
+        self._interval_index = None
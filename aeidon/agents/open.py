@@ -18,6 +18,7 @@
 """Reading and parsing data from subtitle files."""
 
 import aeidon
+import asyncio
 import bisect
 
 
@@ -64,11 +65,13 @@ class OpenAgent(aeidon.Delegate):
             i += 1
 
     @aeidon.deco.export
-    def open(self, doc, path, encoding=None, align_method=None):
+    def open(self, doc, path, encoding=None, align_method=None, text=None):
         """
         Read and parse subtitle data for `doc` from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `text` can be the content of file already decoded with `encoding`,
+        e.g. by :func:`aeidon.encodings.probe`, to avoid reading it again.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -78,18 +81,34 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         if doc == aeidon.documents.MAIN:
-            return self.open_main(path, encoding)
+            return self.open_main(path, encoding, text)
         if doc == aeidon.documents.TRAN:
-            return self.open_translation(path, encoding, align_method)
+            return self.open_translation(path, encoding, align_method, text)
         raise ValueError("Invalid document: {}".format(repr(doc)))
 
     @aeidon.deco.export
-    @aeidon.deco.notify_frozen
-    def open_main(self, path, encoding=None):
+    async def open_async(self, doc, path, encoding=None, align_method=None,
+                         text=None, executor=None):
+        """
+        Read and parse subtitle data for `doc` from `path` asynchronously.
+
+        See :meth:`open_main_async` and :meth:`open_translation_async`.
+        """
+        if doc == aeidon.documents.MAIN:
+            return await self.open_main_async(
+                path, encoding, text, executor)
+        if doc == aeidon.documents.TRAN:
+            return await self.open_translation_async(
+                path, encoding, align_method, text, executor)
+        raise ValueError("Invalid document: {}".format(repr(doc)))
+
+    @aeidon.deco.export
+    def open_main(self, path, encoding=None, text=None):
         """
         Read and parse subtitle data for main file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `text` can be the content of file already decoded with `encoding`.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -98,29 +117,57 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.FormatError` if unable to detect format.
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
-        encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
-        self.subtitles, sort_count = self._sort_subtitles(subtitles)
+        return self._open_main(*self._read(path, encoding, text))
+
+    def _open_main(self, file, subtitles, sort_count):
+        """Set main file and subtitles and return sort count."""
+        self.open_main_subtitles(file, subtitles)
+        return sort_count
+
+    @aeidon.deco.export
+    async def open_main_async(self, path, encoding=None, text=None,
+                              executor=None):
+        """
+        Read and parse subtitle data for main file asynchronously.
+
+        Reading, decoding and parsing the file is run in `executor`, which can
+        be ``None`` to use :func:`aeidon.util.get_executor`. The project is
+        updated and signals emitted in the running event loop, once parsing is
+        done. Arguments, return value and exceptions as for :meth:`open_main`.
+        """
+        loop = asyncio.get_running_loop()
+        executor = executor or aeidon.util.get_executor()
+        args = await loop.run_in_executor(
+            executor, self._read, path, encoding, text)
+        return self._open_main(*args)
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def open_main_subtitles(self, file, subtitles):
+        """
+        Set main `file` and `subtitles` already read from it.
+
+        This can be used instead of :meth:`open_main` if reading and parsing
+        has been done elsewhere, e.g. in another process. `subtitles` should
+        be sorted by position.
+        """
+        self.main_file = file
+        self.subtitles = subtitles
         self.set_framerate(self.framerate, register=None)
         self.main_changed = 0
         # Deactivate possible translation file.
         self.tran_file = None
         self.tran_changed = None
         self.emit("main-file-opened", self.main_file)
-        return sort_count
 
     @aeidon.deco.export
-    @aeidon.deco.notify_frozen
-    def open_translation(self, path, encoding=None, align_method=None):
+    def open_translation(self, path, encoding=None, align_method=None,
+                         text=None):
         """
         Read and parse subtitle data for translation file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `text` can be the content of file already decoded with `encoding`.
         `align_method` specifies how translation texts are attached to existing
         subtitles. :attr:`aeidon.align_methods.NUMBER` is the simple way, which
         adds the translation texts in order, one-by-one to the exising
@@ -140,15 +187,15 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.FormatError` if unable to detect format.
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
-        encoding = encoding or aeidon.util.get_default_encoding()
+        file, subtitles, sort_count = self._read(path, encoding, text)
+        return self._open_translation(file, subtitles, sort_count,
+                                      align_method)
+
+    @aeidon.deco.notify_frozen
+    def _open_translation(self, file, subtitles, sort_count, align_method):
+        """Set translation file and texts and return sort count."""
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
-        subtitles, sort_count = self._sort_subtitles(subtitles)
+        self.tran_file = file
         for subtitle in subtitles:
             subtitle.framerate = self.framerate
         for subtitle in self.subtitles:
@@ -163,9 +210,55 @@ class OpenAgent(aeidon.Delegate):
         self.emit("translation-file-opened", self.tran_file)
         return sort_count
 
-    def _read_file(self, file):
+    @aeidon.deco.export
+    async def open_translation_async(self, path, encoding=None,
+                                     align_method=None, text=None,
+                                     executor=None):
+        """
+        Read and parse subtitle data for translation file asynchronously.
+
+        Reading, decoding and parsing the file is run in `executor`, which can
+        be ``None`` to use :func:`aeidon.util.get_executor`. The project is
+        updated and signals emitted in the running event loop, once parsing is
+        done. Arguments, return value and exceptions as for
+        :meth:`open_translation`.
+        """
+        loop = asyncio.get_running_loop()
+        executor = executor or aeidon.util.get_executor()
+        file, subtitles, sort_count = await loop.run_in_executor(
+            executor, self._read, path, encoding, text)
+        return self._open_translation(file, subtitles, sort_count,
+                                      align_method)
+
+    def _read(self, path, encoding=None, text=None):
+        """
+        Read and parse file at `path` without changing the project.
+
+        Return file, subtitles sorted by position and sort count.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Raise :exc:`aeidon.ParseError` if parsing fails.
+        """
+        encoding = encoding or aeidon.util.get_default_encoding()
+        bom_encoding = aeidon.encodings.detect_bom(path)
+        if not bom_encoding in (encoding, None):
+            return self._read(path, bom_encoding)
+        format = aeidon.util.detect_format(path, encoding)
+        file = aeidon.files.new(format, path, encoding)
+        subtitles = self._read_file(file, text)
+        subtitles, sort_count = self._sort_subtitles(subtitles)
+        return file, subtitles, sort_count
+
+    def _read_file(self, file, text=None):
         """Read `file` and return subtitles."""
+        if text is not None:
+            file.set_text(text)
         try:
+            if self.subtitle_cache is not None:
+                subtitles = self.subtitle_cache.read(file)
+                file.set_text(None)
+                return subtitles
             return file.read()
         except (IOError, UnicodeError):
             raise
@@ -45,11 +45,13 @@ class PositionAgent(aeidon.Delegate):
         """
         new_indices = []
         new_subtitles = []
+        subtitles = self.subtitles
+        text_length = self.get_text_length
         for index in indices or self.get_all_indices():
-            start = self.subtitles[index].start_seconds
-            end = self.subtitles[index].end_seconds
+            start = subtitles[index].start_seconds
+            end = subtitles[index].end_seconds
             if speed is not None:
-                length = self.get_text_length(index, aeidon.documents.MAIN)
+                length = text_length(index, aeidon.documents.MAIN)
                 optimal_duration = length / speed
                 dol = lengthen and end - start < optimal_duration
                 dos = shorten  and end - start > optimal_duration
@@ -58,15 +60,15 @@ class PositionAgent(aeidon.Delegate):
             domax = maximum and end - start > maximum
             end = start + minimum if domin else end
             end = start + maximum if domax else end
-            end_max = (self.subtitles[index+1].start_seconds
-                       if index < len(self.subtitles) - 1
+            end_max = (subtitles[index+1].start_seconds
+                       if index < len(subtitles) - 1
                        else 360000)
 
             dogap = gap is not None and end_max - end < gap
             end = max(start, end_max - gap) if dogap else end
-            if end != self.subtitles[index].end_seconds:
+            if end != subtitles[index].end_seconds:
                 new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
+                subtitle = subtitles[index].copy()
                 subtitle.end_seconds = end
                 new_subtitles.append(subtitle)
         if not new_indices: return []
@@ -87,8 +89,9 @@ class PositionAgent(aeidon.Delegate):
         new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
+        subtitles = self.subtitles
         for index in indices:
-            subtitle = self.subtitles[index].copy()
+            subtitle = subtitles[index].copy()
             subtitle.convert_framerate(framerate_out)
             new_subtitles.append(subtitle)
         self.set_framerate(framerate_out)
@@ -160,8 +163,9 @@ class PositionAgent(aeidon.Delegate):
         """
         new_subtitles = []
         indices = indices or self.get_all_indices()
+        subtitles = self.subtitles
         for index in indices:
-            subtitle = self.subtitles[index].copy()
+            subtitle = subtitles[index].copy()
             subtitle.shift_positions(value)
             new_subtitles.append(subtitle)
         self.replace_positions(indices, new_subtitles, register=register)
@@ -179,8 +183,9 @@ class PositionAgent(aeidon.Delegate):
         new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
+        subtitles = self.subtitles
         for index in indices:
-            subtitle = self.subtitles[index].copy()
+            subtitle = subtitles[index].copy()
             subtitle.scale_positions(coefficient)
             subtitle.shift_positions(constant)
             new_subtitles.append(subtitle)
@@ -40,9 +40,25 @@ resulting action needs to be grouped as one using :meth:`group_actions`.
 If a revertable method needs to be performed without the possibility of
 reverting, the `register` keyword argument should be given a value of ``None``.
 This way it will not be in any way processed by the undo/redo system.
+
+If :attr:`aeidon.Project.undo_merge_window` is set, successive edits of the
+same text or position of the same subtitle, done within that many seconds of
+each other, are merged into one action by :meth:`merge_action`, called after
+each top-level revertable method. The oldest action of such a run is kept,
+since reverting it restores the value before the first edit, and newer ones
+are discarded.
+
+If :attr:`aeidon.Project.undo_memory_limit` is set, older actions are stored
+on disk in an :class:`aeidon.UndoJournal` and replaced in the stacks with
+:class:`aeidon.SpilledAction` placeholders, which are loaded back when
+undoing or redoing reaches them. Actions that cannot be pickled are kept in
+memory, as is the action that the next edit can still be merged with.
 """
 
 import aeidon
+import itertools
+import time
+import weakref
 
 
 class RegisterAgent(aeidon.Delegate):
@@ -51,21 +67,20 @@ class RegisterAgent(aeidon.Delegate):
     Managing revertable actions.
 
     :ivar _do_description: Original description of the action
+    :ivar _journal: :class:`aeidon.UndoJournal` instance or ``None``
+    :ivar _merge: State of the most recent mergeable action or ``None``
+    :ivar _unspillable: Set of actions that failed to be stored on disk
     """
 
     def __init__(self, master):
         """Initialize a :class:`RegisterAgent` instance."""
         aeidon.Delegate.__init__(self, master)
         self._do_description = None
+        self._journal = None
+        self._merge = None
+        self._unspillable = weakref.WeakSet()
         aeidon.util.connect(self, self, "notify::undo_limit")
 
-    def _break_action_group(self, stack, index=0):
-        """Break the action group in `stack` and return amount broken into."""
-        action_group = stack.pop(index)
-        for action in reversed(action_group.actions):
-            stack.insert(index, action)
-        return len(action_group.actions)
-
     @aeidon.deco.export
     def can_redo(self, count=1):
         """Return ``True`` if one or more actions can be redone."""
@@ -76,12 +91,41 @@ class RegisterAgent(aeidon.Delegate):
         """Return ``True`` if one or more actions can be undone."""
         return len(self.undoables) >= count
 
+    @aeidon.deco.export
+    def clear_reversion_stacks(self):
+        """Remove all actions from undo and redo stacks."""
+        self.undoables.clear()
+        self.redoables.clear()
+        self._merge = None
+        if self._journal is not None:
+            self._journal.clear()
+
     @aeidon.deco.export
     def cut_reversion_stacks(self):
-        """Cut undo and redo stacks to their maximum lengths."""
+        """
+        Cut undo and redo stacks to their maximum lengths.
+
+        Actions beyond :attr:`undo_memory_limit` are stored on disk.
+        """
         if self.undo_limit is not None:
-            del self.redoables[self.undo_limit:]
-            del self.undoables[self.undo_limit:]
+            for stack in (self.undoables, self.redoables):
+                if len(stack) <= self.undo_limit: continue
+                self._discard(itertools.islice(stack, self.undo_limit, None))
+                # Deques do not support deleting slices.
+                for i in range(len(stack) - self.undo_limit):
+                    stack.pop()
+        if self.undo_memory_limit is not None:
+            self._spill(self.undoables)
+            self._spill(self.redoables)
+        if self._journal is not None:
+            self._trim_journal()
+
+    def _discard(self, actions):
+        """Mark stored ones of `actions` as no longer needed."""
+        if self._journal is None: return
+        for action in actions:
+            if isinstance(action, aeidon.SpilledAction):
+                self._journal.discard(action)
 
     @aeidon.deco.export
     def emit_action_signal(self, register):
@@ -99,6 +143,15 @@ class RegisterAgent(aeidon.Delegate):
         raise ValueError("Invalid register: {}"
                          .format(repr(register)))
 
+    def _get_merge_key(self, action):
+        """Return a tuple identifying the edit of `action` or ``None``."""
+        if not isinstance(action, aeidon.RevertableAction): return None
+        if action.revert_function in (self.set_end, self.set_start):
+            return (action.revert_function, action.revert_args[0], None)
+        if action.revert_function == self.set_text:
+            return (action.revert_function, *action.revert_args[:2])
+        return None
+
     def _get_source_stack(self, register):
         """Return the stack where the action to register is taken from."""
         if register.shift == 1:
@@ -117,33 +170,86 @@ class RegisterAgent(aeidon.Delegate):
         action_group.description = description
         stack = self._get_destination_stack(register)
         for i in range(count):
-            action = stack.pop(0)
+            action = self._pop(stack)
             if isinstance(action, aeidon.RevertableActionGroup):
                 action_group.actions.extend(action.actions)
             else: # Single action
                 action_group.actions.append(action)
         stack.insert(0, action_group)
 
+    @aeidon.deco.export
+    def merge_action(self, register):
+        """
+        Merge the most recent registered action with the previous if possible.
+
+        Actions are merged if they edit the same text or position of the same
+        subtitle within :attr:`undo_merge_window` seconds, there has been no
+        other change, e.g. saving, in between, and less than
+        :attr:`undo_merge_limit` actions have been merged so far.
+        """
+        if register != aeidon.registers.DO: return
+        action = self.undoables[0]
+        key = self._get_merge_key(action)
+        now = time.monotonic()
+        merge, self._merge = self._merge, None
+        if key is None: return
+        # Compare change counters before this action
+        # to detect saving, i.e. resetting counters.
+        self._shift_changed_value(action, -register.shift)
+        changed = (self.main_changed, self.tran_changed)
+        if (merge is not None and
+            self.undo_merge_window is not None and
+            now - merge["time"] <= self.undo_merge_window and
+            merge["count"] < self.undo_merge_limit and
+            len(self.undoables) > 1 and
+            self.undoables[1] is merge["action"] and
+            key == merge["key"] and
+            # Subtitles can move when editing start positions.
+            self.subtitles[key[1]] is merge["subtitle"] and
+            changed == merge["changed"]):
+            # Discard the newer action, reverting the older one
+            # restores the value before the first merged edit.
+            del self.undoables[0]
+            merge["count"] += 1
+            merge["time"] = now
+            self._merge = merge
+            return
+        self._shift_changed_value(action, register.shift)
+        self._merge = dict(action=action,
+                           changed=(self.main_changed, self.tran_changed),
+                           count=1,
+                           key=key,
+                           subtitle=self.subtitles[key[1]],
+                           time=now)
+
     def _on_notify_undo_limit(self, *args):
         """Cut reversion stacks if limit set."""
         if self.undo_limit is not None:
             self.cut_reversion_stacks()
 
+    def _pop(self, stack):
+        """Remove and return the most recent action in `stack`."""
+        action = self._restore(stack)[0]
+        del stack[0]
+        return action
+
     @aeidon.deco.export
     def redo(self, count=1):
         """Redo `count` amount of actions from the redoable stack."""
         group = aeidon.RevertableActionGroup
+        self._restore(self.redoables)
         if count > 1 or isinstance(self.redoables[0], group):
             return self._revert_multiple(count, aeidon.registers.REDO)
         self._do_description = self.redoables[0].description
-        self.redoables.pop(0).revert()
+        self._pop(self.redoables).revert()
 
     @aeidon.deco.export
     def register_action(self, action):
         """Register `action` as done, undone or redone."""
         if action.register == aeidon.registers.DO:
             self.undoables.insert(0, action)
-            self.redoables = []
+            self._discard(self.redoables)
+            self.redoables.clear()
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.UNDO:
             self.redoables.insert(0, action)
@@ -154,20 +260,32 @@ class RegisterAgent(aeidon.Delegate):
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
 
+    def _restore(self, stack):
+        """Load the most recent action in `stack` if stored on disk."""
+        if stack and isinstance(stack[0], aeidon.SpilledAction):
+            self._journal.discard(stack[0])
+            stack[0] = self._journal.load(stack[0])
+        return stack
+
     def _revert_multiple(self, count, register):
         """Revert multiple actions."""
         self.block(register.signal)
         stack = self._get_source_stack(register)
         for i in range(count):
-            part_count = 1
-            if isinstance(stack[0], aeidon.RevertableActionGroup):
-                description = stack[0].description
-                part_count = self._break_action_group(stack)
-            for j in range(part_count):
-                self._do_description = stack[0].description
-                stack.pop(0).revert()
-            if part_count > 1:
-                self.group_actions(register, part_count, description)
+            action = self._pop(stack)
+            if not isinstance(action, aeidon.RevertableActionGroup):
+                self._do_description = action.description
+                action.revert()
+                continue
+            # Revert parts of group directly without breaking
+            # the group into the stack and regroup the results.
+            for part in action.actions:
+                self._do_description = part.description
+                part.revert()
+            if len(action.actions) > 1:
+                self.group_actions(register,
+                                   len(action.actions),
+                                   action.description)
         self.unblock(register.signal)
         self.cut_reversion_stacks()
         self.emit_action_signal(register)
@@ -191,11 +309,50 @@ class RegisterAgent(aeidon.Delegate):
             if self.tran_changed is not None:
                 self.tran_changed += shift
 
+    def _spill(self, stack):
+        """Store actions in `stack` beyond :attr:`undo_memory_limit` on disk."""
+        # Always keep the most recent action in memory, since it is
+        # accessed directly after registering, e.g. to emit signals.
+        for i in range(max(1, self.undo_memory_limit), len(stack)):
+            # Actions are stored as they age past the limit, so older
+            # actions have already been stored or tried to be stored.
+            if isinstance(stack[i], aeidon.SpilledAction): break
+            if stack[i] in self._unspillable: break
+            # Keep the action that the next one can be merged with
+            # in memory for merge_action to find it by identity.
+            if (self.undo_merge_window is not None and
+                self._merge is not None and
+                stack[i] is self._merge["action"]):
+                continue
+            if self._journal is None:
+                self._journal = aeidon.UndoJournal(self.master)
+            try:
+                stack[i] = self._journal.dump(stack[i])
+            except Exception:
+                # Keep actions that cannot be pickled in memory
+                # and don't try to store them again.
+                self._unspillable.add(stack[i])
+                break
+
+    def _trim_journal(self):
+        """Reclaim space of actions in journal no longer needed."""
+        if self._journal.size == 0: return
+        if self._journal.garbage >= self._journal.size:
+            return self._journal.clear()
+        # Rewrite only once most of the journal is garbage
+        # to keep the amortized cost per action constant.
+        if self._journal.garbage * 2 <= self._journal.size: return
+        spilled = [x for x in itertools.chain(self.undoables, self.redoables)
+                   if isinstance(x, aeidon.SpilledAction)]
+        with aeidon.util.silent(IOError):
+            self._journal.compact(spilled)
+
     @aeidon.deco.export
     def undo(self, count=1):
         """Undo `count` amount of actions from the undoable stack."""
         group = aeidon.RevertableActionGroup
+        self._restore(self.undoables)
         if count > 1 or isinstance(self.undoables[0], group):
             return self._revert_multiple(count, aeidon.registers.UNDO)
         self._do_description = self.undoables[0].description
-        self.undoables.pop(0).revert()
+        self._pop(self.undoables).revert()
@@ -18,12 +18,21 @@
 """Writing subtitle data to file."""
 
 import aeidon
+import asyncio
 
 
 class SaveAgent(aeidon.Delegate):
 
     """Writing subtitle data to file."""
 
+    def _get_file(self, doc, file):
+        """Return `file` or the file of `doc` with properties copied."""
+        current_file = self.get_file(doc)
+        file = file or current_file
+        if file is not None and current_file is not None:
+            file.copy_from(current_file)
+        return file
+
     def _save(self, doc, file, keep_changes):
         """
         Write subtitle data from `doc` to `file`.
@@ -33,22 +42,8 @@ class SaveAgent(aeidon.Delegate):
         Raise :exc:`UnicodeError` if encoding fails.
         """
         current_format = self.get_format(doc)
-        orig_texts = [x.get_text(doc) for x in self.subtitles]
-        indices = []
-        if current_format is not None and file.format != current_format:
-            # Convert markup if saving in different format.
-            converter = aeidon.MarkupConverter(current_format, file.format)
-            for i, subtitle in enumerate(self.subtitles):
-                text = subtitle.get_text(doc)
-                new_text = converter.convert(text)
-                if new_text == text: continue
-                subtitle.set_text(doc, new_text)
-                indices.append(i)
-        file.write(self.subtitles, doc)
-        if keep_changes: return indices
-        for i, subtitle in enumerate(self.subtitles):
-            subtitle.set_text(doc, orig_texts[i])
-        return []
+        indices, texts = self._write(doc, file, self.subtitles, current_format)
+        return self._set_converted_texts(doc, indices, texts, keep_changes)
 
     @aeidon.deco.export
     def save(self, doc, file=None, keep_changes=True):
@@ -65,6 +60,39 @@ class SaveAgent(aeidon.Delegate):
             return self.save_translation(file, keep_changes)
         raise ValueError("Invalid document: {}".format(repr(doc)))
 
+    async def _save_async(self, doc, file, keep_changes, executor):
+        """
+        Write subtitle data from `doc` to `file` in `executor`.
+
+        Return indices of texts changed due to markup conversion.
+        Raise :exc:`IOError` if writing fails.
+        Raise :exc:`UnicodeError` if encoding fails.
+        """
+        # Write copies of subtitles so that the project
+        # is not accessed from outside the event loop.
+        subtitles = [x.copy() for x in self.subtitles]
+        current_format = self.get_format(doc)
+        loop = asyncio.get_running_loop()
+        executor = executor or aeidon.util.get_executor()
+        indices, texts = await loop.run_in_executor(
+            executor, self._write, doc, file, subtitles, current_format)
+        return self._set_converted_texts(doc, indices, texts, keep_changes)
+
+    @aeidon.deco.export
+    async def save_async(self, doc, file=None, keep_changes=True,
+                         executor=None):
+        """
+        Write subtitle data from `doc` to `file` asynchronously.
+
+        See :meth:`save_main_async` and :meth:`save_translation_async`.
+        """
+        if doc == aeidon.documents.MAIN:
+            return await self.save_main_async(file, keep_changes, executor)
+        if doc == aeidon.documents.TRAN:
+            return await self.save_translation_async(
+                file, keep_changes, executor)
+        raise ValueError("Invalid document: {}".format(repr(doc)))
+
     @aeidon.deco.export
     def save_main(self, file=None, keep_changes=True):
         """
@@ -74,10 +102,57 @@ class SaveAgent(aeidon.Delegate):
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        file = file or self.main_file
-        if file is not None and self.main_file is not None:
-            file.copy_from(self.main_file)
+        file = self._get_file(aeidon.documents.MAIN, file)
         indices = self._save(aeidon.documents.MAIN, file, keep_changes)
+        self._saved_main(file, keep_changes, indices)
+
+    @aeidon.deco.export
+    async def save_main_async(self, file=None, keep_changes=True,
+                              executor=None):
+        """
+        Write subtitle data from main document to `file` asynchronously.
+
+        Markup conversion and writing the file is run in `executor`, which can
+        be ``None`` to use :func:`aeidon.util.get_executor`. The project is
+        updated and signals emitted in the running event loop, once writing is
+        done. Arguments and exceptions as for :meth:`save_main`.
+        """
+        file = self._get_file(aeidon.documents.MAIN, file)
+        indices = await self._save_async(
+            aeidon.documents.MAIN, file, keep_changes, executor)
+        self._saved_main(file, keep_changes, indices)
+
+    @aeidon.deco.export
+    def save_translation(self, file=None, keep_changes=True):
+        """
+        Write subtitle data from translation document to `file`.
+
+        `file` can be ``None`` to use :attr:`tran_file`.
+        Raise :exc:`IOError` if writing fails.
+        Raise :exc:`UnicodeError` if encoding fails.
+        """
+        file = self._get_file(aeidon.documents.TRAN, file)
+        indices = self._save(aeidon.documents.TRAN, file, keep_changes)
+        self._saved_translation(file, keep_changes, indices)
+
+    @aeidon.deco.export
+    async def save_translation_async(self, file=None, keep_changes=True,
+                                     executor=None):
+        """
+        Write subtitle data from translation document to `file` asynchronously.
+
+        Markup conversion and writing the file is run in `executor`, which can
+        be ``None`` to use :func:`aeidon.util.get_executor`. The project is
+        updated and signals emitted in the running event loop, once writing is
+        done. Arguments and exceptions as for :meth:`save_translation`.
+        """
+        file = self._get_file(aeidon.documents.TRAN, file)
+        indices = await self._save_async(
+            aeidon.documents.TRAN, file, keep_changes, executor)
+        self._saved_translation(file, keep_changes, indices)
+
+    def _saved_main(self, file, keep_changes, indices):
+        """Update main file status after saving to `file`."""
         if keep_changes:
             if (self.main_file is not None and
                 file.mode != self.main_file.mode):
@@ -90,21 +165,50 @@ class SaveAgent(aeidon.Delegate):
             self.emit("main-texts-changed", indices)
         self.emit("main-file-saved", file)
 
-    @aeidon.deco.export
-    def save_translation(self, file=None, keep_changes=True):
-        """
-        Write subtitle data from translation document to `file`.
-
-        `file` can be ``None`` to use :attr:`tran_file`.
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        file = file or self.tran_file
-        if file is not None and self.tran_file is not None:
-            file.copy_from(self.tran_file)
-        indices = self._save(aeidon.documents.TRAN, file, keep_changes)
+    def _saved_translation(self, file, keep_changes, indices):
+        """Update translation file status after saving to `file`."""
         if keep_changes:
             self.tran_file = file
             self.tran_changed = 0
             self.emit("translation-texts-changed", indices)
         self.emit("translation-file-saved", file)
+
+    def _set_converted_texts(self, doc, indices, texts, keep_changes):
+        """
+        Set `texts` changed due to markup conversion if `keep_changes`.
+
+        Return indices of texts set.
+        """
+        if not keep_changes: return []
+        for i, text in zip(indices, texts):
+            self.subtitles[i].set_text(doc, text)
+        return indices
+
+    def _write(self, doc, file, subtitles, current_format):
+        """
+        Write `subtitles` with text from `doc` to `file`.
+
+        Markup is converted from `current_format` to the format of `file`, but
+        `subtitles` are left unchanged. Return indices and texts changed due to
+        markup conversion. Raise :exc:`IOError` if writing fails.
+        Raise :exc:`UnicodeError` if encoding fails.
+        """
+        orig_texts = [x.get_text(doc) for x in subtitles]
+        indices = []
+        texts = []
+        if current_format is not None and file.format != current_format:
+            # Convert markup if saving in different format.
+            converter = aeidon.MarkupConverter.shared(
+                current_format, file.format)
+            new_texts = converter.convert_many(orig_texts)
+            for i, subtitle in enumerate(subtitles):
+                if new_texts[i] == orig_texts[i]: continue
+                subtitle.set_text(doc, new_texts[i])
+                indices.append(i)
+                texts.append(new_texts[i])
+        try:
+            file.write(subtitles, doc)
+        finally:
+            for i in indices:
+                subtitles[i].set_text(doc, orig_texts[i])
+        return indices, texts
@@ -83,6 +83,43 @@ class SearchAgent(aeidon.Delegate):
             index = (min(indices) if next else max(indices))
             pos = None
 
+    @aeidon.deco.export
+    def find_all(self, indices=None, docs=None, count=False):
+        """
+        Find all matches of pattern in one pass.
+
+        `indices` and `docs` can be ``None`` to use the search target set
+        with :meth:`set_search_target`. Matches are found in the same order
+        as with :meth:`find_next`, but without wrapping.
+        Return a generator of tuples of index, document, match span or,
+        if `count` is ``True``, the amount of matches.
+        """
+        indices = sorted(indices or self._indices or
+                         range(len(self.subtitles)))
+        docs = tuple(docs or self._docs)
+        # Look up subtitles once, outside the loops.
+        subtitles = self.subtitles
+        pattern = self._finder.pattern
+        if (count and
+            isinstance(pattern, str) and
+            not self._finder.ignore_case):
+            return sum(subtitles[i].get_text(doc).count(pattern)
+                       for doc in docs for i in indices)
+        pattern = self._get_pattern()
+        if count:
+            return sum(1 for doc in docs for i in indices
+                       for match in pattern.finditer(
+                               subtitles[i].get_text(doc)))
+        return self._find_all(subtitles, indices, docs, pattern)
+
+    def _find_all(self, subtitles, indices, docs, pattern):
+        """Yield index, document, match span of all matches of `pattern`."""
+        for doc in docs:
+            for index in indices:
+                text = subtitles[index].get_text(doc)
+                for match in pattern.finditer(text):
+                    yield index, doc, match.span()
+
     @aeidon.deco.export
     def find_next(self, index=None, doc=None, pos=None):
         """
@@ -134,6 +171,13 @@ class SearchAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {} or invalid next: {}"
                          .format(repr(doc), repr(next)))
 
+    def _get_pattern(self):
+        """Return pattern to find as a regular expression object."""
+        pattern = self._finder.pattern
+        if not isinstance(pattern, str): return pattern
+        flags = (re.IGNORECASE if self._finder.ignore_case else 0)
+        return re.compile(re.escape(pattern), flags)
+
     def _next_in_document(self, index, doc, pos=None):
         """
         Find the next match in `doc` starting from `pos`.
@@ -143,9 +187,11 @@ class SearchAgent(aeidon.Delegate):
         Raise :exc:`ValueError` if no match in this `doc` after `pos`.
         Return tuple of index, document, match span.
         """
+        # Look up subtitles once, outside the loop.
+        subtitles = self.subtitles
         indices = self._indices or self.get_all_indices()
         for index in range(index, max(indices)+1):
-            text = self.subtitles[index].get_text(doc)
+            text = subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
                 self._finder.set_text(text)
@@ -180,9 +226,11 @@ class SearchAgent(aeidon.Delegate):
         Raise :exc:`ValueError` if no match in this `doc` before `pos`.
         Return tuple of index, document, match span.
         """
+        # Look up subtitles once, outside the loop.
+        subtitles = self.subtitles
         indices = self._indices or self.get_all_indices()
         for index in reversed(range(min(indices), index+1)):
-            text = self.subtitles[index].get_text(doc)
+            text = subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
                 self._finder.set_text(text)
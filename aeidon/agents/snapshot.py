@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Saving and restoring projects as binary snapshots."""
+
+import aeidon
+import json
+import mmap
+import struct
+
+
+class SnapshotAgent(aeidon.Delegate):
+
+    """
+    Saving and restoring projects as binary snapshots.
+
+    A snapshot consists of, in order and in little-endian byte order,
+
+     * ``_magic`` bytes identifying the file type and format version
+     * Length-prefixed UTF-8 JSON of framerate, files and other metadata
+     * Amount of subtitles, *N*, as an unsigned 32-bit integer
+     * *N* bytes of position modes of subtitles
+     * *2N* signed 64-bit integers of start and end positions, as frames
+       or as milliseconds depending on mode
+     * *2N* unsigned 32-bit integers of byte lengths of main and
+       translation texts
+     * Pool of UTF-8 encoded main texts followed by translation texts
+
+    Snapshots are read via :mod:`mmap`, decoding only slices of the file.
+    """
+
+    _magic = b"AEIDON-SNAPSHOT-1\n"
+
+    def _dump_file(self, file):
+        """Return a dictionary of properties of `file` or ``None``."""
+        if file is None: return None
+        state = {k: v for k, v in vars(file).items() if k != "_text"}
+        state["format"] = file.format.name
+        state["newline"] = file.newline.name
+        return state
+
+    def _get_containers(self):
+        """Return a dictionary of containers of subtitles by name."""
+        names = set(x.container for x in aeidon.formats if x.container)
+        containers = {}
+        for i, subtitle in enumerate(self.subtitles):
+            # Containers are lazily instantiated,
+            # store only those actually used.
+            for name in names & set(subtitle.__dict__):
+                container = subtitle.__dict__[name]
+                containers.setdefault(name, {})[str(i)] = vars(container)
+        return containers
+
+    def _load_file(self, state):
+        """Return a new file from dictionary of properties `state`."""
+        if state is None: return None
+        format = getattr(aeidon.formats, state.pop("format"))
+        file = aeidon.files.new(format, state["path"], state["encoding"])
+        state["newline"] = getattr(aeidon.newlines, state["newline"])
+        file.__dict__.update({k: tuple(v) if isinstance(v, list) else v
+                              for k, v in state.items()})
+        return file
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def open_snapshot(self, path):
+        """
+        Restore project from binary snapshot file at `path`.
+
+        Subtitles, files, framerate and change counters are restored. Undo
+        and redo stacks are not stored, but cleared: actions refer to bound
+        methods of the project they were done in and arbitrary arguments,
+        which could only be stored with :mod:`pickle`, and unpickling is not
+        safe for files that may come from elsewhere.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`aeidon.ParseError` if `path` is not a valid snapshot.
+        """
+        with open(path, "rb") as f:
+            try:
+                blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                blob = b""
+            try:
+                subtitles, meta = self._read_snapshot(blob)
+            except Exception:
+                raise aeidon.ParseError("Failed to parse snapshot {}"
+                                        .format(repr(path)))
+            finally:
+                if isinstance(blob, mmap.mmap):
+                    blob.close()
+        self.framerate = getattr(aeidon.framerates, meta["framerate"])
+        self.calc = aeidon.Calculator(self.framerate)
+        self.main_file = self._load_file(meta["main_file"])
+        self.tran_file = self._load_file(meta["tran_file"])
+        self.main_changed = meta["main_changed"]
+        self.tran_changed = meta["tran_changed"]
+        self.video_path = meta["video_path"]
+        self.clear_reversion_stacks()
+        self.subtitles = subtitles
+        if self.main_file is not None:
+            self.emit("main-file-opened", self.main_file)
+        if self.tran_file is not None:
+            self.emit("translation-file-opened", self.tran_file)
+
+    def _read_snapshot(self, blob):
+        """Return subtitles and metadata read from snapshot `blob`."""
+        if blob[:len(self._magic)] != self._magic:
+            raise ValueError("Invalid snapshot magic")
+        offset = len(self._magic)
+        length, = struct.unpack_from("<I", blob, offset)
+        offset += 4
+        meta = json.loads(str(blob[offset:offset+length], "utf_8"))
+        offset += length
+        n, = struct.unpack_from("<I", blob, offset)
+        offset += 4
+        modes = blob[offset:offset+n]
+        offset += n
+        positions = struct.unpack_from("<{:d}q".format(2*n), blob, offset)
+        offset += 16 * n
+        lengths = struct.unpack_from("<{:d}I".format(2*n), blob, offset)
+        offset += 8 * n
+        texts = []
+        for length in lengths:
+            texts.append(str(blob[offset:offset+length], "utf_8"))
+            offset += length
+        framerate = getattr(aeidon.framerates, meta["framerate"])
+        subtitles = []
+        for i in range(n):
+            mode = aeidon.modes[modes[i]]
+            subtitle = aeidon.Subtitle(mode, framerate)
+            start, end = positions[2*i], positions[2*i+1]
+            if mode == aeidon.modes.TIME:
+                start, end = self._to_time(start), self._to_time(end)
+            subtitle._start = start
+            subtitle._end = end
+            subtitle._main_text = texts[i]
+            subtitle._tran_text = texts[n+i]
+            subtitles.append(subtitle)
+        for name, items in meta["containers"].items():
+            for i, attrs in items.items():
+                container = aeidon.containers.new(name)
+                container.__dict__.update(attrs)
+                setattr(subtitles[int(i)], name, container)
+        return subtitles, meta
+
+    @aeidon.deco.export
+    def save_snapshot(self, path):
+        """
+        Write project to binary snapshot file at `path`.
+
+        Raise :exc:`IOError` if writing fails.
+        """
+        meta = json.dumps(dict(
+            containers=self._get_containers(),
+            framerate=self.framerate.name,
+            main_changed=self.main_changed,
+            main_file=self._dump_file(self.main_file),
+            tran_changed=self.tran_changed,
+            tran_file=self._dump_file(self.tran_file),
+            video_path=self.video_path,
+        )).encode("utf_8")
+        n = len(self.subtitles)
+        modes = bytes(x.mode for x in self.subtitles)
+        positions = []
+        for subtitle in self.subtitles:
+            if subtitle.mode == aeidon.modes.TIME:
+                positions.append(round(1000 * subtitle.start_seconds))
+                positions.append(round(1000 * subtitle.end_seconds))
+            else:
+                positions.append(subtitle.start_frame)
+                positions.append(subtitle.end_frame)
+        texts = [x.main_text.encode("utf_8") for x in self.subtitles]
+        texts.extend(x.tran_text.encode("utf_8") for x in self.subtitles)
+        with aeidon.util.atomic_open(path, "wb") as f:
+            f.write(self._magic)
+            f.write(struct.pack("<I", len(meta)))
+            f.write(meta)
+            f.write(struct.pack("<I", n))
+            f.write(modes)
+            f.write(struct.pack("<{:d}q".format(2*n), *positions))
+            f.write(struct.pack("<{:d}I".format(2*n), *map(len, texts)))
+            f.write(b"".join(texts))
+
+    @staticmethod
+    def _to_time(ms):
+        """Return time string from `ms` integer milliseconds."""
+        sign = ("-" if ms < 0 else "")
+        seconds, ms = divmod(abs(ms), 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours > 99:
+            return "{}99:59:59.999".format(sign)
+        return ("{}{:02d}:{:02d}:{:02d}.{:03d}"
+                .format(sign, hours, minutes, seconds, ms))
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+MAIN = aeidon.documents.MAIN
+TRAN = aeidon.documents.TRAN
+
+
+class TestAnalysisAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test_clear_interval_index(self):
+        index = self.project.get_interval_index()
+        self.project.clear_interval_index()
+        assert self.project.get_interval_index() is not index
+
+    def test_clear_reading_statistics(self):
+        stats = self.project.get_reading_statistics(MAIN)
+        self.project.clear_reading_statistics()
+        assert self.project.get_reading_statistics(MAIN) is not stats
+
+    def test_get_interval_index(self):
+        index = self.project.get_interval_index()
+        subtitle = self.project.subtitles[3]
+        indices = index.get_at(subtitle.start_seconds)
+        assert indices == [3]
+
+    def test_get_interval_index__positions_changed(self):
+        index = self.project.get_interval_index()
+        subtitle = self.project.subtitles[3]
+        self.project.set_end(3, subtitle.end_seconds + 60)
+        assert self.project.get_interval_index() is index
+        assert 3 in index.get_at(subtitle.end_seconds)
+
+    def test_get_interval_index__subtitles_removed(self):
+        index = self.project.get_interval_index()
+        self.project.remove_subtitles((0,))
+        assert self.project.get_interval_index() is not index
+
+    def test_get_reading_statistics(self):
+        stats = self.project.get_reading_statistics(MAIN)
+        assert len(stats) == len(self.project.subtitles)
+        for i, subtitle in enumerate(self.project.subtitles):
+            length = self.project.get_text_length(i, MAIN)
+            assert stats.lengths[i] == length
+            assert abs(stats.durations[i] - subtitle.duration_seconds) < 0.001
+
+    def test_get_reading_statistics__cached(self):
+        stats = self.project.get_reading_statistics(MAIN)
+        assert self.project.get_reading_statistics(MAIN) is stats
+        assert self.project.get_reading_statistics(TRAN) is not stats
+
+    def test_get_reading_statistics__positions_changed(self):
+        stats = self.project.get_reading_statistics(MAIN)
+        self.project.shift_positions(None, 1.0)
+        assert self.project.get_reading_statistics(MAIN) is not stats
+        self.project.undo()
+        assert self.project.get_reading_statistics(MAIN) is not stats
+
+    def test_get_reading_statistics__texts_changed(self):
+        stats = self.project.get_reading_statistics(MAIN)
+        self.project.set_text(0, MAIN, "test")
+        new_stats = self.project.get_reading_statistics(MAIN)
+        assert new_stats is not stats
+        assert new_stats.lengths[0] == 4
@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import asyncio
 import codecs
 
 
@@ -24,6 +25,13 @@ class TestOpenAgent(aeidon.TestCase):
     def setup_method(self, method):
         self.project = self.new_project()
 
+    def test_open_async(self):
+        path = self.new_subrip_file()
+        doc = aeidon.documents.TRAN
+        coroutine = self.project.open_async(doc, path, "ascii")
+        asyncio.run(coroutine)
+        assert self.project.tran_file.path == path
+
     def test_open_main(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -38,6 +46,23 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__text(self):
+        path = self.new_subrip_file()
+        encoding, text = aeidon.encodings.probe(path, ("ascii",))
+        text = text.replace("\n\n", "\nx\n\n", 1)
+        self.project.open_main(path, encoding, text)
+        assert self.project.subtitles[0].main_text.endswith("\nx")
+
+    def test_open_main__subtitle_cache(self):
+        directory = aeidon.temp.create_directory()
+        self.project.subtitle_cache = aeidon.SubtitleCache(directory)
+        path = self.new_subrip_file()
+        self.project.open_main(path, "ascii")
+        subtitles = self.project.subtitles
+        self.project.open_main(path, "ascii")
+        assert self.project.subtitles == subtitles
+        assert self.project.subtitles is not subtitles
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
@@ -47,6 +72,21 @@ class TestOpenAgent(aeidon.TestCase):
         sort_count = self.project.open_main(path, "ascii")
         assert sort_count == 1
 
+    def test_open_main_async(self):
+        path = self.new_microdvd_file()
+        opened = []
+        self.project.connect("main-file-opened", lambda *args: opened.append(
+            asyncio.get_running_loop()))
+        async def open_all(paths):
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(self.project.open_main_async(x, "ascii")
+                                   for x in paths))
+            return loop
+        loop = asyncio.run(open_all([path] * 3))
+        assert opened == [loop] * 3
+        assert self.project.main_file.path == path
+        assert self.project.subtitles
+
     def test_open_translation__align_number(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -16,6 +16,10 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import os
+import time
+
+from unittest.mock import patch
 
 MAIN = aeidon.documents.MAIN
 TRAN = aeidon.documents.TRAN
@@ -27,6 +31,120 @@ class TestRegisterAgent(aeidon.TestCase):
         self.project = self.new_project()
         self.delegate = self.project.undo.__self__
 
+    def test_clear_reversion_stacks(self):
+        self.project.undo_memory_limit = 1
+        for i in range(3):
+            self.project.set_text(0, MAIN, str(i))
+        self.project.undo()
+        self.project.clear_reversion_stacks()
+        assert not self.project.undoables
+        assert not self.project.redoables
+        assert self.delegate._journal.size == 0
+
+    def test_cut_reversion_stacks__journal(self):
+        self.project.undo_limit = 3
+        self.project.undo_memory_limit = 1
+        for i in range(10):
+            self.project.set_text(0, MAIN, str(i))
+        journal = self.delegate._journal
+        spilled = [x for x in self.project.undoables
+                   if isinstance(x, aeidon.SpilledAction)]
+        assert len(spilled) == 2
+        # Space of trimmed actions is reclaimed.
+        assert journal.size <= 2 * sum(x.length for x in spilled)
+        assert os.path.getsize(journal.path) == journal.size
+        self.project.undo(3)
+        assert self.project.subtitles[0].main_text == "6"
+        self.project.set_text(0, MAIN, "a")
+        assert journal.size == 0
+
+    def test_cut_reversion_stacks__unpicklable(self):
+        self.project.undo_memory_limit = 1
+        self.project.register_action(aeidon.RevertableAction(
+            description="test",
+            docs=(MAIN,),
+            register=aeidon.registers.DO,
+            revert_function=lambda register: None))
+        self.project.set_text(0, MAIN, "a")
+        with patch.object(aeidon.UndoJournal, "dump",
+                          autospec=True,
+                          side_effect=aeidon.UndoJournal.dump) as dump:
+            self.project.set_text(1, MAIN, "b")
+            self.project.set_text(2, MAIN, "c")
+        # Unpicklable action is kept in memory and not tried again,
+        # newer actions are stored on disk as they age past it.
+        assert dump.call_count == 2
+        assert isinstance(self.project.undoables[1], aeidon.SpilledAction)
+        assert isinstance(self.project.undoables[2], aeidon.SpilledAction)
+        assert self.project.undoables[3].description == "test"
+        self.project.undo(3)
+        assert self.project.subtitles[0].main_text != "a"
+
+    def test_cut_reversion_stacks__memory_default(self):
+        for i in range(10):
+            self.project.set_text(0, MAIN, str(i))
+        assert self.delegate._journal is None
+
+    def test_merge_action(self):
+        self.project.undo_merge_window = 1
+        text = self.project.subtitles[0].main_text
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        self.project.set_text(0, MAIN, "abc")
+        assert len(self.project.undoables) == 1
+        assert self.project.main_changed == 1
+        self.project.undo()
+        assert self.project.subtitles[0].main_text == text
+        assert self.project.main_changed == 0
+
+    def test_merge_action__default(self):
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+
+    def test_merge_action__different_subtitles(self):
+        self.project.undo_merge_window = 1
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(1, MAIN, "a")
+        self.project.set_text(1, TRAN, "a")
+        self.project.set_start(1, 0)
+        assert len(self.project.undoables) == 4
+
+    def test_merge_action__limit(self):
+        self.project.undo_merge_limit = 2
+        self.project.undo_merge_window = 1
+        for text in ("a", "ab", "abc", "abcd", "abcde"):
+            self.project.set_text(0, MAIN, text)
+        assert len(self.project.undoables) == 3
+
+    def test_merge_action__memory_limit(self):
+        self.project.undo_memory_limit = 1
+        self.project.undo_merge_window = 1
+        text = self.project.subtitles[0].main_text
+        self.project.set_text(1, MAIN, "a")
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        self.project.set_text(0, MAIN, "abc")
+        assert len(self.project.undoables) == 2
+        self.project.undo()
+        assert self.project.subtitles[0].main_text == text
+        self.project.undo()
+        assert self.project.subtitles[1].main_text != "a"
+
+    def test_merge_action__save(self):
+        self.project.undo_merge_window = 1
+        self.project.set_text(0, MAIN, "a")
+        self.project.main_changed = 0
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+
+    def test_merge_action__window(self):
+        self.project.undo_merge_window = 0
+        self.project.set_text(0, MAIN, "a")
+        time.sleep(0.01)
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+
     def test_redo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -44,6 +162,18 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    def test_redo__spilled(self):
+        self.project.undo_memory_limit = 1
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        self.project.clear_texts((2,), MAIN)
+        self.project.undo(3)
+        assert isinstance(self.project.redoables[2], aeidon.SpilledAction)
+        self.project.redo(3)
+        assert self.project.subtitles[0].main_text == ""
+        assert self.project.subtitles[1].main_text == ""
+        assert self.project.subtitles[2].main_text == ""
+
     def test_undo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -60,3 +190,31 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[0].main_text == ""
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
+
+    def test_undo__group(self):
+        text_0 = self.project.subtitles[0].main_text
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        self.project.clear_texts((2,), MAIN)
+        register = aeidon.registers.DO
+        self.project.group_actions(register, 3, "test")
+        self.project.set_text(3, MAIN, "test")
+        self.project.undo(2)
+        assert self.project.subtitles[0].main_text == text_0
+        assert len(self.project.redoables) == 2
+        group = self.project.redoables[0]
+        assert isinstance(group, aeidon.RevertableActionGroup)
+        assert len(group.actions) == 3
+        assert group.description == "test"
+
+    def test_undo__spilled(self):
+        self.project.undo_memory_limit = 1
+        text_0 = self.project.subtitles[0].main_text
+        text_1 = self.project.subtitles[1].main_text
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        assert isinstance(self.project.undoables[1], aeidon.SpilledAction)
+        self.project.undo(2)
+        assert self.project.subtitles[0].main_text == text_0
+        assert self.project.subtitles[1].main_text == text_1
+        assert self.project.main_changed == 0
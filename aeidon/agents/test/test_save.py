@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import asyncio
 
 
 class TestSaveAgent(aeidon.TestCase):
@@ -23,6 +24,12 @@ class TestSaveAgent(aeidon.TestCase):
     def setup_method(self, method):
         self.project = self.new_project()
 
+    def test_save_async(self):
+        doc = aeidon.documents.TRAN
+        self.project.clear_texts((0,), doc)
+        asyncio.run(self.project.save_async(doc))
+        assert self.project.tran_changed == 0
+
     def test_save_main(self):
         for format in aeidon.formats:
             self.project.clear_texts((0,), aeidon.documents.MAIN)
@@ -34,6 +41,23 @@ class TestSaveAgent(aeidon.TestCase):
             self.project.save_main(file, keep_changes=True)
             assert self.project.main_changed == 0
 
+    def test_save_main_async(self):
+        saved = []
+        self.project.connect("main-file-saved", lambda *args: saved.append(
+            asyncio.get_running_loop()))
+        path = self.project.main_file.path
+        self.project.set_text(0, aeidon.documents.MAIN, "<i>x</i>")
+        file = aeidon.files.new(aeidon.formats.MICRODVD, path, "ascii")
+        asyncio.run(self.project.save_main_async(file, keep_changes=False))
+        assert self.project.subtitles[0].main_text == "<i>x</i>"
+        assert self.project.main_changed == 1
+        assert len(saved) == 1
+        asyncio.run(self.project.save_main_async(file, keep_changes=True))
+        assert self.project.subtitles[0].main_text == "{Y:i}x"
+        assert self.project.main_changed == 0
+        with open(path, "r") as f:
+            assert "{Y:i}x" in f.read()
+
     def test_save_translation(self):
         for format in aeidon.formats:
             self.project.clear_texts((0,), aeidon.documents.TRAN)
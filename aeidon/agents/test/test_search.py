@@ -37,6 +37,33 @@ class TestSearchAgent(aeidon.TestCase):
         indices = list(range(3, len(self.project.subtitles)))
         self.project.remove_subtitles(indices, register=None)
 
+    def test_find_all(self):
+        self.project.set_search_target(None, (MAIN,), wrap=False)
+        self.project.set_search_regex(r"^")
+        matches = list(self.project.find_all())
+        assert matches == [(0, MAIN, ( 0,  0)),
+                           (0, MAIN, (26, 26)),
+                           (1, MAIN, ( 0,  0)),
+                           (1, MAIN, (22, 22)),
+                           (2, MAIN, ( 0,  0)),
+                           (2, MAIN, (12, 12))]
+
+    def test_find_all__count(self):
+        self.project.set_search_string("you")
+        assert self.project.find_all(count=True) == 6
+        assert self.project.find_all((1,), (TRAN,), count=True) == 1
+        self.project.set_search_string("YOU", ignore_case=True)
+        assert self.project.find_all(count=True) == 6
+        self.project.set_search_regex(r"\by")
+        assert self.project.find_all(count=True) == 6
+
+    def test_find_all__string(self):
+        self.project.set_search_string("YOU", ignore_case=True)
+        matches = list(self.project.find_all((1, 0), (TRAN,)))
+        assert matches == [(0, TRAN, (17, 20)),
+                           (0, TRAN, (26, 29)),
+                           (1, TRAN, ( 3,  6))]
+
     def test_find_next(self):
         matches = iter(((0, MAIN, ( 0,  0)),
                         (0, MAIN, (26, 26)),
@@ -58,6 +85,30 @@ class TestSearchAgent(aeidon.TestCase):
                 assert next(matches) is StopIteration
                 break
 
+    def test_find_next__delegate_lookups(self):
+        # Make sure attribute forwarding to master
+        # is not done for each subtitle looped over.
+        def count_lookups(count):
+            self.project.subtitles[count:] = []
+            for i in range(len(self.project.subtitles), count):
+                subtitle = self.project.new_subtitle()
+                subtitle.main_text = "test"
+                self.project.subtitles.append(subtitle)
+            self.project.set_search_target(None, (MAIN,), wrap=False)
+            self.project.set_search_string("xxx")
+            lookups = []
+            orig_getattr = aeidon.Delegate.__getattr__
+            def counting_getattr(delegate, name):
+                lookups.append(name)
+                return orig_getattr(delegate, name)
+            aeidon.Delegate.__getattr__ = counting_getattr
+            try:
+                self.assert_raises(StopIteration, self.project.find_next)
+            finally:
+                aeidon.Delegate.__getattr__ = orig_getattr
+            return len(lookups)
+        assert count_lookups(10) == count_lookups(100)
+
     def test_find_previous(self):
         matches = iter(((1, MAIN, ( 3,  6)),
                         (0, MAIN, (26, 29)),
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestSnapshotAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.path = aeidon.temp.create(".snapshot")
+
+    def test_open_snapshot(self):
+        self.project.set_text(0, aeidon.documents.MAIN, "äö\nx")
+        self.project.set_text(1, aeidon.documents.TRAN, "")
+        self.project.save_snapshot(self.path)
+        project = aeidon.Project()
+        project.open_snapshot(self.path)
+        assert project.subtitles == self.project.subtitles
+        assert project.main_changed == self.project.main_changed
+        assert project.tran_changed == self.project.tran_changed
+        assert project.main_file.path == self.project.main_file.path
+        assert project.main_file.format == self.project.main_file.format
+        assert project.tran_file.newline == self.project.tran_file.newline
+        assert project.framerate == self.project.framerate
+        assert not project.undoables
+
+    def test_open_snapshot__containers(self):
+        path = self.new_temp_file(aeidon.formats.ASS)
+        self.project.open_main(path, "ascii")
+        self.project.subtitles[1].ssa.layer = 3
+        self.project.save_snapshot(self.path)
+        project = aeidon.Project()
+        project.open_snapshot(self.path)
+        for subtitle, original in zip(project.subtitles,
+                                      self.project.subtitles):
+            assert vars(subtitle.ssa) == vars(original.ssa)
+        event_fields = self.project.main_file.event_fields
+        assert project.main_file.event_fields == event_fields
+
+    def test_open_snapshot__frame(self):
+        path = self.new_microdvd_file()
+        self.project.open_main(path, "ascii")
+        self.project.save_snapshot(self.path)
+        project = aeidon.Project()
+        project.open_snapshot(self.path)
+        assert project.subtitles == self.project.subtitles
+        assert project.subtitles[0].mode == aeidon.modes.FRAME
+
+    def test_open_snapshot__parse_error(self):
+        with open(self.path, "wb") as f:
+            f.write(b"xxx")
+        project = aeidon.Project()
+        self.assert_raises(aeidon.ParseError,
+                           project.open_snapshot,
+                           self.path)
+
+    def test_save_snapshot(self):
+        self.project.save_snapshot(self.path)
+        with open(self.path, "rb") as f:
+            assert f.read().startswith(b"AEIDON-SNAPSHOT")
+
+    def test__to_time(self):
+        to_time = aeidon.agents.SnapshotAgent._to_time
+        assert to_time(0) == "00:00:00.000"
+        assert to_time(-1500) == "-00:00:01.500"
+        assert to_time(3723004) == "01:02:03.004"
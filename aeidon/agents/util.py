@@ -77,7 +77,12 @@ class UtilityAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     def get_markup(self, doc):
-        """Return `doc`'s markup instance or ``None``."""
+        """
+        Return `doc`'s markup instance or ``None``.
+
+        Markup instances are per-format singletons with their regular
+        expressions compiled once, so this is cheap to call repeatedly.
+        """
         format = self.get_format(doc)
         if format is None: return None
         return aeidon.markups.new(format)
@@ -85,16 +90,16 @@ class UtilityAgent(aeidon.Delegate):
     @aeidon.deco.export
     def get_markup_clean_func(self, doc):
         """Return the function to clean markup or ``None``."""
-        format = self.get_format(doc)
-        if format is None: return None
-        return aeidon.markups.new(format).clean
+        markup = self.get_markup(doc)
+        if markup is None: return None
+        return markup.clean
 
     @aeidon.deco.export
     def get_markup_tag_regex(self, doc):
         """Return the regular expression for a markup tag or ``None``."""
-        format = self.get_format(doc)
-        if format is None: return None
-        return aeidon.markups.new(format).tag
+        markup = self.get_markup(doc)
+        if markup is None: return None
+        return markup.tag
 
     @aeidon.deco.export
     def get_mode(self):
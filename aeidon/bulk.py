@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Opening multiple files in parallel processes."""
+
+import aeidon
+import concurrent.futures
+import itertools
+
+__all__ = ("open_main_files",)
+
+
+def open_main_files(paths, encoding=None, framerate=None, max_workers=None,
+                    return_exceptions=False):
+    """
+    Open main files at `paths` and return a list of projects.
+
+    Files are read and parsed in a pool of `max_workers` processes, which can
+    be ``None`` to use the amount of processors. Parsed subtitles are passed
+    back in the compact form of :func:`aeidon.subcache.dump` and projects of
+    `framerate` constructed in the calling process. If `return_exceptions` is
+    ``True``, exceptions are returned in place of projects for files that
+    failed to open, otherwise the first such exception is raised.
+
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    Raise :exc:`aeidon.ParseError` if parsing fails.
+    """
+    paths = list(paths)
+    if len(paths) < 2 or max_workers == 1:
+        results = [_read(x, encoding) for x in paths]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(
+                _read, paths, itertools.repeat(encoding)))
+    projects = []
+    for path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            if not return_exceptions:
+                raise result
+            projects.append(result)
+            continue
+        format, encoding, data = result
+        format = getattr(aeidon.formats, format)
+        file = aeidon.files.new(format, path, encoding)
+        subtitles = aeidon.subcache.load(file, data)
+        project = aeidon.Project(framerate)
+        project.open_main_subtitles(file, subtitles)
+        projects.append(project)
+    return projects
+
+def _read(path, encoding):
+    """
+    Read main file at `path` and return format, encoding and data.
+
+    This is run in a worker process. Exceptions are returned instead of
+    raised so that failing files do not cancel others.
+    """
+    try:
+        project = aeidon.Project()
+        project.open_main(path, encoding)
+        file = project.main_file
+        data = aeidon.subcache.dump(file, project.subtitles)
+        return file.format.name, file.encoding, data
+    except Exception as error:
+        return error
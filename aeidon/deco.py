@@ -192,6 +192,7 @@ def revertable(function):
         project.cut_reversion_stacks()
         if (project.main_changed != main_changed or
             project.tran_changed != tran_changed):
+            project.merge_action(register)
             project.emit_action_signal(register)
         return value
     return wrapper
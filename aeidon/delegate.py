@@ -19,6 +19,8 @@
 
 __all__ = ("Delegate",)
 
+_exported_names = {}
+
 
 class Delegate:
 
@@ -32,6 +34,17 @@ class Delegate:
         """Initialize a :class:`Delegate` instance."""
         object.__setattr__(self, "master", master)
 
+    @classmethod
+    def get_exported_names(cls):
+        """Return a tuple of names of methods exported to master."""
+        if cls not in _exported_names:
+            def is_exported(name):
+                value = getattr(cls, name)
+                return (callable(value) and
+                        getattr(value, "export", False) is True)
+            _exported_names[cls] = tuple(filter(is_exported, dir(cls)))
+        return _exported_names[cls]
+
     def __getattr__(self, name):
         """Return value of master attribute."""
         return getattr(self.master, name)
@@ -23,7 +23,9 @@ For functions dealing with character encodings, see also :mod:`aeidon.util`.
 
 import aeidon
 import codecs
+import json
 import locale
+import os
 import re
 
 from aeidon.i18n import _
@@ -134,6 +136,16 @@ _encodings = (
 
 CODE, NAME, DESC = range(3)
 
+# Path to a file where detected encodings are cached across sessions, or
+# None to cache them only in memory. Set before calling any detection.
+detected_cache_path = None
+
+# Caches of detected encodings by path, loaded by cache path.
+_detected = {}
+
+# Maximum amount of entries to keep in the cache of detected encodings.
+_detected_max_size = 1000
+
 # Illegal characters in encoding codes.
 _re_illegal = re.compile(r"[^a-z0-9_]")
 
@@ -165,37 +177,67 @@ def code_to_name(code):
     raise ValueError("Code {} not found"
                      .format(repr(code)))
 
-def detect(path):
+def detect(path, max_bytes=100000):
     """
     Detect the encoding of file at `path` and return code or ``None``.
 
+    At most `max_bytes` are read for detection, sampled from the start,
+    middle and end of the file. Results are cached by path, size and
+    modification time, so that detection is not repeated until file changes,
+    on disk as well if :data:`detected_cache_path` is set.
     Raise :exc:`IOError` if reading fails.
     """
     bom_encoding = detect_bom(path)
     if bom_encoding is not None:
         return bom_encoding
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = [stat.st_size, stat.st_mtime_ns]
+    detected = _get_detected()
+    if path in detected and detected[path][:2] == key:
+        return detected[path][2]
     from chardet import universaldetector
     detector = universaldetector.UniversalDetector()
-    with open(path, "rb") as f:
-        detector.reset()
-        for line in f:
-            detector.feed(line)
-            if detector.done: break
+    detector.reset()
+    for sample in _read_samples(path, max_bytes):
+        detector.feed(sample)
+        if detector.done: break
     detector.close()
     code = detector.result["encoding"]
-    if code is None: return None
-    try:
-        # chardet returns what seem to be IANA names. They need to be
-        # translated to their Python equivalents. Some of the encodings
-        # returned by chardet are not supported by Python.
-        return translate_code(code)
-    except ValueError:
-        return None
+    if code is not None:
+        try:
+            # chardet returns what seem to be IANA names. They need to be
+            # translated to their Python equivalents. Some of the encodings
+            # returned by chardet are not supported by Python.
+            code = translate_code(code)
+        except ValueError:
+            code = None
+    _set_detected(path, key + [code])
+    return code
+
+def decode(blob, code, chunk_size=65536):
+    """
+    Return bytes `blob` decoded with encoding `code`.
+
+    `blob` is decoded in chunks of `chunk_size` bytes with a strict
+    incremental decoder, so that decoding stops at the first invalid chunk.
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`LookupError` if `code` is not a valid encoding.
+    """
+    decoder = codecs.getincrementaldecoder(code)("strict")
+    parts = [decoder.decode(blob[i:i+chunk_size])
+             for i in range(0, len(blob), chunk_size)]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
 
 def detect_bom(path):
     """Return corresponding encoding if BOM found, else ``None``."""
-    with open(path, "rb") as f:
+    with aeidon.util.open_read(path, "rb") as f:
         line = f.readline()
+    return _detect_bom(line)
+
+def _detect_bom(line):
+    """Return corresponding encoding if `line` starts with BOM or ``None``."""
     if (line.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
@@ -213,6 +255,14 @@ def detect_bom(path):
         return "utf_16_le"
     return None
 
+def _get_detected():
+    """Return a dictionary of cached detected encodings by path."""
+    # Load lazily for the current cache path, which can be set
+    # or changed after detection has already been used.
+    if not detected_cache_path in _detected:
+        _detected[detected_cache_path] = _load_detected(detected_cache_path)
+    return _detected[detected_cache_path]
+
 @aeidon.deco.once
 def get_locale_code():
     """Return code of the locale encoding or ``None``."""
@@ -245,6 +295,39 @@ def is_valid_code(code):
     except LookupError:
         return False
 
+def probe(path, codes):
+    """
+    Return the first of `codes` that decodes file at `path` and decoded text.
+
+    The file is read once and `codes` are tried in order on its bytes. If the
+    file starts with a byte order mark, the corresponding encoding is used
+    instead of `codes`. `codes` can contain "auto" to try the encoding
+    detected by :func:`detect`. Newlines in text are not translated.
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`UnicodeError` if none of `codes` decodes the file.
+    """
+    with aeidon.util.open_read(path, "rb") as f:
+        blob = f.read()
+    bom_code = _detect_bom(blob)
+    if bom_code is not None:
+        codes = [bom_code]
+    for code in codes:
+        if code == "auto":
+            code = detect(path)
+            if code is None: continue
+        with aeidon.util.silent(LookupError, UnicodeError):
+            return code, decode(blob, code)
+    raise UnicodeError("Failed to decode file {} with {}"
+                       .format(repr(path), repr(tuple(codes))))
+
+def _load_detected(path):
+    """Return a dictionary of detected encodings read from `path`."""
+    if path is None: return {}
+    with aeidon.util.silent(Exception):
+        with open(path, "r", encoding="utf_8") as f:
+            return dict(json.load(f))
+    return {}
+
 def name_to_code(name):
     """Convert encoding `name` to code."""
     for item in _encodings:
@@ -253,6 +336,49 @@ def name_to_code(name):
     raise ValueError("Name {} not found"
                      .format(repr(name)))
 
+def _read_samples(path, max_bytes):
+    """
+    Return a list of byte samples of file at `path` for detection.
+
+    If the file is larger than `max_bytes`, return three samples from the
+    start, middle and end of the file, the latter two starting at a line.
+    Samples of UTF-16 text start at an even offset to keep characters whole.
+    """
+    with aeidon.util.open_read(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        if size <= max_bytes:
+            return [f.read()]
+        length = max_bytes // 3
+        samples = [f.read(length)]
+        for start in ((size - length) // 2, size - length):
+            f.seek(start)
+            sample = f.read(length)
+            # Skip a possibly partial character at the start.
+            i = sample.find(b"\n") + 1
+            if sample.count(0) > len(sample) // 4 and (start + i) % 2:
+                # Likely UTF-16 without BOM, newline is two bytes,
+                # either "0A 00" or "00 0A" at an even offset.
+                i += 1
+            samples.append(sample[i:])
+        return samples
+
+def _set_detected(path, value):
+    """Save `value` of detected encoding of `path` to cache on disk."""
+    detected = _get_detected()
+    detected.pop(path, None)
+    detected[path] = value
+    while len(detected) > _detected_max_size:
+        detected.pop(next(iter(detected)))
+    if detected_cache_path is None: return
+    with aeidon.util.silent(Exception):
+        aeidon.util.makedirs(os.path.dirname(detected_cache_path))
+        with aeidon.util.atomic_open(detected_cache_path,
+                                     "w",
+                                     encoding="utf_8") as f:
+
+            json.dump(list(detected.items()), f)
+
 def translate_code(code):
     """Return normalized encoding `code`."""
     code = _re_illegal.sub("_", code.lower())
@@ -19,8 +19,9 @@
 
 import aeidon
 import codecs
+import io
+import itertools
 import os
-import re
 
 __all__ = ("SubtitleFile",)
 
@@ -55,6 +56,7 @@ class SubtitleFile:
 
         self.newline = newline or aeidon.util.get_default_newline()
         self.path = os.path.abspath(path)
+        self._text = None
 
     def copy_from(self, other):
         """Copy generic properties from `other`."""
@@ -75,49 +77,158 @@ class SubtitleFile:
         """
         raise NotImplementedError
 
-    def _read_lines(self):
+    def _iter_chunks(self, size=1048576):
         """
-        Read file to a list of lines.
+        Read file and yield decoded chunks of text.
 
-        All newlines are stripped.
-        All blank lines from beginning and end are removed.
+        Newlines are translated to ``"\n"`` and :attr:`newline` is set from
+        the newlines found after yielding the last chunk.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
-        Return a list of lines read.
         """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
-        if newline is not None:
-            self.newline = newline
+        text, self._text = self._text, None
+        if text is not None:
+            decoder = io.IncrementalNewlineDecoder(None, translate=True)
+            chunks = iter([decoder.decode(text, final=True)])
+        else:
+            decoder = codecs.getincrementaldecoder(self.encoding)()
+            decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+            chunks = self._iter_decoded(decoder, size)
         if self.encoding == "utf_8":
+            chunks = filter(None, chunks)
+            chunk = next(chunks, "")
             bom = str(codecs.BOM_UTF8, "utf_8")
-            if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
+            if chunk.startswith(bom):
+                # If a UTF-8 BOM (a.k.a. signature) is found, switch to
                 # UTF-8-SIG encoding, which automatically strips the BOM when
                 # reading and adds it when writing.
                 self.encoding = "utf_8_sig"
-                return SubtitleFile._read_lines(self)
+                chunk = chunk[len(bom):]
+            yield chunk
+        yield from chunks
+        newline = aeidon.util.get_newline(decoder.newlines)
+        if newline is not None:
+            self.newline = newline
+
+    def _iter_decoded(self, decoder, size):
+        """Read file in chunks of `size` bytes and yield decoded text."""
+        with aeidon.util.open_read(self.path, "rb") as f:
+            while True:
+                blob = f.read(size)
+                yield decoder.decode(blob, final=not blob)
+                if not blob: break
+
+    def _iter_lines(self):
+        """
+        Read file and yield lines.
+
+        All newlines are stripped.
+        All blank lines from beginning and end are removed.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        lines = self._trim_lines(self._split_lines(self._iter_chunks()))
+        first = next(lines, None)
+        if first is None: return
         if self.encoding.startswith("utf_16"):
             # Python automatically strips the UTF-16 BOM when reading, but only
             # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
             # kept at the beginning of the first line. It is read correctly, so
             # it should FE FF for both BE and LE.
             bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
-            if lines and lines[0].startswith(bom):
+            if first.startswith(bom):
                 self.has_utf_16_bom = True
-                lines[0] = lines[0].replace(bom, "")
-            # Handle erroneous (?) UTF-16 encoded subtitles that use
-            # NULL-character filled linebreaks '\x00\r\x00\n', which
-            # readlines interprets as two separate linebreaks.
-            if not any(lines[i] for i in range(1, len(lines), 2)):
-                lines = [lines[i] for i in range(0, len(lines), 2)]
-        return lines
+                first = first.replace(bom, "")
+            yield from self._join_utf_16_lines(itertools.chain((first,), lines))
+            return
+        yield first
+        yield from lines
+
+    @staticmethod
+    def _join_utf_16_lines(lines):
+        """
+        Yield `lines` with erroneous blank lines removed.
+
+        Handle erroneous (?) UTF-16 encoded subtitles that use
+        NULL-character filled linebreaks '\x00\r\x00\n', which are
+        interpreted as two separate linebreaks. Only even lines are
+        buffered until a non-blank odd line shows this is not the case.
+        """
+        evens = []
+        lines = iter(lines)
+        for i, line in enumerate(lines):
+            if i % 2 == 0:
+                evens.append(line)
+                continue
+            if not line: continue
+            for even in evens[:-1]:
+                yield even
+                yield ""
+            yield evens[-1]
+            yield line
+            yield from lines
+            return
+        yield from evens
+
+    def _read_lines(self):
+        """
+        Read file to a list of lines.
+
+        Lines are processed as by :meth:`_iter_lines`.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Return a list of lines read.
+        """
+        return list(self._iter_lines())
+
+    def _read_text(self):
+        """
+        Read file to a string of lines separated by ``"\n"``.
+
+        Lines are processed as by :meth:`_read_lines`.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return "\n".join(self._read_lines())
+
+    @staticmethod
+    def _split_lines(chunks):
+        """Yield lines from `chunks` of text separated by ``"\n"``."""
+        partial = ""
+        for chunk in chunks:
+            lines = (partial + chunk).split("\n")
+            partial = lines.pop()
+            yield from lines
+        yield partial
+
+    @staticmethod
+    def _trim_lines(lines):
+        """Yield `lines` with blank lines from beginning and end removed."""
+        lines = iter(lines)
+        for line in lines:
+            if line and not line.isspace():
+                yield line
+                break
+        blanks = []
+        for line in lines:
+            if not line or line.isspace():
+                # Hold blank lines until a non-blank line follows,
+                # trailing blank lines are never yielded.
+                blanks.append(line)
+                continue
+            if blanks:
+                yield from blanks
+                blanks = []
+            yield line
+
+    def set_text(self, text):
+        """
+        Set text of file already decoded with :attr:`encoding`.
+
+        The next :meth:`read` uses `text` instead of reading the file again.
+        Newlines in `text` should be untranslated, as in the file.
+        """
+        self._text = text
 
     def write(self, subtitles, doc):
         """
@@ -129,7 +240,8 @@ class SubtitleFile:
         with aeidon.util.atomic_open(self.path,
                                      mode="w",
                                      encoding=self.encoding,
-                                     newline=self.newline.value) as f:
+                                     newline=self.newline.value,
+                                     compress=True) as f:
 
             # UTF-8-SIG automatically adds the UTF-8 signature BOM. Likewise,
             # UTF-16 automatically adds the system default BOM, but
@@ -41,15 +41,27 @@ __all__ = ["SubStationAlpha",
            "TMPlayer",
            "WebVTT"]
 
+# Classes by format, lazily filled from __all__ upon first lookup.
+_classes = {}
+
 def add(cls):
     """Add a new :class:`aeidon.SubtitleFile` class."""
     globals()[cls.__name__] = cls
     __all__.append(cls.__name__)
+    _classes.clear()
+
+def _get_class(format):
+    """Return the first class in :attr:`__all__` for `format`."""
+    if not _classes:
+        for cls in map(eval, __all__):
+            _classes.setdefault(cls.format, cls)
+    try:
+        return _classes[format]
+    except KeyError:
+        raise ValueError("Format {} not found"
+                         .format(repr(format)))
 
 def new(format, path, encoding, newline=None):
     """Return a new :class:`aeidon.SubtitleFile` instance given `format`."""
-    for cls in map(eval, __all__):
-        if cls.format == format:
-            return cls(path, encoding, newline)
-    raise ValueError("Format {} not found"
-                     .format(repr(format)))
+    cls = _get_class(format)
+    return cls(path, encoding, newline)
@@ -39,16 +39,16 @@ class AdvSubStationAlpha(aeidon.files.SubStationAlpha):
             "Layer", "Start", "End", "Style", "Name",
             "MarginL", "MarginR", "MarginV", "Effect", "Text")
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save `value` of field as a subtitle attribute."""
-        if field_name == "Layer":
-            return setattr(subtitle.ssa, "layer", int(value))
-        decode = aeidon.files.SubStationAlpha._decode_field
-        return decode(self, field_name, value, subtitle)
-
     def _encode_field(self, field_name, subtitle, doc):
         """Return value of field as string to be written to file."""
         if field_name == "Layer":
             return str(subtitle.ssa.layer)
         encode = aeidon.files.SubStationAlpha._encode_field
         return encode(self, field_name, subtitle, doc)
+
+    def _get_field_decoder(self, field_name):
+        """Return container, attribute name and function to decode field."""
+        if field_name == "Layer":
+            return "ssa", "layer", int
+        get = aeidon.files.SubStationAlpha._get_field_decoder
+        return get(self, field_name)
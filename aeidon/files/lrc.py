@@ -33,7 +33,7 @@ class LRC(aeidon.SubtitleFile):
 
     format = aeidon.formats.LRC
     mode = aeidon.modes.TIME
-    _re_line = re.compile("^\[(-?\d\d:\d\d.\d\d)\](.*)$")
+    _re_line = re.compile(r"^\[(-?\d\d:\d\d.\d\d)\](.*)$", re.MULTILINE)
 
     def read(self):
         """
@@ -42,22 +42,20 @@ class LRC(aeidon.SubtitleFile):
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        self.header = ""
+        text = self._read_text()
         subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
-            match = self._re_line.match(line)
-            if match is None and len(subtitles) == 1:
-                # Read line into file header.
-                if self.header:
-                    self.header += "\n"
-                self.header += line
-            elif match is not None:
-                subtitle = self._get_subtitle()
-                normalize = subtitle.calc.normalize_time
-                subtitle.start_time = normalize(match.group(1))
-                subtitles[-1].end_time = subtitle.start_time
-                subtitle.main_text = match.group(2) or ""
-                subtitles.append(subtitle)
+        for match in self._re_line.finditer(text):
+            if len(subtitles) == 1:
+                # Read lines before the first subtitle into file header.
+                self.header = text[:max(0, match.start() - 1)]
+            subtitle = self._get_subtitle()
+            normalize = subtitle.calc.normalize_time
+            subtitle.start_time = normalize(match.group(1))
+            subtitles[-1].end_time = subtitle.start_time
+            subtitle.main_text = match.group(2) or ""
+            subtitles.append(subtitle)
+        if len(subtitles) == 1:
+            self.header = text
         subtitles[-1].duration_seconds = 5
         return subtitles[1:]
 
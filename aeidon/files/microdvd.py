@@ -29,7 +29,8 @@ class MicroDVD(aeidon.SubtitleFile):
 
     format = aeidon.formats.MICRODVD
     mode = aeidon.modes.FRAME
-    _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
+    _re_line = re.compile(r"^(?:\{(-?\d+)\}\{(-?\d+)\}(.*)|(\{DEFAULT\}.*))$",
+                          re.MULTILINE)
 
     def read(self):
         """
@@ -39,16 +40,16 @@ class MicroDVD(aeidon.SubtitleFile):
         Raise :exc:`UnicodeError` if decoding fails.
         """
         subtitles = []
-        for line in self._read_lines():
-            match = self._re_line.match(line)
-            if match is not None:
-                subtitle = self._get_subtitle()
-                subtitle.start_frame = int(match.group(1))
-                subtitle.end_frame = int(match.group(2))
-                subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
-            elif line.startswith("{DEFAULT}"):
-                self.header = line
+        for match in self._re_line.finditer(self._read_text()):
+            start, end, text, header = match.groups()
+            if header is not None:
+                self.header = header
+                continue
+            subtitle = self._get_subtitle()
+            subtitle.start_frame = int(start)
+            subtitle.end_frame = int(end)
+            subtitle.main_text = text.replace("|", "\n")
+            subtitles.append(subtitle)
         return subtitles
 
     def write_to_file(self, subtitles, doc, f):
@@ -29,7 +29,7 @@ class MPL2(aeidon.SubtitleFile):
 
     format = aeidon.formats.MPL2
     mode = aeidon.modes.TIME
-    _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*?)$")
+    _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*)$", re.MULTILINE)
 
     def read(self):
         """
@@ -39,13 +39,12 @@ class MPL2(aeidon.SubtitleFile):
         Raise :exc:`UnicodeError` if decoding fails.
         """
         subtitles = []
-        for line in self._read_lines():
-            match = self._re_line.match(line)
-            if match is None: continue
+        for match in self._re_line.finditer(self._read_text()):
+            start, end, text = match.groups()
             subtitle = self._get_subtitle()
-            subtitle.start_seconds = float(match.group(1)) / 10
-            subtitle.end_seconds = float(match.group(2)) / 10
-            subtitle.main_text = match.group(3).replace("|", "\n")
+            subtitle.start_seconds = float(start) / 10
+            subtitle.end_seconds = float(end) / 10
+            subtitle.main_text = text.replace("|", "\n")
             subtitles.append(subtitle)
         return subtitles
 
@@ -18,6 +18,7 @@
 """Sub Station Alpha file."""
 
 import aeidon
+import functools
 import re
 
 __all__ = ("SubStationAlpha",)
@@ -51,27 +52,9 @@ class SubStationAlpha(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.event_fields = tuple(other.event_fields)
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save string `value` from file as a subtitle attribute."""
-        if field_name == "Marked":
-            value = int(value.split("=")[-1])
-            return setattr(subtitle.ssa, "marked", value)
-        if field_name == "Start":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "start_time", value)
-        if field_name == "End":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "end_time", value)
-        if field_name == "Text":
-            value = value.replace("\\n", "\n")
-            value = value.replace("\\N", "\n")
-            return setattr(subtitle, "main_text", value)
-        if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            return setattr(subtitle.ssa, name, int(value))
-        # Set plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        setattr(subtitle.ssa, name, value)
+    def _decode_text(self, text):
+        """Return `text` with newlines decoded."""
+        return text.replace("\\n", "\n").replace("\\N", "\n")
 
     def _encode_field(self, field_name, subtitle, doc):
         """Return value of field as string to be written to file."""
@@ -93,6 +76,29 @@ class SubStationAlpha(aeidon.SubtitleFile):
         name = aeidon.util.title_to_lower_case(field_name)
         return getattr(subtitle.ssa, name)
 
+    def _get_field_decoder(self, field_name):
+        """
+        Return container, attribute name and function to decode field.
+
+        Container is ``None`` for attributes of subtitles and ``"ssa"`` for
+        attributes of the ``ssa`` container. The function should be called with
+        the string value of field from file.
+        """
+        if field_name == "Marked":
+            return "ssa", "marked", lambda x: int(x.split("=")[-1])
+        if field_name in ("Start", "End"):
+            name = "{}_time".format(field_name.lower())
+            sub = functools.partial(self._re_file_time.sub, r"\1\060\2\060")
+            return None, name, sub
+        if field_name == "Text":
+            return None, "main_text", self._decode_text
+        if field_name in ("MarginL", "MarginR", "MarginV"):
+            name = aeidon.util.title_to_lower_case(field_name)
+            return "ssa", name, int
+        # Plain string container attribute value.
+        name = aeidon.util.title_to_lower_case(field_name)
+        return "ssa", name, str
+
     def read(self):
         """
         Read file and return subtitles.
@@ -107,26 +113,44 @@ class SubStationAlpha(aeidon.SubtitleFile):
             if not line.startswith("Format:"): continue
             line = line.replace("Format:", "").strip()
             fields = self._re_separator.split(line)
-            indices = dict((x, fields.index(x)) for x in fields)
             max_split = len(fields) - 1
+        # Decode fields of each column with precompiled functions,
+        # setting container attributes together in bulk.
+        decoders = {}
+        for index, field in enumerate(fields):
+            container, name, decode = self._get_field_decoder(field)
+            decoders.setdefault(container, {})[name] = (index, decode)
+        subtitle_decoders = tuple(
+            (name, index, decode) for name, (index, decode)
+            in decoders.pop(None, {}).items())
+        ssa_decoders = tuple(
+            (name, index, decode) for name, (index, decode)
+            in decoders.pop("ssa", {}).items())
+        split = self._re_separator.split
+        new_subtitle = self._get_subtitle
+        new_ssa = aeidon.containers.SubStationAlpha
         for line in lines:
             if not line.startswith("Dialogue:"): continue
-            line = line.replace("Dialogue:", "").lstrip()
-            values = self._re_separator.split(line, max_split)
-            subtitle = self._get_subtitle()
-            for name, index in indices.items():
-                self._decode_field(name, values[index], subtitle)
+            values = split(line[9:].lstrip(), max_split)
+            subtitle = new_subtitle()
+            for name, index, decode in subtitle_decoders:
+                setattr(subtitle, name, decode(values[index]))
+            ssa = new_ssa()
+            ssa.__dict__.update((name, decode(values[index]))
+                                for name, index, decode in ssa_decoders)
+            subtitle.ssa = ssa
             subtitles.append(subtitle)
         self.event_fields = tuple(fields)
         return subtitles
 
     def _read_header(self, lines):
         """Read header and remove its lines."""
-        self.header = ""
-        while not lines[0].startswith("[Events]"):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.strip()
+        for i, line in enumerate(lines):
+            if line.startswith("[Events]"): break
+        else: # No events section.
+            raise ValueError("[Events] section not found")
+        self.header = "\n".join(lines[:i]).strip()
+        del lines[:i]
 
     def write_to_file(self, subtitles, doc, f):
         """
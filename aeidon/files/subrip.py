@@ -68,7 +68,7 @@ class SubRip(aeidon.SubtitleFile):
     def _read_lines(self):
         """Read file to a unicoded list of lines."""
         lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
+        for line in self._iter_lines():
             lines.append(line)
             match = self._re_time_line.match(line)
             if match is None: continue
@@ -29,8 +29,12 @@ class SubViewer2(aeidon.SubtitleFile):
 
     format = aeidon.formats.SUBVIEWER2
     mode = aeidon.modes.TIME
-    _re_time_line = re.compile((r"^(-?\d\d:\d\d:\d\d.\d\d)"
-                                r",(-?\d\d:\d\d:\d\d.\d\d)\s*$"))
+    _re_header = re.compile(r"(?:\[.*(?:\n|$))*")
+
+    # Match a time line and capture the line after it as text.
+    _re_subtitle = re.compile((r"^(-?\d\d:\d\d:\d\d.\d\d)"
+                               r",(-?\d\d:\d\d:\d\d.\d\d)[^\S\n]*$"
+                               r"(?=(?:\n(.*))?)"), re.MULTILINE)
 
     def read(self):
         """
@@ -39,21 +43,16 @@ class SubViewer2(aeidon.SubtitleFile):
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        self.header = ""
         subtitles = []
-        lines = self._read_lines()
-        while lines[0].startswith("["):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.lstrip()
-        for i, line in enumerate(lines + [""]):
-            match = self._re_time_line.match(line)
-            if match is None: continue
+        text = self._read_text()
+        header = self._re_header.match(text).group(0)
+        self.header = header.rstrip("\n").lstrip()
+        for match in self._re_subtitle.finditer(text, len(header)):
+            start, end, line = match.groups()
             subtitle = self._get_subtitle()
-            subtitle.start_time = match.group(1) + "0"
-            subtitle.end_time = match.group(2) + "0"
-            text = lines[i+1].replace("[br]", "\n")
-            subtitle.main_text = text
+            subtitle.start_time = start + "0"
+            subtitle.end_time = end + "0"
+            subtitle.main_text = (line or "").replace("[br]", "\n")
             subtitles.append(subtitle)
         return subtitles
 
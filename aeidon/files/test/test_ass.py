@@ -31,6 +31,31 @@ class TestSubStationAlpha(aeidon.TestCase):
         assert self.file.read()
         assert self.file.header
 
+    def test_read__fields(self):
+        with open(self.file.path, "a", encoding="ascii") as f:
+            f.write("\nDialogue: 2,0:00:01.00,0:00:02.50,Alt,Bob,"
+                    "0010,0000,0020,,Dialogue: a, b\\Nc")
+        subtitle = self.file.read()[-1]
+        assert subtitle.start_time == "00:00:01.000"
+        assert subtitle.end_time == "00:00:02.500"
+        assert subtitle.main_text == "Dialogue: a, b\nc"
+        assert subtitle.ssa.layer == 2
+        assert subtitle.ssa.style == "Alt"
+        assert subtitle.ssa.name == "Bob"
+        assert subtitle.ssa.margin_l == 10
+        assert subtitle.ssa.margin_v == 20
+        assert subtitle.ssa.effect == ""
+
+    def test_read__fonts(self):
+        # Embedded fonts can make headers very long.
+        text = self.get_sample_text(self.format)
+        fonts = "\n".join(["[Fonts]", "fontname: a_0.ttf"] + ["M" * 80] * 100000)
+        text = text.replace("[Events]", "{}\n\n[Events]".format(fonts))
+        with open(self.file.path, "w", encoding="ascii") as f:
+            f.write(text)
+        assert self.file.read()
+        assert self.file.header.endswith("M" * 80)
+
     def test_write(self):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
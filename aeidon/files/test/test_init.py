@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestModule(aeidon.TestCase):
+
+    def test_new(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            file = aeidon.files.new(format, path, "ascii")
+            assert file.format == format
+            assert aeidon.files.new(format, path, "ascii") is not file
+
+    def test_new__value_error(self):
+        self.assert_raises(ValueError, aeidon.files.new, None, "", "ascii")
+
+    def test_read__many(self):
+        # Line-based formats are parsed with one regular expression
+        # over the whole text, which should match all subtitles.
+        for format in (aeidon.formats.LRC,
+                       aeidon.formats.MICRODVD,
+                       aeidon.formats.MPL2,
+                       aeidon.formats.SUBVIEWER2,
+                       aeidon.formats.TMPLAYER):
+            path = self.new_temp_file(format)
+            file = aeidon.files.new(format, path, "ascii")
+            subtitles = file.read() * 10
+            file.write(subtitles, aeidon.documents.MAIN)
+            assert len(file.read()) == len(subtitles)
@@ -29,8 +29,7 @@ class TMPlayer(aeidon.SubtitleFile):
 
     format = aeidon.formats.TMPLAYER
     mode = aeidon.modes.TIME
-    _re_one_digit_hour = re.compile(r"^-?\d:\d\d:\d\d:")
-    _re_two_digit_hour = re.compile(r"^-?\d\d:\d\d:\d\d:")
+    _re_line = re.compile(r"^(-?)(\d?)(\d:\d\d:\d\d):(.*)$", re.MULTILINE)
 
     def __init__(self, path, encoding, newline=None):
         """Initialize an :class:`TMPlayer` instance."""
@@ -51,30 +50,15 @@ class TMPlayer(aeidon.SubtitleFile):
         Raise :exc:`UnicodeError` if decoding fails.
         """
         subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
-            match = self._re_one_digit_hour.search(line)
-            if match is not None:
-                i = match.span()[1]
-                subtitle = self._get_subtitle()
-                sign = ("-" if line.startswith("-") else "")
-                time = line[:i-1] + ".000"
-                if time.startswith("-"):
-                    time = time[1:]
-                time = sign + "0" + time
-                subtitle.start_time = time
-                subtitles[-1].end_time = time
-                subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
-                self.two_digit_hour = False
-            match = self._re_two_digit_hour.search(line)
-            if match is not None:
-                i = match.span()[1]
-                subtitle = self._get_subtitle()
-                subtitle.start_time = line[:i-1] + ".000"
-                subtitles[-1].end_time = subtitle.start_time
-                subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
-                self.two_digit_hour = True
+        for match in self._re_line.finditer(self._read_text()):
+            sign, tens, rest, text = match.groups()
+            # Hours can be written with one or two digits.
+            self.two_digit_hour = bool(tens)
+            subtitle = self._get_subtitle()
+            subtitle.start_time = "{}{}{}.000".format(sign, tens or "0", rest)
+            subtitles[-1].end_time = subtitle.start_time
+            subtitle.main_text = text.replace("|", "\n")
+            subtitles.append(subtitle)
         subtitles[-1].duration_seconds = 5
         return subtitles[1:]
 
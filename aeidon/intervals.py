@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Index of time ranges of subtitles for fast position queries."""
+
+import array
+import bisect
+
+__all__ = ("IntervalIndex",)
+
+
+class IntervalIndex:
+
+    """
+    Index of time ranges of subtitles for fast position queries.
+
+    :ivar ends: Array of end positions in seconds in order of start
+    :ivar order: Array of subtitle indices in order of start or ``None``
+
+       ``None`` if subtitles are sorted by start, as they normally are,
+       in which case positions in arrays equal subtitle indices.
+
+    :ivar starts: Array of start positions in seconds in order of start
+
+    Start positions are bisected and end positions kept in a segment tree of
+    minimum and maximum values of subranges, so that queries take O(log n)
+    time plus time proportional to the amount of subtitles found. Ranges
+    are inclusive at both ends.
+    """
+
+    __slots__ = ("ends", "order", "starts", "_max", "_min", "_size")
+
+    def __init__(self, subtitles):
+        """Initialize an :class:`IntervalIndex` instance."""
+        starts = [x.start_seconds for x in subtitles]
+        ends = [x.end_seconds for x in subtitles]
+        self.order = None
+        if any(map(float.__gt__, starts, starts[1:])):
+            order = sorted(range(len(starts)), key=starts.__getitem__)
+            starts = [starts[i] for i in order]
+            ends = [ends[i] for i in order]
+            self.order = array.array("l", order)
+        self.starts = array.array("d", starts)
+        self.ends = array.array("d", ends)
+        self._size = 1
+        while self._size < len(ends):
+            self._size *= 2
+        self._max = array.array("d", [-float("inf")]) * (2 * self._size)
+        self._min = array.array("d", [float("inf")]) * (2 * self._size)
+        self._max[self._size:self._size+len(ends)] = self.ends
+        self._min[self._size:self._size+len(ends)] = self.ends
+        for node in reversed(range(1, self._size)):
+            self._update_node(node)
+
+    def _find_overlapping(self, start, end):
+        """Return a list of positions in arrays between `start` and `end`."""
+        count = bisect.bisect_right(self.starts, end)
+        found = []
+        # Traverse segment tree depth-first, left to right,
+        # skipping subranges that end before start.
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= count or self._max[node] < start: continue
+            if node >= self._size:
+                found.append(lo)
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        return found
+
+    def get_at(self, pos):
+        """Return a list of indices of subtitles shown at `pos`."""
+        return self.get_overlapping(pos, pos)
+
+    def get_next(self, pos):
+        """Return index of the first subtitle starting after `pos` or None."""
+        i = bisect.bisect_right(self.starts, pos)
+        if i == len(self.starts): return None
+        return self._to_index(i)
+
+    def get_next_boundary(self, pos):
+        """
+        Return the first start or end position after `pos` or ``None``.
+
+        The set of subtitles shown, as returned by :meth:`get_at`, can only
+        change at the returned position, i.e. it is the same for all positions
+        after `pos` and before the returned position.
+        """
+        # Subtitles starting after pos end after the next start,
+        # so only ends of subtitles shown at pos need to be checked.
+        i = bisect.bisect_right(self.starts, pos)
+        bounds = [self.ends[j] for j in self._find_overlapping(pos, pos)]
+        bounds = [x for x in bounds if x > pos]
+        if i < len(self.starts):
+            bounds.append(self.starts[i])
+        return min(bounds, default=None)
+
+    def get_overlapping(self, start, end):
+        """Return a list of indices of subtitles between `start` and `end`."""
+        found = self._find_overlapping(start, end)
+        if self.order is None: return found
+        return sorted(self.order[i] for i in found)
+
+    def get_previous(self, pos):
+        """Return index of the last subtitle ending before `pos` or None."""
+        if not self._min[1] < pos: return None
+        node = 1
+        # Descend to the rightmost leaf ending before pos.
+        while node < self._size:
+            node = 2 * node + 1
+            if not self._min[node] < pos:
+                node = node - 1
+        return self._to_index(node - self._size)
+
+    def _to_index(self, i):
+        """Return subtitle index of position `i` in arrays."""
+        return (i if self.order is None else self.order[i])
+
+    def update(self, index, start, end):
+        """
+        Update positions of subtitle at `index` if order is unchanged.
+
+        Return ``False`` if positions cannot be updated in place, in which
+        case the whole index needs to be rebuilt.
+        """
+        if self.order is not None: return False
+        if index > 0 and start < self.starts[index-1]: return False
+        if (index < len(self.starts) - 1 and
+            start > self.starts[index+1]): return False
+        self.starts[index] = start
+        self.ends[index] = end
+        node = self._size + index
+        self._max[node] = self._min[node] = end
+        while node > 1:
+            node //= 2
+            self._update_node(node)
+        return True
+
+    def _update_node(self, node):
+        """Update minimum and maximum of `node` from its children."""
+        left, right = 2 * node, 2 * node + 1
+        self._max[node] = max(self._max[left], self._max[right])
+        self._min[node] = min(self._min[left], self._min[right])
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Journal of revertable actions stored on disk."""
+
+import aeidon
+import inspect
+import io
+import os
+import pickle
+
+__all__ = ("SpilledAction", "UndoJournal",)
+
+
+class SpilledAction:
+
+    """
+    Placeholder of an action stored in :class:`UndoJournal`.
+
+    :ivar description: Short one line description
+    :ivar length: Length of the stored action in bytes
+    :ivar offset: Position of the stored action in the journal file
+    """
+
+    def __init__(self, description, offset, length):
+        """Initialize a :class:`SpilledAction` instance."""
+        self.description = description
+        self.length = length
+        self.offset = offset
+
+
+class UndoJournal:
+
+    """
+    Journal of revertable actions stored on disk.
+
+    :ivar garbage: Total length in bytes of actions no longer needed
+    :ivar master: :class:`aeidon.Project` instance of actions
+    :ivar path: Path to the journal file or ``None`` if not yet created
+    :ivar size: Total length in bytes of all actions in the journal file
+
+    Actions are pickled and appended to a temporary file, replaced in undo
+    and redo stacks by :class:`SpilledAction` placeholders. Bound methods
+    of `master`, enumeration items and calculators are stored by name and
+    resolved again when the action is loaded. Space of actions no longer
+    needed, marked with :meth:`discard`, is reclaimed by :meth:`compact`.
+    """
+
+    def __init__(self, master):
+        """Initialize an :class:`UndoJournal` instance."""
+        self.garbage = 0
+        self.master = master
+        self.path = None
+        self.size = 0
+        self._enumerations = {id(getattr(aeidon, x)): x
+                              for x in aeidon.enums.__all__}
+
+    def clear(self):
+        """Remove all stored actions."""
+        self.garbage = 0
+        self.size = 0
+        if self.path is None: return
+        with aeidon.util.silent(OSError):
+            open(self.path, "wb").close()
+
+    def compact(self, spilled):
+        """
+        Rewrite journal file with only the actions of `spilled`.
+
+        `spilled` should contain all placeholders still in use, their offsets
+        are updated to match the rewritten file.
+        Raise :exc:`IOError` if reading or writing fails.
+        """
+        spilled = sorted(spilled, key=lambda x: x.offset)
+        path = aeidon.temp.create(".journal")
+        offsets = []
+        with open(self.path, "rb") as fin, open(path, "wb") as fout:
+            for item in spilled:
+                fin.seek(item.offset)
+                offsets.append(fout.tell())
+                fout.write(fin.read(item.length))
+        # Update placeholders only once the new file is complete,
+        # so that the old file remains valid if writing fails.
+        for item, offset in zip(spilled, offsets):
+            item.offset = offset
+        aeidon.temp.remove(self.path)
+        self.garbage = 0
+        self.path = path
+        self.size = sum(x.length for x in spilled)
+
+    def discard(self, spilled):
+        """Mark the action stored as `spilled` as no longer needed."""
+        self.garbage += spilled.length
+
+    def dump(self, action):
+        """Store `action` and return a :class:`SpilledAction`."""
+        f = io.BytesIO()
+        pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self._persistent_id
+        pickler.dump(action)
+        if self.path is None:
+            self.path = aeidon.temp.create(".journal")
+        with open(self.path, "ab") as journal:
+            offset = journal.seek(0, os.SEEK_END)
+            journal.write(f.getvalue())
+        self.size = offset + len(f.getvalue())
+        return SpilledAction(action.description, offset, len(f.getvalue()))
+
+    def load(self, spilled):
+        """Return the action stored as `spilled`."""
+        with open(self.path, "rb") as journal:
+            journal.seek(spilled.offset)
+            f = io.BytesIO(journal.read(spilled.length))
+        unpickler = pickle.Unpickler(f)
+        unpickler.persistent_load = self._persistent_load
+        action = unpickler.load()
+        # Description might have been changed while spilled.
+        action.description = spilled.description
+        return action
+
+    def _persistent_id(self, obj):
+        """Return a reference to `obj` or ``None`` to pickle it."""
+        if isinstance(obj, aeidon.EnumerationItem):
+            if id(obj.parent) in self._enumerations:
+                return ("enum", self._enumerations[id(obj.parent)], obj.name)
+        if isinstance(obj, aeidon.Calculator):
+            return ("calc", obj._framerate)
+        if (inspect.ismethod(obj) and
+            isinstance(obj.__self__, aeidon.Delegate)):
+            return ("method", obj.__name__)
+        return None
+
+    def _persistent_load(self, pid):
+        """Return object referenced by `pid`."""
+        if pid[0] == "enum":
+            return getattr(getattr(aeidon, pid[1]), pid[2])
+        if pid[0] == "calc":
+            try:
+                framerate = aeidon.framerates.find_item("value", pid[1])
+            except ValueError:
+                # Use non-constant values as is.
+                framerate = pid[1]
+            return aeidon.Calculator(framerate)
+        if pid[0] == "method":
+            return getattr(self.master, pid[1])
+        raise pickle.UnpicklingError("Unknown reference {}"
+                                     .format(repr(pid)))
@@ -18,6 +18,7 @@
 """Base class for text markup."""
 
 import aeidon
+import collections
 import re
 
 __all__ = ("Markup",)
@@ -44,11 +45,33 @@ class Markup(aeidon.Singleton):
     can therefore be merely subclassed with a ``pass``-statement by formats
     that do not implement any markup. The caller of any tagging methods, e.g.
     :meth:`bolden`, must be prepared to handle :exc:`NotImplementedError`.
+
+    Encoding tokenizes text once to a stream of text and internal tag nodes,
+    pairs opening and closing tags and, if :attr:`_context_free_tagging` is
+    ``True``, emits the tags of this format in one linear pass. The tags to
+    emit are found by calling the tagging methods once for each tag and value.
+    Formats whose tagging methods depend on the surrounding text need to set
+    :attr:`_context_free_tagging` to ``False``, in which case the tagging
+    methods are applied to the whole text for each pair of tags. Decoding
+    likewise pairs the opening and closing tags of each pattern in one pass.
     """
 
+    _context_free_tagging = True
     _flags = re.DOTALL | re.MULTILINE
     format = aeidon.formats.NONE
 
+    # Characters of which any markup to decode contains at least one,
+    # or None to always decode. Defined by formats with markup so that
+    # decoding can skip plain text.
+    _markup_characters = None
+
+    # Pattern for internal tags, with groups for the name of an opening tag
+    # without value, values of color, font and size opening tags and
+    # the name of a closing tag.
+    _internal_tag_pattern = (r"<(?:(b|i|u)|color=#([a-fA-F0-9]{6})|"
+                             r"font=([^>]+)|size=(\d+))>|"
+                             r"</(b|i|u|color|font|size)>")
+
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
         raise NotImplementedError
@@ -69,6 +92,7 @@ class Markup(aeidon.Singleton):
 
     def decode(self, text):
         """Return `text` with markup converted from this to internal format."""
+        if not self.has_markup_characters(text): return text
         text = self._pre_decode(text)
         text = self._main_decode(text)
         return self._post_decode(text)
@@ -79,15 +103,58 @@ class Markup(aeidon.Singleton):
 
         `replacement` may contain one or more of ``{}``, which are replaced
         with parts of the match as defined by `groups`, a ``tuple`` of numbers.
+        The last item of `groups` should be the content between tags.
         """
-        orig_text = text
-        match = regex.search(text)
-        if match is None: return text
-        a, z = match.span()
-        new = replacement.format(*tuple(map(match.group, groups)))
-        text = "".join((text[:a], new, text[z:]))
-        if text == orig_text: return text
-        return self._decode_apply(text, regex, replacement, groups)
+        target = groups[-1]
+        values = ["{}"] * (len(groups) - 1)
+        split = replacement.format(*values, "\0").split("\0")
+        tokenizer = self._get_decode_tokenizer(regex, target)
+        if tokenizer is None or len(split) != 2:
+            return self._decode_apply_search(text, regex, replacement, groups)
+        # Opening tags are paired with the first unpaired closing tag that
+        # follows them, matching the result of repeatedly replacing the
+        # leftmost match of regex, but in one pass over tags.
+        regex, backrefs = tokenizer
+        shift = len(backrefs) + 2
+        value_groups = [x + shift for x in groups[:-1]]
+        parts = []
+        unpaired = collections.defaultdict(collections.deque)
+        pos = 0
+        for match in regex.finditer(text):
+            parts.append(text[pos:match.start()])
+            parts.append(match.group(0))
+            pos = match.end()
+            if match.group(1) is None:
+                # Opening tag, with backreferenced groups as key.
+                key = self._get_key(match, [x + shift for x in backrefs])
+                unpaired[key].append((len(parts) - 1, match))
+                continue
+            key = self._get_key(match, range(2, shift))
+            if not unpaired[key]: continue
+            index, opening = unpaired[key].popleft()
+            values = [opening.group(x) for x in value_groups]
+            parts[index] = split[0].format(*values)
+            parts[-1] = split[1].format(*values)
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    def _decode_apply_search(self, text, regex, replacement, groups):
+        """
+        Return `text` with all matches of `regex` replaced.
+
+        This is a fallback for patterns that cannot be split into tags.
+        """
+        pos = 0
+        while True:
+            match = regex.search(text, pos)
+            if match is None: return text
+            a, z = match.span()
+            new = replacement.format(*tuple(map(match.group, groups)))
+            if new == match.group(0): return text
+            text = "".join((text[:a], new, text[z:]))
+            # Nothing before the start of the replaced match can match,
+            # since that would have been found first.
+            pos = a
 
     def _decode_b(self, text, pattern, target, flags=0):
         """Return `text` with bold markup converted to internal format."""
@@ -127,6 +194,9 @@ class Markup(aeidon.Singleton):
 
     def encode(self, text):
         """Return `text` with markup converted from internal to this format."""
+        if not "<" in text: return text
+        if self._context_free_tagging:
+            return self._encode_nodes(self._tokenize(text))
         text = self._encode_b(text)
         text = self._encode_c(text)
         text = self._encode_f(text)
@@ -141,19 +211,19 @@ class Markup(aeidon.Singleton):
         `method` should be one the tagging methods, e.g. meth:`bolden`.
         `target` and `value` should be group numbers in `regex`.
         """
-        orig_text = text
-        match = regex.search(text)
-        if match is None: return text
-        text = regex.sub(r"\{}".format(target), text, 1)
-        a = match.start()
-        z = a + len(match.group(target))
-        args = (text, (a, z))
-        if value is not None:
-            args = (text, match.group(value), (a, z))
-        with aeidon.util.silent(NotImplementedError):
-            text = method(*args)
-        if text == orig_text: return text
-        return self._encode_apply(text, regex, method, target, value)
+        while True:
+            orig_text = text
+            match = regex.search(text)
+            if match is None: return text
+            text = regex.sub(r"\{}".format(target), text, 1)
+            a = match.start()
+            z = a + len(match.group(target))
+            args = (text, (a, z))
+            if value is not None:
+                args = (text, match.group(value), (a, z))
+            with aeidon.util.silent(NotImplementedError):
+                text = method(*args)
+            if text == orig_text: return text
 
     def _encode_b(self, text):
         """Return `text` with bold markup converted to this format."""
@@ -185,15 +255,100 @@ class Markup(aeidon.Singleton):
         regex = self._get_regex(r"<u>(.*?)</u>")
         return self._encode_apply(text, regex, self.underline, 1)
 
+    def _encode_nodes(self, nodes):
+        """Return text of this format from internal tag and text `nodes`."""
+        parts = []
+        for node in nodes:
+            if isinstance(node, str):
+                parts.append(node)
+                continue
+            name, value, pair, tag = node
+            if pair is None:
+                # Leave tags without a pair as they are.
+                parts.append(tag)
+            elif tag.startswith("</"):
+                parts.append(self._get_tag_pair(name, pair[1])[1])
+            else: # Opening tag
+                parts.append(self._get_tag_pair(name, value)[0])
+        return "".join(parts)
+
     def fontify(self, text, font, bounds=None):
         """Return `text` changed to `font`."""
         raise NotImplementedError
 
-    @aeidon.deco.memoize(100)
+    def _get_decode_tokenizer(self, regex, target):
+        """
+        Return a tokenizer for opening and closing tags in `regex` or ``None``.
+
+        `regex` should be of form ``OPENING(.*?)CLOSING``, where ``(.*?)`` is
+        group number `target` and ``CLOSING`` contains no groups, but can
+        contain backreferences to groups in ``OPENING``. Return a tuple of the
+        tokenizer and group numbers of backreferences or ``None`` if `regex`
+        cannot be split. Group 1 of the tokenizer matches a closing tag, the
+        next groups its backreferenced parts and the next group an opening tag.
+        """
+        tokenizers = self.__dict__.setdefault("_decode_tokenizers", {})
+        key = (regex.pattern, regex.flags, target)
+        if not key in tokenizers:
+            tokenizers[key] = self._split_decode_regex(regex, target)
+        return tokenizers[key]
+
+    def _get_key(self, match, groups):
+        """Return a tuple of `groups` in `match` to pair tags with."""
+        key = tuple(match.group(x) for x in groups)
+        if self._flags & re.IGNORECASE:
+            key = tuple(x.lower() for x in key)
+        return key
+
     def _get_regex(self, pattern, flags=0):
         """Return compiled regular expression from cache."""
-        flags = self._flags | flags
-        return re.compile(pattern, flags)
+        # Markups are singletons, so a plain dictionary attribute works as
+        # a per-format cache that avoids the key pickling of memoize.
+        regexes = self.__dict__.setdefault("_regexes", {})
+        key = (pattern, flags)
+        if not key in regexes:
+            regexes[key] = re.compile(pattern, self._flags | flags)
+        return regexes[key]
+
+    def _get_tag_pair(self, name, value=None):
+        """
+        Return opening and closing tags of this format for internal tag.
+
+        Tags are found by applying the corresponding tagging method to a
+        placeholder character and cached. If the tagging method is not
+        implemented, return empty strings to remove the tags.
+        """
+        tag_pairs = self.__dict__.setdefault("_tag_pairs", {})
+        key = (name, value)
+        if key in tag_pairs:
+            return tag_pairs[key]
+        method = {"b": self.bolden,
+                  "i": self.italicize,
+                  "u": self.underline,
+                  "color": self.colorize,
+                  "font": self.fontify,
+                  "size": self.scale}[name]
+
+        args = (("\0",) if value is None else ("\0", value))
+        try:
+            opening, closing = method(*args, bounds=(0, 1)).split("\0")
+        except NotImplementedError:
+            opening, closing = "", ""
+        tag_pairs[key] = (opening, closing)
+        return tag_pairs[key]
+
+    def has_markup_characters(self, text):
+        """
+        Return ``True`` if `text` contains characters used in markup.
+
+        Return ``False`` only if `text` certainly contains no markup of this
+        format. The check is a single scan for a character class and thus
+        much cheaper than decoding.
+        """
+        if self._markup_characters is None: return True
+        if not self._markup_characters: return False
+        pattern = "[{}]".format(re.escape(self._markup_characters))
+        return self._get_regex(pattern).search(text) is not None
 
     @property
     def italic_tag(self):
@@ -220,6 +375,38 @@ class Markup(aeidon.Singleton):
         """Return `text` scaled to `size`."""
         raise NotImplementedError
 
+    def _split_decode_regex(self, regex, target):
+        """Return tokenizer for :meth:`_get_decode_tokenizer` or ``None``."""
+        pattern = regex.pattern
+        # Alternation could bind differently once split, so leave
+        # such patterns to the general search and replace.
+        if "|" in pattern: return None
+        start = -1
+        while True:
+            start = pattern.find("(.*?)", start + 1)
+            if start < 0: return None
+            opening = pattern[:start]
+            with aeidon.util.silent(re.error):
+                if re.compile(opening).groups == target - 1: break
+        backrefs = []
+        def replace(match):
+            if match.group(1) is None:
+                return match.group(0)
+            backrefs.append(int(match.group(1)))
+            return "(.*?)"
+        re_escape = re.compile(r"\\(\d)|\\.", re.DOTALL)
+        closing = re_escape.sub(replace, pattern[start+5:])
+        try:
+            regex = re.compile("({})|({})".format(closing, opening), regex.flags)
+        except re.error:
+            return None
+        if regex.groups != len(backrefs) + target + 1:
+            # Closing tag contains groups of its own.
+            return None
+        if not opening or regex.match("") is not None:
+            return None
+        return regex, tuple(backrefs)
+
     def _substitute(self, text, pattern, replacement, flags=0):
         """Return `text` with matches of `pattern` replaced."""
         regex = self._get_regex(pattern, flags)
@@ -230,6 +417,41 @@ class Markup(aeidon.Singleton):
         """Regular expression for any markup tag or ``None``."""
         return None
 
+    def _tokenize(self, text):
+        """
+        Return `text` split into a list of text and internal tag nodes.
+
+        Text nodes are strings. Tag nodes are lists of name, value, pair and
+        the original tag. Value is ``None`` for closing tags and tags without
+        a value. Pair is the node of the other tag in the pair or ``None`` if
+        the tag could not be paired. Each opening tag is paired with the first
+        unpaired closing tag of the same name that follows it.
+        """
+        regex = self._get_regex(self._internal_tag_pattern)
+        nodes = []
+        unpaired = collections.defaultdict(collections.deque)
+        pos = 0
+        for match in regex.finditer(text):
+            nodes.append(text[pos:match.start()])
+            pos = match.end()
+            if match.group(5) is None:
+                i = next(i for i in (1, 2, 3, 4) if match.group(i))
+                name = (match.group(1).lower() if i == 1 else
+                        ("color", "font", "size")[i-2])
+                value = (None if i == 1 else match.group(i))
+                node = [name, value, None, match.group(0)]
+                unpaired[name].append(node)
+            else: # Closing tag
+                name = match.group(5).lower()
+                node = [name, None, None, match.group(0)]
+                if unpaired[name]:
+                    opening = unpaired[name].popleft()
+                    opening[2] = node
+                    node[2] = opening
+            nodes.append(node)
+        nodes.append(text[pos:])
+        return nodes
+
     def underline(self, text, bounds=None):
         """Return underlined `text`."""
         raise NotImplementedError
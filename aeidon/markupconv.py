@@ -24,7 +24,16 @@ __all__ = ("MarkupConverter",)
 
 class MarkupConverter:
 
-    """Subtitle text markup converter."""
+    """
+    Subtitle text markup converter.
+
+    Texts that contain markup are cached once converted, so that repeated
+    texts are converted only once. Use :meth:`shared` to get a converter that
+    is reused for the same pair of formats instead of instantiating a new one.
+    """
+
+    _cache_size = 10000
+    _converters = {}
 
     def __init__(self, from_format, to_format):
         """
@@ -33,9 +42,36 @@ class MarkupConverter:
         `from_format` and `to_format` should be :attr:`aeidon.formats`
         enumeration items.
         """
+        self._cache = {}
         self._from = aeidon.markups.new(from_format)
         self._to = aeidon.markups.new(to_format)
 
     def convert(self, text):
         """Return `text` with markup converted."""
-        return self._to.encode(self._from.decode(text))
+        # Plain text is neither decoded nor encoded,
+        # internal markup is always enclosed in "<" and ">".
+        if not "<" in text and not self._from.has_markup_characters(text):
+            return text
+        # Shared converters can be used from multiple threads,
+        # look up cache without separate membership test.
+        new_text = self._cache.get(text)
+        if new_text is not None:
+            return new_text
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        new_text = self._to.encode(self._from.decode(text))
+        self._cache[text] = new_text
+        return new_text
+
+    def convert_many(self, texts):
+        """Return a list of `texts` with markup converted."""
+        convert = self.convert
+        return [convert(x) for x in texts]
+
+    @classmethod
+    def shared(cls, from_format, to_format):
+        """Return a shared converter from `from_format` to `to_format`."""
+        key = (from_format, to_format)
+        if not key in cls._converters:
+            cls._converters[key] = cls(from_format, to_format)
+        return cls._converters[key]
@@ -43,15 +43,27 @@ __all__ = [
     "WebVTT",
 ]
 
+# Classes by format, lazily filled from __all__ upon first lookup.
+_classes = {}
+
 def add(cls):
     """Add a new :class:`aeidon.Markup` class."""
     globals()[cls.__name__] = cls
     __all__.append(cls.__name__)
+    _classes.clear()
+
+def _get_class(format):
+    """Return the first class in :attr:`__all__` for `format`."""
+    if not _classes:
+        for cls in map(eval, __all__):
+            _classes.setdefault(cls.format, cls)
+    try:
+        return _classes[format]
+    except KeyError:
+        raise ValueError("Format {} not found"
+                         .format(repr(format)))
 
 def new(format):
     """Return a new :class:`aeidon.Markup` instance given `format`."""
-    for cls in map(eval, __all__):
-        if cls.format == format:
-            return cls()
-    raise ValueError("Format {} not found"
-                     .format(repr(format)))
+    cls = _get_class(format)
+    return cls()
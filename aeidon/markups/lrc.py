@@ -31,3 +31,4 @@ class LRC(aeidon.Markup):
     """
 
     format = aeidon.formats.LRC
+    _markup_characters = ""
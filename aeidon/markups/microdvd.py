@@ -42,7 +42,10 @@ class MicroDVD(aeidon.Markup):
     other characters.
     """
 
+    # Tags depend on whether bounds cover a line or the whole subtitle.
+    _context_free_tagging = False
     format = aeidon.formats.MICRODVD
+    _markup_characters = "{"
 
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
@@ -39,6 +39,7 @@ class MPL2(aeidon.markups.MicroDVD):
     """
 
     format = aeidon.formats.MPL2
+    _markup_characters = "{/\\_"
 
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
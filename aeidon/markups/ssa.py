@@ -18,6 +18,7 @@
 """Text markup for the Sub Station Alpha format."""
 
 import aeidon
+import collections
 import re
 
 __all__ = ("SubStationAlpha",)
@@ -49,6 +50,7 @@ class SubStationAlpha(aeidon.Markup):
 
     _flags = re.DOTALL | re.MULTILINE | re.IGNORECASE
     format = aeidon.formats.SSA
+    _markup_characters = "{"
 
     # Defined here so that AdvSubStationAlpha can override them.
     _closing_pattern = r"\{\\([bi])0\}"
@@ -114,13 +116,16 @@ class SubStationAlpha(aeidon.Markup):
         For example, ``{\\b1\\i1}`` is replaced with ``{\\b1}{\\i1}``.
         """
         parts = text.split("\\")
-        for i in range(1, len(parts)):
-            text_so_far = "\\".join(parts[:i])
-            if text_so_far.endswith("{"): continue
-            opening_index = text_so_far.rfind("{")
-            closing_index = text_so_far.rfind("}")
-            if opening_index > closing_index:
-                parts[i - 1] += "}{"
+        inside = False
+        for i in range(len(parts) - 1):
+            # Track whether we're inside a tag as of the end of the part,
+            # a backslash inside a tag starts a new tag unless the part
+            # already ends with a tag opening brace.
+            a = parts[i].rfind("{")
+            z = parts[i].rfind("}")
+            if a != z: inside = a > z
+            if inside and not parts[i].endswith("{"):
+                parts[i] += "}{"
         return "\\".join(parts)
 
     def _pre_decode_color(self, text):
@@ -129,14 +134,8 @@ class SubStationAlpha(aeidon.Markup):
 
         Color tags are converted from ``{\\c&HBBGGRR&}`` to ``{\\c#RRGGBB}``.
         """
-        pattern = r"\{\\c&H([0-9a-fA-F]*)&\}"
-        regex = self._get_regex(pattern)
-        match = regex.search(text)
-        if match is None: return text
-        color = ("{:0>6s}".format(match.group(1))).replace(" ", "0")
-        color = "{}{}{}".format(color[4:], color[2:4], color[:2])
-        text = regex.sub(r"{{\\c#{}}}".format(color), text, 1)
-        return self._pre_decode_color(text)
+        regex = self._get_regex(r"\{\\c&H([0-9a-fA-F]*)&\}")
+        return regex.sub(self._reverse_color, text)
 
     def _pre_decode_reset(self, text):
         """
@@ -150,21 +149,28 @@ class SubStationAlpha(aeidon.Markup):
         re_reset = self._get_regex(self._reset_pattern)
         parts = re_reset.split(text + "{\\r}")
         for i, part in enumerate(parts):
-            opening_matches = [x for x in re_opening.finditer(part)]
-            closing_matches = [x for x in re_closing.finditer(part)]
-            # Find out which tags have already been closed.
-            for j in reversed(range(len(closing_matches))):
-                closing_core = closing_matches[j].group(1)
-                for k in range(len(opening_matches)):
-                    opening_core = opening_matches[k].group(1)
-                    if opening_core == closing_core:
-                        opening_matches.pop(k)
-                        break
-            # Add artificial closing tags to close remaining tags.
-            for j in reversed(range(len(opening_matches))):
-                parts[i] += "{{\\{}\\}}".format(opening_matches[j].group(1))
+            # Each closing tag closes the first unclosed opening tag
+            # of the same name, the rest need artificial closing tags.
+            closed = collections.Counter(
+                x.group(1) for x in re_closing.finditer(part))
+            unclosed = []
+            for match in re_opening.finditer(part):
+                core = match.group(1)
+                if closed[core] > 0:
+                    closed[core] -= 1
+                    continue
+                unclosed.append(core)
+            parts[i] += "".join("{{\\{}\\}}".format(x)
+                                for x in reversed(unclosed))
+
         return "".join(parts)
 
+    def _reverse_color(self, match):
+        """Return color tag `match` in standard hexadecimal form."""
+        color = "{:0>6s}".format(match.group(1))
+        color = "{}{}{}".format(color[4:], color[2:4], color[:2])
+        return "{{\\c#{}}}".format(color)
+
     def scale(self, text, size, bounds=None):
         """Return `text` scaled to `size`."""
         a, z = bounds or (0, len(text))
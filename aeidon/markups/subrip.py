@@ -39,6 +39,7 @@ class SubRip(aeidon.Markup):
 
     _flags = re.DOTALL | re.MULTILINE | re.IGNORECASE
     format = aeidon.formats.SUBRIP
+    _markup_characters = "<"
 
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
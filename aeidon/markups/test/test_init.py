@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestModule(aeidon.TestCase):
+
+    def test_add(self):
+        class SubRipDerivative(aeidon.markups.SubRip):
+            pass
+        aeidon.markups.add(SubRipDerivative)
+        try:
+            markup = aeidon.markups.new(aeidon.formats.SUBRIP)
+            assert type(markup) is aeidon.markups.SubRip
+        finally:
+            aeidon.markups.__all__.remove("SubRipDerivative")
+            del aeidon.markups.SubRipDerivative
+            aeidon.markups._classes.clear()
+
+    def test_new(self):
+        for format in aeidon.formats:
+            markup = aeidon.markups.new(format)
+            assert markup.format == format
+            assert aeidon.markups.new(format) is markup
+
+    def test_new__value_error(self):
+        self.assert_raises(ValueError, aeidon.markups.new, None)
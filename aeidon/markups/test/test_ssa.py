@@ -71,6 +71,21 @@ class TestSubStationAlpha(aeidon.TestCase):
             "<i>All</i> things weird are normal\n"
             "in this whore of cities.")
 
+    def test_decode__karaoke(self):
+        text = ("{\\k20\\c&Hff&}All {\\k30\\c&Hff00&}things{\\k25} weird\n"
+                "{\\k40\\b1}in{\\b0} this whore of cities.")
+        assert self.markup.decode(text) == (
+            "<color=#ff0000>All <color=#00ff00>things weird\n"
+            "<b>in</b> this whore of cities.</color></color>")
+
+    def test_decode__karaoke__long(self):
+        # Karaoke lines can have one or more tags per syllable.
+        text = "".join("{{\\k20\\c&H{:06x}&\\b1}}x{{\\b0}}".format(i)
+                       for i in range(2000))
+        text = self.markup.decode(text)
+        assert text.count("<color=") == text.count("</color>") == 2000
+        assert text.count("<b>x</b>") == 2000
+
     def test_decode__reset(self):
         text = ("{\\b1\\i1}All{\\i0} things weird are normal\n"
                 "{\\fs12}in this whore of cities{\\r}.")
@@ -85,6 +100,11 @@ class TestSubStationAlpha(aeidon.TestCase):
             "All things weird are normal\n"
             "<size=12>in this whore of cities.</size>")
 
+    def test__pre_decode_break(self):
+        text = "{\\b1\\i1}a\\N{\\k20\\\\c&H&}b{\\}"
+        assert self.markup._pre_decode_break(text) == (
+            "{\\b1}{\\i1}a\\N{\\k20}{\\}{\\c&H&}b{\\}")
+
     def test_encode__bold(self):
         text = ("<b>All things weird are normal\n"
                 "in this whore of cities.</b>")
@@ -31,3 +31,4 @@ class TMPlayer(aeidon.Markup):
     """
 
     format = aeidon.formats.TMPLAYER
+    _markup_characters = ""
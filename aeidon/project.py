@@ -18,6 +18,7 @@
 """Model for subtitle data."""
 
 import aeidon
+import collections
 
 __all__ = ("Project",)
 
@@ -31,22 +32,29 @@ class ProjectMeta(type):
     in order to fool Sphinx (and perhaps other API documentation generators)
     into thinking that the resulting instantiated class actually contains those
     methods, which it does not since the methods are removed during
-    :meth:`Project.__init__`.
+    :meth:`Project.__init__` of the first instance.
+
+    The names of exported methods of each agent class are resolved once here
+    and stored as ``_delegation_table`` so that instantiating a project only
+    needs to bind methods, without any introspection.
     """
 
     def __new__(meta, class_name, bases, dic):
         new_dict = dic.copy()
+        delegation_table = []
+        found_names = set()
         for agent_class_name in aeidon.agents.__all__:
             agent_class = getattr(aeidon.agents, agent_class_name)
-            def is_delegate_method(name):
-                value = getattr(agent_class, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
-
-            attr_names = list(filter(is_delegate_method, dir(agent_class)))
+            attr_names = agent_class.get_exported_names()
             for attr_name in attr_names:
+                if attr_name in found_names:
+                    raise ValueError("Multiple definitions of {}"
+                                     .format(repr(attr_name)))
+                found_names.add(attr_name)
                 new_dict[attr_name] = getattr(agent_class, attr_name)
+            delegation_table.append((agent_class, attr_names))
+        new_dict["_delegation_table"] = tuple(delegation_table)
+        new_dict["_has_class_delegations"] = True
         return type.__new__(meta, class_name, bases, new_dict)
 
 
@@ -58,6 +66,10 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
     :ivar _delegations: Dictionary mapping method names to agent methods
+
+       The same bound agent methods are also installed directly as instance
+       attributes, so that calling them requires no extra dispatch.
+
     :ivar framerate: :attr:`aeidon.framerates` item corresponding to video
     :ivar main_changed: Integer, status of main document
 
@@ -67,6 +79,15 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
     :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
+
+       Stacks are :class:`collections.deque` instances with the most recent
+       action first, so that pushing and popping actions is O(1).
+
+    :ivar subtitle_cache: :class:`aeidon.SubtitleCache` instance or None
+
+       If set, files are opened via the cache, avoiding parsing files
+       that have been opened before. Caching is not used by default.
+
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
     :ivar tran_changed: Integer, status of translation document
 
@@ -76,6 +97,20 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar tran_file: Translation instance of :class:`aeidon.SubtitleFile`
     :ivar undo_limit: Maximum size of undo/redo stacks or None for no limit
+    :ivar undo_memory_limit: Amount of actions kept in memory or None
+
+       Older actions in undo and redo stacks are stored on disk and loaded
+       back when undoing or redoing reaches them. If ``None``, the default,
+       all actions are kept in memory.
+
+    :ivar undo_merge_limit: Maximum amount of edits merged into one action
+    :ivar undo_merge_window: Seconds to merge successive edits within or None
+
+       Successive edits of the same text or position of the same subtitle
+       within this time of each other are merged into one action in the undo
+       stack. If ``None``, the default, actions are never merged, so that
+       each call of a revertable method can be undone separately.
+
     :ivar undoables: Stack of :class:`aeidon.RevertableAction` instances
     :ivar video_path: Full, absolute path to the video file on disk
 
@@ -121,17 +156,26 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         self.framerate = framerate
         self.main_changed = 0
         self.main_file = None
-        self.redoables = []
+        self.redoables = collections.deque()
+        self.subtitle_cache = None
         self.subtitles = []
         self.tran_changed = None
         self.tran_file = None
         self.undo_limit = 100000
-        self.undoables = []
+        self.undo_memory_limit = None
+        self.undo_merge_limit = 100
+        self.undo_merge_window = None
+        self.undoables = collections.deque()
         self.video_path = None
         self._init_delegations()
 
     def __getattr__(self, name):
-        """Return method delegated to an agent."""
+        """
+        Return method delegated to an agent.
+
+        Delegated methods are bound as instance attributes, so this is only
+        a fallback hit if normal attribute lookup fails.
+        """
         try:
             return self._delegations[name]
         except LookupError:
@@ -139,22 +183,19 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     def _init_delegations(self):
         """Initialize the delegation mappings."""
-        for agent_class_name in aeidon.agents.__all__:
-            agent = getattr(aeidon.agents, agent_class_name)(self)
-            def is_delegate_method(name):
-                value = getattr(agent, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
-
-            attr_names = list(filter(is_delegate_method, dir(agent)))
+        for agent_class, attr_names in self._delegation_table:
+            agent = agent_class(self)
             for attr_name in attr_names:
-                attr_value = getattr(agent, attr_name)
-                if attr_name in self._delegations:
-                    raise ValueError("Multiple definitions of {}"
-                                     .format(repr(attr_name)))
-
-                self._delegations[attr_name] = attr_value
-                # Remove class-level function added by ProjectMeta.
-                if hasattr(self.__class__, attr_name):
-                    delattr(self.__class__, attr_name)
+                self._delegations[attr_name] = getattr(agent, attr_name)
+        # Install bound methods directly as instance attributes to avoid
+        # going through __getattr__ on every call. Bypass __setattr__ to
+        # avoid adding notify signals for methods.
+        self.__dict__.update(self._delegations)
+        for cls in self.__class__.__mro__:
+            if not cls.__dict__.get("_has_class_delegations", False):
+                continue
+            # Remove class-level functions added by ProjectMeta.
+            for attr_name in self._delegations:
+                if attr_name in cls.__dict__:
+                    delattr(cls, attr_name)
+            cls._has_class_delegations = False
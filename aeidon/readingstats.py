@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Table of reading speed statistics of subtitles."""
+
+import array
+
+__all__ = ("ReadingStatistics",)
+
+
+class ReadingStatistics:
+
+    """
+    Table of reading speed statistics of subtitles.
+
+    :ivar cps: Array of reading speeds in characters per second
+    :ivar durations: Array of durations in seconds
+    :ivar gaps: Array of seconds from end to the start of the next subtitle
+
+       Gaps are negative for subtitles that overlap the next subtitle and
+       infinite for the last subtitle.
+
+    :ivar lengths: Array of amounts of characters in texts excluding markup
+    :ivar overlaps: Array of 1 for subtitles overlapping another, else 0
+
+    Statistics are stored column-wise in compact :class:`array.array`
+    instances, with one item per subtitle in each column.
+    """
+
+    __slots__ = ("cps", "durations", "gaps", "lengths", "overlaps")
+
+    def __init__(self, subtitles, doc, re_tag=None):
+        """
+        Initialize a :class:`ReadingStatistics` instance.
+
+        `subtitles` should be a sequence of :class:`aeidon.Subtitle` instances
+        sorted by start position and `re_tag` a regular expression for markup
+        tags to exclude from text lengths or ``None``.
+        """
+        starts = array.array("d", [x.start_seconds for x in subtitles])
+        ends = array.array("d", [x.end_seconds for x in subtitles])
+        texts = [x.get_text(doc) for x in subtitles]
+        if re_tag is not None:
+            texts = [re_tag.sub("", x) if x else x for x in texts]
+        self.lengths = array.array("l", map(len, texts))
+        self.durations = array.array("d", map(float.__sub__, ends, starts))
+        self.cps = array.array("d", map(self._get_cps,
+                                        self.lengths,
+                                        self.durations))
+
+        self.gaps = array.array("d", map(float.__sub__, starts[1:], ends))
+        if starts:
+            self.gaps.append(float("inf"))
+        self.overlaps = array.array("b", bytes(len(starts)))
+        max_end = float("-inf")
+        for i, start in enumerate(starts):
+            # Subtitles are sorted by start, so an overlap with an earlier
+            # subtitle is found by comparing to the latest end so far.
+            if start < max_end or self.gaps[i] < 0:
+                self.overlaps[i] = 1
+            max_end = max(max_end, ends[i])
+
+    def __getitem__(self, index):
+        """Return a tuple of statistics for subtitle at `index`."""
+        return (self.lengths[index],
+                self.durations[index],
+                self.cps[index],
+                self.gaps[index],
+                bool(self.overlaps[index]))
+
+    def __len__(self):
+        """Return the amount of subtitles in table."""
+        return len(self.lengths)
+
+    @staticmethod
+    def _get_cps(length, duration):
+        """Return reading speed in characters per second."""
+        if duration > 0:
+            return length / duration
+        return (float("inf") if length > 0 else 0.0)
+
+    def get_overlapping(self):
+        """Return a list of indices of subtitles overlapping another."""
+        return [i for i, x in enumerate(self.overlaps) if x]
+
+    def get_too_fast(self, speed):
+        """Return a list of indices of subtitles faster than `speed`."""
+        return [i for i, x in enumerate(self.cps) if x > speed]
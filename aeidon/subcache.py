@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""On-disk cache of parsed subtitle files."""
+
+import aeidon
+import hashlib
+import marshal
+import os
+
+__all__ = ("SubtitleCache",)
+
+
+class SubtitleCache:
+
+    """
+    On-disk cache of parsed subtitle files.
+
+    :ivar directory: Path to the directory where cache files are stored
+    :ivar max_size: Maximum total size of cache files in bytes
+
+    Parsed subtitles and file metadata are stored in a compact binary form
+    (:mod:`marshal` of plain builtin types), keyed by a hash of the file
+    content, format, encoding and version of :mod:`aeidon`. Cache files are
+    thus never stale, but the least recently used files are evicted when the
+    total size exceeds `max_size`.
+    """
+
+    def __init__(self, directory=None, max_size=100000000):
+        """Initialize a :class:`SubtitleCache` instance."""
+        self.directory = directory or os.path.join(
+            aeidon.DATA_HOME_DIR, "cache", "subtitles")
+        self.max_size = max_size
+
+    def clear(self):
+        """Remove all cache files."""
+        for path in self._list_files():
+            with aeidon.util.silent(OSError):
+                os.remove(path)
+
+    def _evict(self):
+        """Remove least recently used cache files to fit `max_size`."""
+        files = []
+        for path in self._list_files():
+            with aeidon.util.silent(OSError):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(x[1] for x in files)
+        for mtime, size, path in sorted(files):
+            if total <= self.max_size: break
+            with aeidon.util.silent(OSError):
+                os.remove(path)
+                total -= size
+
+    def _get_path(self, file, blob):
+        """Return path to the cache file of `file` with content `blob`."""
+        hash = hashlib.blake2b(blob, digest_size=20)
+        hash.update("\0".join((
+            aeidon.__version__,
+            str(marshal.version),
+            file.format.name,
+            file.encoding,
+        )).encode("utf_8"))
+        return os.path.join(self.directory, hash.hexdigest())
+
+    def _list_files(self):
+        """Return a list of paths of cache files."""
+        if not os.path.isdir(self.directory): return []
+        return [os.path.join(self.directory, x)
+                for x in os.listdir(self.directory)
+                if not x.startswith(".")]
+
+    def read(self, file):
+        """
+        Read `file` from cache if found, else from disk, and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        with aeidon.util.open_read(file.path, "rb") as f:
+            blob = f.read()
+        path = self._get_path(file, blob)
+        try:
+            with open(path, "rb") as f:
+                subtitles = load(file, f.read())
+            # Mark cache file as recently used for eviction.
+            os.utime(path)
+            return subtitles
+        except Exception:
+            pass
+        subtitles = file.read()
+        with aeidon.util.silent(Exception):
+            aeidon.util.makedirs(self.directory)
+            with aeidon.util.atomic_open(path, "wb") as f:
+                f.write(dump(file, subtitles))
+            self._evict()
+        return subtitles
+
+
+def dump(file, subtitles):
+    """
+    Return a compact binary representation of `file` and `subtitles`.
+
+    Use :func:`load` to restore `file` properties and `subtitles`.
+    """
+    state = {k: v for k, v in vars(file).items()
+             if k not in ("path", "_text")}
+    state["newline"] = file.newline.name
+    names = set(x.container for x in aeidon.formats if x.container)
+    containers = {}
+    for i, subtitle in enumerate(subtitles):
+        # Containers are lazily instantiated,
+        # store only those actually used.
+        for name in names & set(subtitle.__dict__):
+            container = subtitle.__dict__[name]
+            containers.setdefault(name, {})[i] = dict(vars(container))
+    return marshal.dumps((
+        state,
+        [x._start for x in subtitles],
+        [x._end for x in subtitles],
+        [x._main_text for x in subtitles],
+        containers,
+    ))
+
+def load(file, data):
+    """
+    Update `file` from `data` and return subtitles.
+
+    `data` should be the return value of :func:`dump` for a file of the
+    same format and :mod:`aeidon` version.
+    """
+    state, starts, ends, texts, containers = marshal.loads(data)
+    state["newline"] = getattr(aeidon.newlines, state["newline"])
+    subtitles = []
+    for start, end, text in zip(starts, ends, texts):
+        subtitle = file._get_subtitle()
+        subtitle._start = start
+        subtitle._end = end
+        subtitle._main_text = text
+        subtitles.append(subtitle)
+    for name, items in containers.items():
+        for i, attrs in items.items():
+            container = aeidon.containers.new(name)
+            container.__dict__.update(attrs)
+            setattr(subtitles[i], name, container)
+    file.__dict__.update(state)
+    return subtitles
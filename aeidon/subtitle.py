@@ -65,8 +65,15 @@ class Subtitle:
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
+        # Set zero positions directly in native modes,
+        # avoiding conversions for every subtitle read.
+        if self._mode == aeidon.modes.TIME:
+            self._start = self._end = "00:00:00.000"
+        elif self._mode == aeidon.modes.FRAME:
+            self._start = self._end = 0
+        else:
+            self.start = "00:00:00.000"
+            self.end = "00:00:00.000"
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
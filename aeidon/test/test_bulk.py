@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestModule(aeidon.TestCase):
+
+    def test_open_main_files(self):
+        paths = [self.new_temp_file(x) for x in aeidon.formats]
+        projects = aeidon.open_main_files(paths, "ascii", max_workers=2)
+        for path, project in zip(paths, projects):
+            original = aeidon.Project()
+            original.open_main(path, "ascii")
+            assert project.main_file.path == path
+            assert project.main_file.format == original.main_file.format
+            assert project.subtitles == original.subtitles
+
+    def test_open_main_files__format_error(self):
+        paths = [self.new_subrip_file(), aeidon.temp.create()]
+        self.assert_raises(aeidon.FormatError,
+                           aeidon.open_main_files,
+                           paths, "ascii")
+
+    def test_open_main_files__framerate(self):
+        paths = [self.new_microdvd_file()]
+        framerate = aeidon.framerates.FPS_25_000
+        project, = aeidon.open_main_files(paths, "ascii", framerate)
+        assert project.framerate == framerate
+        assert project.subtitles[0].framerate == framerate
+
+    def test_open_main_files__return_exceptions(self):
+        paths = [self.new_subrip_file(), aeidon.temp.create()]
+        projects = aeidon.open_main_files(paths,
+                                          "ascii",
+                                          max_workers=2,
+                                          return_exceptions=True)
+
+        assert isinstance(projects[0], aeidon.Project)
+        assert isinstance(projects[1], aeidon.FormatError)
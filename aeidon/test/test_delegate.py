@@ -41,3 +41,24 @@ class TestDelegate(aeidon.TestCase):
     def test___setattr____master(self):
         self.delegate.name = "slave"
         assert self.master.name == "slave"
+
+
+class PuppetDelegate(aeidon.Delegate):
+
+    @aeidon.deco.export
+    def exported(self):
+        pass
+
+    def unexported(self):
+        pass
+
+
+class TestDelegateExport(aeidon.TestCase):
+
+    def test_get_exported_names(self):
+        names = PuppetDelegate.get_exported_names()
+        assert names == ("exported",)
+
+    def test_get_exported_names__cached(self):
+        names = PuppetDelegate.get_exported_names()
+        assert PuppetDelegate.get_exported_names() is names
@@ -17,6 +17,8 @@
 
 import aeidon
 import codecs
+import json
+import os
 
 from aeidon.i18n   import _
 from unittest.mock import patch
@@ -41,10 +43,52 @@ class TestModule(aeidon.TestCase):
         assert code_to_name("cp949") == "IBM949"
         assert code_to_name("mac_roman") == "MacRoman"
 
+    def test_decode(self):
+        blob = "äö€".encode("utf_8") * 10
+        text = aeidon.encodings.decode(blob, "utf_8", chunk_size=4)
+        assert text == "äö€" * 10
+
+    def test_decode__unicode_error(self):
+        blob = "äö€".encode("utf_8")[:-1]
+        self.assert_raises(UnicodeError,
+                           aeidon.encodings.decode,
+                           blob, "utf_8")
+
     def test_detect(self):
         name = aeidon.encodings.detect(self.new_subrip_file())
         assert aeidon.encodings.is_valid_code(name)
 
+    def test_detect__cached(self):
+        path = os.path.abspath(self.new_subrip_file())
+        cache_path = aeidon.temp.create(".json")
+        stat = os.stat(path)
+        key = [stat.st_size, stat.st_mtime_ns]
+        with patch("aeidon.encodings.detected_cache_path", cache_path):
+            aeidon.encodings._set_detected(path, key + ["cp1252"])
+            assert aeidon.encodings.detect(path) == "cp1252"
+        assert os.path.isfile(cache_path)
+
+    def test_detect__cached__set_late(self):
+        path = os.path.abspath(self.new_subrip_file())
+        cache_path = aeidon.temp.create(".json")
+        stat = os.stat(path)
+        value = [stat.st_size, stat.st_mtime_ns, "cp1252"]
+        with open(cache_path, "w") as f:
+            json.dump([[path, value]], f)
+        with patch.dict("aeidon.encodings._detected"):
+            aeidon.encodings._get_detected()
+            with patch("aeidon.encodings.detected_cache_path", cache_path):
+                assert aeidon.encodings.detect(path) == "cp1252"
+
+    def test_detect__not_stored(self):
+        path = os.path.abspath(self.new_subrip_file())
+        stat = os.stat(path)
+        key = [stat.st_size, stat.st_mtime_ns]
+        with patch("aeidon.util.atomic_open") as atomic_open:
+            aeidon.encodings._set_detected(path, key + ["cp1252"])
+            assert aeidon.encodings.detect(path) == "cp1252"
+        assert not atomic_open.called
+
     def test_detect_bom__none(self):
         path = self.new_subrip_file()
         encoding = aeidon.encodings.detect_bom(path)
@@ -117,6 +161,53 @@ class TestModule(aeidon.TestCase):
         assert name_to_code("GB2312") == "gb2312"
         assert name_to_code("PTCP154") == "ptcp154"
 
+    def test_probe(self):
+        path = self.new_subrip_file()
+        with open(path, "a", encoding="cp1252") as f:
+            f.write("\r\nÄö€\r\n")
+        encoding, text = aeidon.encodings.probe(path, ("ascii", "xxx", "cp1252"))
+        assert encoding == "cp1252"
+        assert text.endswith("\r\nÄö€\r\n")
+
+    def test_probe__bom(self):
+        path = self.new_subrip_file()
+        blob = open(path, "rb").read()
+        open(path, "wb").write(codecs.BOM_UTF8 + blob)
+        encoding, text = aeidon.encodings.probe(path, ("ascii",))
+        assert encoding == "utf_8_sig"
+        assert text == blob.decode("ascii")
+
+    def test_probe__unicode_error(self):
+        path = self.new_subrip_file()
+        with open(path, "a", encoding="utf_8") as f:
+            f.write("Äö€")
+        self.assert_raises(UnicodeError,
+                           aeidon.encodings.probe,
+                           path, ("ascii",))
+
+    def test__read_samples(self):
+        path = aeidon.temp.create()
+        with open(path, "wb") as f:
+            f.write(b"abcdefghi\n" * 1000)
+        samples = aeidon.encodings._read_samples(path, 10000)
+        assert samples == [b"abcdefghi\n" * 1000]
+        samples = aeidon.encodings._read_samples(path, 3000)
+        assert len(samples) == 3
+        assert samples[0] == b"abcdefghi\n" * 100
+        assert all(x.startswith(b"abc") for x in samples)
+        assert all(len(x) <= 1000 for x in samples)
+
+    def test__read_samples__utf_16(self):
+        path = aeidon.temp.create()
+        for code in ("utf_16_be", "utf_16_le"):
+            with open(path, "w", encoding=code) as f:
+                f.write("abcdefgh\n" * 1000)
+            samples = aeidon.encodings._read_samples(path, 3000)
+            assert len(samples) == 3
+            for sample in samples:
+                text = str(sample[:len(sample)//2*2], code)
+                assert text.startswith("abc")
+
     def test_translate_code(self):
         translate_code = aeidon.encodings.translate_code
         assert translate_code("johab") == "johab"
@@ -32,6 +32,50 @@ class TestSubtitleFile(aeidon.TestCase):
         newline = aeidon.newlines.UNIX
         self.file = PuppetSubtitleFile(path, "ascii", newline)
 
+    def test__iter_chunks(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_8", newline="\r\n") as f:
+            f.write("\u00e4" + text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
+        chunks = list(file._iter_chunks(size=3))
+        assert len(chunks) > 1
+        assert "".join(chunks) == "\u00e4" + text
+        assert file.newline == aeidon.newlines.WINDOWS
+
+    def test__join_utf_16_lines(self):
+        lines = ["a", "", "b", "", "c"]
+        assert list(self.file._join_utf_16_lines(lines)) == ["a", "b", "c"]
+        lines = ["a", "", "b", "c", "", "d"]
+        assert list(self.file._join_utf_16_lines(lines)) == lines
+
+    def test__trim_lines(self):
+        lines = ["", " ", "a", "", "b", "\t", ""]
+        lines = list(self.file._trim_lines(lines))
+        assert lines == ["a", "", "b"]
+
+    def test_read__compressed(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        file.path = aeidon.temp.create(".srt.xz")
+        file.write(subtitles, aeidon.documents.MAIN)
+        with open(file.path, "rb") as f:
+            assert f.read(6) == b"\xfd7zXZ\x00"
+        assert len(file.read()) == len(subtitles)
+
+    def test_read__text(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read().replace("\n", "\r\n")
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        file.set_text(text)
+        with open(path, "w") as f:
+            f.write("")
+        assert file.read()
+        assert file.newline == aeidon.newlines.WINDOWS
+
     def test_read__utf_16(self):
         path = self.new_subrip_file()
         with open(path, "r") as f:
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+import subprocess
+import sys
+
+
+class TestModule(aeidon.TestCase):
+
+    def import_aeidon(self, *options):
+        directory = os.path.dirname(os.path.dirname(aeidon.__file__))
+        command = [sys.executable, *options, "-c", "import aeidon"]
+        process = subprocess.run(command,
+                                 cwd=directory,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE,
+                                 universal_newlines=True,
+                                 check=True)
+
+        return process.stderr
+
+    def test___dir__(self):
+        assert "Project" in dir(aeidon)
+        assert "languages" in dir(aeidon)
+
+    def test___getattr__(self):
+        assert aeidon.Project is aeidon.project.Project
+        assert aeidon.languages.is_valid("en")
+
+    def test___getattr____missing(self):
+        self.assert_raises(AttributeError, getattr, aeidon, "xxx")
+
+    def test_import_time(self):
+        # Benchmark imports and make sure that lazy modules
+        # are not among those imported by a plain 'import aeidon'.
+        output = self.import_aeidon("-X", "importtime")
+        imported = [x.split("|")[-1].strip() for x in output.splitlines()]
+        for name in ("agents", "countries", "languages", "locales",
+                     "project", "scripts"):
+            assert "aeidon.{}".format(name) not in imported
+        assert "aeidon.calculator" in imported
+        assert "aeidon.files" in imported
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestIntervalIndex(aeidon.TestCase):
+
+    def new_subtitle(self, start, end):
+        subtitle = aeidon.Subtitle(aeidon.modes.TIME)
+        subtitle.start_seconds = start
+        subtitle.end_seconds = end
+        return subtitle
+
+    def setup_method(self, method):
+        self.subtitles = [self.new_subtitle(1, 10),
+                          self.new_subtitle(2, 3),
+                          self.new_subtitle(4, 5),
+                          self.new_subtitle(6, 7)]
+        self.index = aeidon.IntervalIndex(self.subtitles)
+
+    def test_get_at(self):
+        assert self.index.get_at(0) == []
+        assert self.index.get_at(2.5) == [0, 1]
+        assert self.index.get_at(5) == [0, 2]
+        assert self.index.get_at(11) == []
+
+    def test_get_at__unsorted(self):
+        self.subtitles.reverse()
+        index = aeidon.IntervalIndex(self.subtitles)
+        assert index.get_at(2.5) == [2, 3]
+
+    def test_get_next(self):
+        assert self.index.get_next(0) == 0
+        assert self.index.get_next(3) == 2
+        assert self.index.get_next(6) is None
+
+    def test_get_next_boundary(self):
+        assert self.index.get_next_boundary(0) == 1
+        assert self.index.get_next_boundary(1) == 2
+        assert self.index.get_next_boundary(2.5) == 3
+        assert self.index.get_next_boundary(3) == 4
+        assert self.index.get_next_boundary(7) == 10
+        assert self.index.get_next_boundary(10) is None
+
+    def test_get_overlapping(self):
+        assert self.index.get_overlapping(3.5, 4.5) == [0, 2]
+        assert self.index.get_overlapping(3, 6) == [0, 1, 2, 3]
+        assert self.index.get_overlapping(10.5, 20) == []
+
+    def test_get_previous(self):
+        assert self.index.get_previous(3) is None
+        assert self.index.get_previous(6) == 2
+        assert self.index.get_previous(20) == 3
+
+    def test_update(self):
+        assert self.index.update(2, 4, 12)
+        assert self.index.get_at(11) == [2]
+        assert not self.index.update(2, 8, 12)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestUndoJournal(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.journal = aeidon.UndoJournal(self.project)
+
+    def test_clear(self):
+        self.project.clear_texts((0,), aeidon.documents.MAIN)
+        self.journal.dump(self.project.undoables[0])
+        self.journal.clear()
+        assert not open(self.journal.path, "rb").read()
+        assert self.journal.size == 0
+
+    def test_compact(self):
+        self.project.clear_texts((0,), aeidon.documents.MAIN)
+        self.project.clear_texts((1,), aeidon.documents.MAIN)
+        spilled = [self.journal.dump(x) for x in self.project.undoables]
+        self.journal.discard(spilled[0])
+        self.journal.compact(spilled[1:])
+        assert self.journal.garbage == 0
+        assert self.journal.size == spilled[1].length
+        assert spilled[1].offset == 0
+        action = self.journal.load(spilled[1])
+        assert tuple(action.revert_args[0]) == (0,)
+
+    def test_discard(self):
+        self.project.clear_texts((0,), aeidon.documents.MAIN)
+        spilled = self.journal.dump(self.project.undoables[0])
+        self.journal.discard(spilled)
+        assert self.journal.garbage == spilled.length
+        assert self.journal.size == spilled.length
+
+    def test_dump(self):
+        self.project.remove_subtitles((0, 1))
+        action = self.project.undoables[0]
+        spilled = self.journal.dump(action)
+        assert spilled.description == action.description
+        assert spilled.length > 0
+
+    def test_load(self):
+        self.project.remove_subtitles((0, 1))
+        action = self.project.undoables[0]
+        spilled = self.journal.dump(action)
+        spilled.description = "test"
+        loaded = self.journal.load(spilled)
+        assert loaded.description == "test"
+        assert loaded.docs == action.docs
+        assert loaded.register is aeidon.registers.DO
+        assert loaded.revert_function == self.project.insert_subtitles
+        assert loaded.revert_args[0] == [0, 1]
+        subtitle = loaded.revert_args[1][0]
+        assert subtitle.main_text == action.revert_args[1][0].main_text
+        assert subtitle.calc is action.revert_args[1][0].calc
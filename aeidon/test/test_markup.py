@@ -45,6 +45,10 @@ class TestMarkup(aeidon.TestCase):
         text = "<font=sans>All things weird are normal\nin this whore of cities.</font>"
         assert self.markup.encode(text) == self.text
 
+    def test_encode__deep(self):
+        text = "<b>" * 5000 + "x" + "</b>" * 5000
+        assert self.markup.encode(text) == "x"
+
     def test_encode__i(self):
         text = "<i>All things weird are normal\nin this whore of cities.</i>"
         assert self.markup.encode(text) == self.text
@@ -56,3 +60,43 @@ class TestMarkup(aeidon.TestCase):
     def test_encode__u(self):
         text = "All things weird are normal\nin this whore of <u>cities</u>."
         assert self.markup.encode(text) == self.text
+
+    def test_has_markup_characters(self):
+        assert self.markup.has_markup_characters(self.text)
+        markup = aeidon.markups.new(aeidon.formats.MPL2)
+        assert markup.has_markup_characters("/All things")
+        assert not markup.has_markup_characters(self.text)
+
+    def test__decode_apply(self):
+        regex = self.markup._get_regex(r"\{([Yy]:b)\}(.*?)\{/\1\}")
+        text = "{y:b}a{Y:b}b{/Y:b}c{/y:b}{/y:b}"
+        text = self.markup._decode_apply(text, regex, "<b>{}</b>", (2,))
+        assert text == "<b>a<b>b</b>c</b>{/y:b}"
+
+    def test__decode_apply__deep(self):
+        regex = self.markup._get_regex(r"\{\\b1\}(.*?)\{\\b0\}")
+        text = "{\\b1}" * 5000 + "x" + "{\\b0}" * 5000
+        text = self.markup._decode_apply(text, regex, "<b>{}</b>", (1,))
+        assert text == "<b>" * 5000 + "x" + "</b>" * 5000
+
+    def test__decode_apply__search(self):
+        regex = self.markup._get_regex(r"<(b|B)>(.*?)</\1>")
+        assert self.markup._get_decode_tokenizer(regex, 2) is None
+        text = self.markup._decode_apply("<B>a</B><b>", regex, "[{}]", (2,))
+        assert text == "[a]<b>"
+
+    def test__get_regex(self):
+        regex = self.markup._get_regex(r"<i>")
+        assert regex.pattern == r"<i>"
+        assert self.markup._get_regex(r"<i>") is regex
+
+    def test__tokenize(self):
+        nodes = self.markup._tokenize("<b>a<b>b</b></i><color=#ffffff>c")
+        assert nodes[0] == ""
+        assert nodes[1][:2] == ["b", None]
+        assert nodes[1][2] is nodes[5]
+        assert nodes[3][2] is None
+        assert nodes[5][2] is nodes[1]
+        assert nodes[7][2] is None
+        assert nodes[9][:3] == ["color", "ffffff", None]
+        assert nodes[-1] == "c"
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestMarkupConverter(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.converter = aeidon.MarkupConverter(aeidon.formats.SUBRIP,
+                                                aeidon.formats.SSA)
+
+    def test_convert(self):
+        text = self.converter.convert("<i>All</i> things")
+        assert text == "{\\i1}All{\\i0} things"
+
+    def test_convert__cache(self):
+        text = self.converter.convert("<i>All</i> things")
+        assert self.converter.convert("<i>All</i> things") is text
+
+    def test_convert__plain(self):
+        text = self.converter.convert("All things {weird}")
+        assert text == "All things {weird}"
+        assert not self.converter._cache
+
+    def test_convert_many(self):
+        texts = ["All", "<b>things</b>", "weird", "<b>things</b>"]
+        assert self.converter.convert_many(texts) == [
+            "All", "{\\b1}things{\\b0}", "weird", "{\\b1}things{\\b0}"]
+
+    def test_shared(self):
+        converter = aeidon.MarkupConverter.shared(aeidon.formats.SUBRIP,
+                                                  aeidon.formats.SSA)
+
+        assert aeidon.MarkupConverter.shared(aeidon.formats.SUBRIP,
+                                             aeidon.formats.SSA) is converter
+        assert aeidon.MarkupConverter.shared(aeidon.formats.SSA,
+                                             aeidon.formats.SUBRIP) is not converter
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project()
+
+    def test___init__(self):
+        for agent_class, names in self.project._delegation_table:
+            for name in names:
+                method = getattr(self.project, name)
+                assert isinstance(method.__self__, agent_class)
+                assert not name in aeidon.Project.__dict__
+
+    def test___init____bound(self):
+        for name, method in self.project._delegations.items():
+            assert self.project.__dict__[name] is method
+
+    def test__delegation_table(self):
+        agent_classes = [x[0] for x in self.project._delegation_table]
+        assert len(agent_classes) == len(aeidon.agents.__all__)
+        for agent_class, names in self.project._delegation_table:
+            assert names is agent_class.get_exported_names()
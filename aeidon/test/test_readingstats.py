@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import math
+
+MAIN = aeidon.documents.MAIN
+
+
+class TestReadingStatistics(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.subtitles = []
+        for start, end, text in ((1, 2, "<i>0123456789</i>"),
+                                 (3, 5, "0123456789"),
+                                 (4, 6, ""),
+                                 (7, 7, "0123")):
+            subtitle = aeidon.Subtitle()
+            subtitle.start_seconds = start
+            subtitle.end_seconds = end
+            subtitle.main_text = text
+            self.subtitles.append(subtitle)
+        re_tag = aeidon.markups.SubRip().tag
+        self.stats = aeidon.ReadingStatistics(self.subtitles, MAIN, re_tag)
+
+    def test___getitem__(self):
+        assert self.stats[0] == (10, 1.0, 10.0, 1.0, False)
+        assert self.stats[1] == (10, 2.0, 5.0, -1.0, True)
+
+    def test___len__(self):
+        assert len(self.stats) == 4
+
+    def test_cps(self):
+        assert list(self.stats.cps[:3]) == [10.0, 5.0, 0.0]
+        assert math.isinf(self.stats.cps[3])
+
+    def test_gaps(self):
+        assert list(self.stats.gaps[:3]) == [1.0, -1.0, 1.0]
+        assert math.isinf(self.stats.gaps[3])
+
+    def test_gaps__empty(self):
+        stats = aeidon.ReadingStatistics([], MAIN)
+        assert len(stats.gaps) == len(stats) == 0
+
+    def test_get_overlapping(self):
+        assert self.stats.get_overlapping() == [1, 2]
+
+    def test_get_too_fast(self):
+        assert self.stats.get_too_fast(5) == [0, 3]
+
+    def test_lengths(self):
+        assert list(self.stats.lengths) == [10, 10, 0, 4]
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+from unittest.mock import patch
+
+
+class TestSubtitleCache(aeidon.TestCase):
+
+    def setup_method(self, method):
+        directory = aeidon.temp.create_directory()
+        self.cache = aeidon.SubtitleCache(directory)
+
+    def read(self, format):
+        path = self.new_temp_file(format)
+        file = aeidon.files.new(format, path, "ascii")
+        return file, self.cache.read(file)
+
+    def test_clear(self):
+        self.read(aeidon.formats.SUBRIP)
+        assert os.listdir(self.cache.directory)
+        self.cache.clear()
+        assert not os.listdir(self.cache.directory)
+
+    def test_read(self):
+        for format in aeidon.formats:
+            file, subtitles = self.read(format)
+            with patch.object(file, "read", side_effect=AssertionError):
+                assert self.cache.read(file) == subtitles
+            assert subtitles == file.__class__(file.path, "ascii").read()
+
+    def test_read__containers(self):
+        file, subtitles = self.read(aeidon.formats.ASS)
+        event_fields = file.event_fields
+        file.event_fields = ()
+        cached = self.cache.read(file)
+        assert file.event_fields == event_fields
+        for subtitle, original in zip(cached, subtitles):
+            assert vars(subtitle.ssa) == vars(original.ssa)
+
+    def test_read__evict(self):
+        self.cache.max_size = 1
+        self.read(aeidon.formats.SUBRIP)
+        self.read(aeidon.formats.MICRODVD)
+        assert len(os.listdir(self.cache.directory)) == 0
+
+    def test_read__file(self):
+        file, subtitles = self.read(aeidon.formats.SUBRIP)
+        file.header = "x"
+        file.newline = aeidon.newlines.MAC
+        self.cache.read(file)
+        assert file.header == ""
+        assert file.newline == aeidon.newlines.UNIX
@@ -16,6 +16,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import gzip
+import zipfile
 
 
 class TestModule(aeidon.TestCase):
@@ -34,6 +36,13 @@ class TestModule(aeidon.TestCase):
         text = open(path, "r").read()
         assert text == "test\n"
 
+    def test_atomic_open__compress(self):
+        path = aeidon.temp.create(".srt.gz")
+        with aeidon.util.atomic_open(path, "w", compress=True) as f:
+            f.write("test\n")
+        text = gzip.open(path, "rt").read()
+        assert text == "test\n"
+
     def test_compare_versions(self):
         assert aeidon.util.compare_versions("0.1.1", "0.1"  ) ==  1
         assert aeidon.util.compare_versions("0.2"  , "0.1"  ) ==  1
@@ -94,6 +103,32 @@ class TestModule(aeidon.TestCase):
         lst = aeidon.util.get_unique(lst, keep_last=True)
         assert lst == [5, 1, 3, 6, 4]
 
+    def test_open_read__gzip(self):
+        path = aeidon.temp.create(".srt.gz")
+        with gzip.open(path, "wt") as f:
+            f.write("test\r\n")
+        with aeidon.util.open_read(path, "r", newline="") as f:
+            assert f.read() == "test\r\n"
+        with aeidon.util.open_read(path, "rb") as f:
+            assert f.read() == b"test\r\n"
+
+    def test_open_read__gzip__corrupt(self):
+        path = aeidon.temp.create(".srt.gz")
+        with gzip.open(path, "wb") as f:
+            f.write(b"test\n" * 1000)
+        data = open(path, "rb").read()
+        with open(path, "wb") as f:
+            f.write(data[:len(data)//2])
+        with aeidon.util.open_read(path, "r") as f:
+            self.assert_raises(IOError, f.read)
+
+    def test_open_read__zip(self):
+        path = aeidon.temp.create(".zip")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("test.srt", "test\n")
+        with aeidon.util.open_read(path, "r") as f:
+            assert f.read() == "test\n"
+
     def test_read__basic(self):
         path = self.new_subrip_file()
         text = open(path, "r", encoding="ascii").read().strip()
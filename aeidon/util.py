@@ -20,7 +20,9 @@
 import aeidon
 import collections
 import contextlib
+import importlib
 import inspect
+import io
 import locale
 import mimetypes
 import os
@@ -33,6 +35,15 @@ import sys
 import traceback
 import urllib.parse
 
+# Extensions of compressed files and corresponding modules.
+COMPRESSED_FILE_EXTENSIONS = {
+    ".bz2": "bz2",
+    ".gz": "gzip",
+    ".lzma": "lzma",
+    ".xz": "lzma",
+    ".zip": "zipfile",
+}
+
 VIDEO_FILE_EXTENSIONS = [
     ".avi",
     ".flv",
@@ -52,7 +63,7 @@ def affirm(value):
         raise aeidon.AffirmationError
 
 @contextlib.contextmanager
-def atomic_open(path, mode="w", *args, **kwargs):
+def atomic_open(path, mode="w", *args, compress=False, **kwargs):
     """
     A context manager for atomically writing a file.
 
@@ -60,6 +71,10 @@ def atomic_open(path, mode="w", *args, **kwargs):
     fsynced and then renamed to replace the existing file. This should
     (probably) be atomic on any Unix system. On Windows, it should (probably)
     be atomic if using Python 3.3 or greater.
+
+    If `compress` is ``True`` and `path` has an extension of a compressed
+    file, the file is compressed on the fly. Zip archives are written with
+    a single file named as `path` without the ".zip" extension.
     """
     path = os.path.realpath(path)
     chars = list("abcdefghijklmnopqrstuvwxyz0123456789")
@@ -80,10 +95,17 @@ def atomic_open(path, mode="w", *args, **kwargs):
             with open(temp_path, "w") as f: pass
             st = os.stat(path)
             os.chmod(temp_path, stat.S_IMODE(st.st_mode))
-        with open(temp_path, mode, *args, **kwargs) as f:
-            yield f
-            f.flush()
-            os.fsync(f.fileno())
+        if compress and get_compression_module(path) is not None:
+            with open(temp_path, "wb") as raw:
+                with _open_compressed(raw, path, mode, *args, **kwargs) as f:
+                    yield f
+                raw.flush()
+                os.fsync(raw.fileno())
+        else:
+            with open(temp_path, mode, *args, **kwargs) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
         try:
             if hasattr(os, "replace"):
                 # os.replace was added in Python 3.3.
@@ -149,6 +171,51 @@ def connect(observer, observable, signal, *args):
         observable = getattr(observer, observable)
     return observable.connect(signal, method, *args)
 
+class _DecompressingReader(io.RawIOBase):
+
+    """
+    Raw binary stream reading from a decompressing file object.
+
+    Errors of corrupt files, which surface only when reading, e.g.
+    :exc:`lzma.LZMAError` or :exc:`zipfile.BadZipFile`, are raised as
+    :exc:`IOError` like any other failure to read a file.
+    """
+
+    def __init__(self, f):
+        """Initialize a :class:`_DecompressingReader` instance."""
+        io.RawIOBase.__init__(self)
+        self._f = f
+
+    def close(self):
+        """Close stream and the underlying file object."""
+        if not self.closed:
+            self._f.close()
+        io.RawIOBase.close(self)
+
+    def readable(self):
+        """Return ``True``."""
+        return True
+
+    def readinto(self, b):
+        """Read bytes into `b` and return amount read."""
+        with _translate_read_errors():
+            data = self._f.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Seek to `offset` and return new position."""
+        with _translate_read_errors():
+            return self._f.seek(offset, whence)
+
+    def seekable(self):
+        """Return ``True`` if stream supports seeking."""
+        return self._f.seekable()
+
+    def tell(self):
+        """Return current position."""
+        return self._f.tell()
+
 def detect_format(path, encoding):
     """
     Detect and return format of subtitle file at `path`.
@@ -159,7 +226,7 @@ def detect_format(path, encoding):
     Return an :attr:`aeidon.formats` enumeration item.
     """
     re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
-    with open(path, "r", encoding=encoding) as f:
+    with open_read(path, "r", encoding=encoding) as f:
         for line in f:
             for format, re_id in re_ids:
                 if re_id.search(line) is not None:
@@ -170,25 +237,11 @@ def detect_format(path, encoding):
 def detect_newlines(path):
     """Detect and return the newline type of file at `path` or ``None``."""
     try:
-        with open(path, "r", newline="") as f:
+        with open_read(path, "r", newline="") as f:
             f.read()
-            chars = f.newlines
+            return get_newline(f.newlines)
     except Exception:
         return None
-    if chars is None:
-        return None
-    if isinstance(chars, str):
-        return aeidon.newlines.find_item("value", chars)
-    if isinstance(chars, tuple):
-        if len(chars) == 1:
-            return aeidon.newlines.find_item("value", chars[0])
-        # This is not actually correct. If both CR and LF are detected,
-        # it could mean a mixture of Mac and Unix newlines on separate
-        # lines or one Windows newline in a mostly something else file.
-        # We could count the frequencies, but it's probably not worth
-        # the effort.
-        return aeidon.newlines.WINDOWS
-    return None
 
 @aeidon.deco.once
 def enchant_available():
@@ -231,6 +284,12 @@ def get_chardet_version():
     except Exception:
         return None
 
+def get_compression_module(path):
+    """Return module to decompress file at `path` or ``None``."""
+    extension = os.path.splitext(path)[1].lower()
+    if not extension in COMPRESSED_FILE_EXTENSIONS: return None
+    return importlib.import_module(COMPRESSED_FILE_EXTENSIONS[extension])
+
 @aeidon.deco.once
 def get_default_encoding(fallback="utf_8"):
     """Return the locale encoding or `fallback`."""
@@ -261,6 +320,39 @@ def get_encoding_alias(encoding):
         return aliases[encoding]
     return encoding
 
+@aeidon.deco.once
+def get_executor():
+    """
+    Return a shared executor for running blocking file operations.
+
+    The executor is a thread pool with the default amount of workers, shared
+    by all projects, which bounds the amount of concurrent operations.
+    """
+    import concurrent.futures
+    return concurrent.futures.ThreadPoolExecutor(thread_name_prefix="aeidon")
+
+def get_newline(chars):
+    """
+    Return the newline type of `chars` or ``None``.
+
+    `chars` should be the :attr:`newlines` attribute of a file object
+    after reading in universal newlines mode.
+    """
+    if chars is None:
+        return None
+    if isinstance(chars, str):
+        return aeidon.newlines.find_item("value", chars)
+    if isinstance(chars, tuple):
+        if len(chars) == 1:
+            return aeidon.newlines.find_item("value", chars[0])
+        # This is not actually correct. If both CR and LF are detected,
+        # it could mean a mixture of Mac and Unix newlines on separate
+        # lines or one Windows newline in a mostly something else file.
+        # We could count the frequencies, but it's probably not worth
+        # the effort.
+        return aeidon.newlines.WINDOWS
+    return None
+
 def get_ranges(lst):
     """
     Return a list of ranges in list of integers.
@@ -348,6 +440,58 @@ def normalize_newlines(text):
     re_newline_char = re.compile(r"\r\n?")
     return re_newline_char.sub("\n", text)
 
+@contextlib.contextmanager
+def _open_compressed(raw, path, mode, *args, **kwargs):
+    """Return file object `raw` opened for writing compressed as `path`."""
+    module = get_compression_module(path)
+    if module.__name__ != "zipfile":
+        # Compression modules use binary mode by default.
+        if not "b" in mode:
+            mode = mode.replace("t", "") + "t"
+        with module.open(raw, mode, *args, **kwargs) as f:
+            yield f
+        return
+    name = os.path.basename(os.path.splitext(path)[0])
+    with module.ZipFile(raw, "w", module.ZIP_DEFLATED) as archive:
+        with archive.open(name, "w") as member:
+            if "b" in mode:
+                yield member
+                return
+            with io.TextIOWrapper(member, *args, **kwargs) as f:
+                yield f
+
+def _open_decompressed(path):
+    """Return a binary file object of decompressed content of `path`."""
+    module = get_compression_module(path)
+    if module.__name__ != "zipfile":
+        return module.open(path, "rb")
+    with module.ZipFile(path) as archive:
+        names = [x.filename for x in archive.infolist() if not x.is_dir()]
+        if not names:
+            raise IOError("No files in archive {}".format(repr(path)))
+        # Member remains readable after closing archive.
+        return archive.open(names[0])
+
+def open_read(path, mode="r", encoding=None, newline=None):
+    """
+    Open file at `path` for reading, decompressing if needed.
+
+    Compressed files are recognized by extension, see
+    :attr:`COMPRESSED_FILE_EXTENSIONS`, and decompressed while reading, so
+    that reading only the start of a file is cheap. Of zip archives, the
+    first file is read.
+    Raise :exc:`IOError` if reading fails.
+    """
+    if get_compression_module(path) is None:
+        if "b" in mode:
+            return open(path, mode)
+        return open(path, mode, encoding=encoding, newline=newline)
+    with _translate_read_errors():
+        f = io.BufferedReader(_DecompressingReader(_open_decompressed(path)))
+    if "b" in mode:
+        return f
+    return io.TextIOWrapper(f, encoding=encoding, newline=newline)
+
 def path_to_uri(path):
     """Convert local filepath to URI."""
     if sys.platform == "win32":
@@ -470,6 +614,17 @@ def title_to_lower_case(title_name):
         lower_name += char.lower()
     return lower_name
 
+@contextlib.contextmanager
+def _translate_read_errors():
+    """Raise errors of reading corrupt compressed files as :exc:`IOError`."""
+    try:
+        yield
+    except OSError:
+        raise
+    except Exception as error:
+        # e.g. EOFError, lzma.LZMAError, zipfile.BadZipFile.
+        raise IOError(str(error))
+
 def uri_to_path(uri):
     """Convert `uri` to local filepath."""
     uri = urllib.parse.unquote(uri)
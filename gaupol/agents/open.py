@@ -20,6 +20,8 @@
 import aeidon
 import gaupol
 import os
+import sys
+import threading
 
 from aeidon.i18n   import _
 from gi.repository import Gtk
@@ -27,7 +29,18 @@ from gi.repository import Gtk
 
 class OpenAgent(aeidon.Delegate):
 
-    """Opening subtitle files and creating new projects."""
+    """
+    Opening subtitle files and creating new projects.
+
+    :ivar _open_jobs: Dictionary of paths not yet opened by job, where jobs
+       are :class:`threading.Event` instances, one for each batch of main
+       files being opened in the background, set to cancel
+    """
+
+    def __init__(self, master):
+        """Initialize an :class:`OpenAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._open_jobs = {}
 
     @aeidon.deco.export
     def add_page(self, page):
@@ -97,6 +110,12 @@ class OpenAgent(aeidon.Delegate):
         page.project.unblock("action-done")
         return tuple(indices)
 
+    @aeidon.deco.export
+    def cancel_open(self):
+        """Cancel opening main files in the background."""
+        for job in self._open_jobs:
+            job.set()
+
     def _check_file_exists(self, path):
         """Raise :exc:`gaupol.Default` if no file at `path`."""
         gaupol.util.raise_default(not os.path.isfile(path))
@@ -111,6 +130,12 @@ class OpenAgent(aeidon.Delegate):
             message = _('File "{}" is already open')
             self.flash_message(message.format(os.path.basename(path)))
             raise gaupol.Default
+        for paths in self._open_jobs.values():
+            if not path in paths: continue
+            # File is still being read in the background.
+            message = _('File "{}" is already open')
+            self.flash_message(message.format(os.path.basename(path)))
+            raise gaupol.Default
 
     def _check_file_size(self, path):
         """Raise :exc:`gaupol.Default` if size of file at `path` too large."""
@@ -173,6 +198,42 @@ class OpenAgent(aeidon.Delegate):
         gaupol.util.iterate_main()
         self.append_file(paths[0], encoding)
 
+    def _on_file_read(self, job, path, index, total, project, sort_count,
+                      encoding, error):
+        """Add page for main file read in the background."""
+        self._open_jobs[job].remove(path)
+        if job.is_set(): return
+        message = _("Opening files… {done:d}/{total:d}")
+        self.show_message(message.format(done=index+1, total=total))
+        if isinstance(error, (IOError,
+                              UnicodeError,
+                              aeidon.FormatError,
+                              aeidon.ParseError)):
+            return self._show_open_error_dialog(path, encoding, error)
+        if error is not None:
+            # Report unexpected errors, e.g. bugs in readers, the same
+            # way as if they had been raised in the main thread.
+            return sys.excepthook(type(error), error, error.__traceback__)
+        with aeidon.util.silent(gaupol.Default):
+            self._check_sort_count(path, sort_count)
+            page = gaupol.Page(project=project)
+            self.add_page(page)
+            format = page.project.main_file.format
+            self.add_to_recent_files(path, format, aeidon.documents.MAIN)
+            # Refresh view to get row heights etc. correct.
+            page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+            self.update_gui()
+
+    def _on_files_read(self, job, callback):
+        """Finish opening main files in the background."""
+        del self._open_jobs[job]
+        if not self._open_jobs:
+            self.show_message(None)
+            gaupol.util.set_cursor_normal(self.window)
+        self.update_gui()
+        if callback is not None and not job.is_set():
+            callback()
+
     @aeidon.deco.export
     def _on_new_project_activate(self, *args):
         """Create a new project."""
@@ -191,9 +252,14 @@ class OpenAgent(aeidon.Delegate):
         paths = list(map(aeidon.util.uri_to_path, uris))
         videos = list(filter(aeidon.util.is_video_file, paths))
         subtitles = list(set(paths) - set(videos))
-        self.open_main(subtitles)
-        if self.get_current_page() and len(videos) == 1:
-            self.load_video(videos[0])
+        def load_video():
+            if self.get_current_page() and len(videos) == 1:
+                self.load_video(videos[0])
+        if not subtitles:
+            return load_video()
+        if self.open_main(subtitles, callback=load_video) is None:
+            # Nothing to open, e.g. subtitles already open.
+            load_video()
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -250,36 +316,59 @@ class OpenAgent(aeidon.Delegate):
         basename = os.path.basename(path)
         page = (gaupol.Page() if doc == aeidon.documents.MAIN
                 else self.get_current_page())
-        for encoding in encodings:
-            with aeidon.util.silent(UnicodeError):
-                n = self._try_open_file(page, doc, path, encoding)
-                self._check_sort_count(path, n)
-                return page
-        # Report if all codecs failed to decode file.
-        self._show_encoding_error_dialog(basename)
-        raise gaupol.Default
+        try:
+            # Decode file once with the first encoding that succeeds,
+            # instead of trying to open the file with each encoding.
+            encoding, text = aeidon.encodings.probe(path, encodings)
+        except IOError as error:
+            self._show_io_error_dialog(basename, str(error))
+            raise gaupol.Default
+        except UnicodeError:
+            # Report if all codecs failed to decode file.
+            self._show_encoding_error_dialog(basename)
+            raise gaupol.Default
+        n = self._try_open_file(page, doc, path, encoding, text=text)
+        self._check_sort_count(path, n)
+        return page
 
     @aeidon.deco.export
-    @aeidon.deco.silent(gaupol.Default)
-    def open_main(self, path, encoding=None):
-        """Open file at `path` as a main file."""
+    def open_main(self, path, encoding=None, callback=None):
+        """
+        Open file at `path` as a main file.
+
+        `path` can also be a list of paths to open multiple files. Files are
+        read and parsed in a background thread, with a page added as soon as
+        each file is done. Return a :class:`threading.Event`, which can be set
+        to cancel opening or ``None`` if no files are to be opened. `callback`
+        is called without arguments once all files have been opened.
+        """
         if gaupol.fields.TRAN_TEXT in gaupol.conf.editor.visible_fields:
             gaupol.conf.editor.visible_fields.remove(gaupol.fields.TRAN_TEXT)
         encodings = self._get_encodings(encoding)
-        gaupol.util.set_cursor_busy(self.window)
+        paths = []
         for path in aeidon.util.flatten([path]):
+            # Do checks requiring user interaction before reading files,
+            # stopping at the first cancelled or failed file.
+            if path in paths: continue
             try:
-                page = self._open_file(path, encodings, aeidon.documents.MAIN)
+                self._check_file_exists(path)
+                self._check_file_not_open(path)
+                self._check_file_size(path)
             except gaupol.Default:
-                gaupol.util.set_cursor_normal(self.window)
-                raise # gaupol.Default
-            self.add_page(page)
-            format = page.project.main_file.format
-            self.add_to_recent_files(path, format, aeidon.documents.MAIN)
-            # Refresh view to get row heights etc. correct.
-            page.view.set_focus(0, page.view.columns.MAIN_TEXT)
-        gaupol.util.set_cursor_normal(self.window)
-        self.update_gui()
+                break
+            paths.append(path)
+        if not paths: return None
+        job = threading.Event()
+        self._open_jobs[job] = list(paths)
+        gaupol.util.set_cursor_busy(self.window)
+        message = _("Opening files… {done:d}/{total:d}")
+        self.show_message(message.format(done=0, total=len(paths)))
+        framerate = gaupol.conf.editor.framerate
+        args = (job, paths, encodings, framerate, callback)
+        thread = threading.Thread(target=self._read_files, args=args)
+        thread.daemon = True
+        thread.start()
+        return job
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -297,6 +386,38 @@ class OpenAgent(aeidon.Delegate):
         self.add_to_recent_files(path, format, aeidon.documents.TRAN)
         gaupol.util.set_cursor_normal(self.window)
 
+    def _read_file(self, path, encodings, framerate):
+        """
+        Read main file at `path` to a new project.
+
+        Return project, sort count, encoding and error or ``None``. This is
+        called in a background thread and must not access anything but the
+        arguments, since neither GTK nor the application are thread-safe.
+        """
+        encoding = None
+        try:
+            encoding, text = aeidon.encodings.probe(path, encodings)
+            project = aeidon.Project(framerate)
+            sort_count = project.open_main(path, encoding, text=text)
+            return project, sort_count, encoding, None
+        except Exception as error:
+            # Pass all errors to the main thread to be reported there,
+            # any uncaught error would end the thread silently.
+            return None, 0, encoding, error
+
+    def _read_files(self, job, paths, encodings, framerate, callback):
+        """Read main files at `paths` in a background thread."""
+        try:
+            for i, path in enumerate(paths):
+                if job.is_set(): break
+                result = self._read_file(path, encodings, framerate)
+                gaupol.util.idle_add(
+                    self._on_file_read, job, path, i, len(paths), *result)
+
+        finally:
+            # Always finish the job to restore the cursor and status.
+            gaupol.util.idle_add(self._on_files_read, job, callback)
+
     def _select_files(self, title, doc):
         """Show a :class:`gaupol.OpenDialog` to select files."""
         gaupol.util.set_cursor_busy(self.window)
@@ -340,6 +461,26 @@ class OpenAgent(aeidon.Delegate):
         dialog.set_default_response(Gtk.ResponseType.OK)
         gaupol.util.flash_dialog(dialog)
 
+    def _show_open_error_dialog(self, path, encoding, error):
+        """Show an error dialog after failing to open file at `path`."""
+        basename = os.path.basename(path)
+        if isinstance(error, aeidon.FormatError):
+            return self._show_format_error_dialog(basename)
+        if isinstance(error, IOError):
+            return self._show_io_error_dialog(basename, str(error))
+        if isinstance(error, UnicodeError):
+            # Report if all codecs failed to decode file.
+            return self._show_encoding_error_dialog(basename)
+        if isinstance(error, aeidon.ParseError):
+            bom_encoding = aeidon.encodings.detect_bom(path)
+            encoding = bom_encoding or encoding
+            try:
+                format = aeidon.util.detect_format(path, encoding)
+            except Exception:
+                return self._show_format_error_dialog(basename)
+            return self._show_parse_error_dialog(basename, format)
+        raise error
+
     def _show_parse_error_dialog(self, basename, format):
         """Show an error dialog after failing to parse file."""
         title = _('Failed to parse file "{}"').format(basename)
@@ -388,21 +529,9 @@ class OpenAgent(aeidon.Delegate):
 
     def _try_open_file(self, page, doc, path, encoding, **kwargs):
         """Try to open file at `path` and return subtitle sort count."""
-        if encoding == "auto":
-            encoding = aeidon.encodings.detect(path)
-            if encoding is None: raise UnicodeError
         kwargs["align_method"] = gaupol.conf.file.align_method
-        basename = os.path.basename(path)
         try:
             return page.project.open(doc, path, encoding, **kwargs)
-        except aeidon.FormatError:
-            self._show_format_error_dialog(basename)
-        except IOError as error:
-            self._show_io_error_dialog(basename, str(error))
-        except aeidon.ParseError:
-            bom_encoding = aeidon.encodings.detect_bom(path)
-            encoding = bom_encoding or encoding
-            with aeidon.util.silent(Exception):
-                format = aeidon.util.detect_format(path, encoding)
-            self._show_parse_error_dialog(basename, format)
+        except (aeidon.FormatError, IOError, aeidon.ParseError) as error:
+            self._show_open_error_dialog(path, encoding, error)
         raise gaupol.Default
@@ -78,7 +78,51 @@ class TestOpenAgent(gaupol.TestCase):
     def test_open_main(self):
         n = len(self.application.pages)
         path = self.new_subrip_file()
-        self.application.open_main(path)
+        job = self.application.open_main(path)
+        while job in self.delegate._open_jobs:
+            Gtk.main_iteration()
+        assert len(self.application.pages) == n+1
+
+    def test_open_main__cancel(self):
+        n = len(self.application.pages)
+        paths = [self.new_subrip_file() for i in range(3)]
+        job = self.application.open_main(paths)
+        self.application.cancel_open()
+        while job in self.delegate._open_jobs:
+            Gtk.main_iteration()
+        assert len(self.application.pages) == n
+
+    def test_open_main__error(self):
+        n = len(self.application.pages)
+        path = self.new_subrip_file()
+        def probe(*args, **kwargs):
+            raise ValueError
+        with patch("aeidon.encodings.probe", probe):
+            with patch("sys.excepthook") as excepthook:
+                job = self.application.open_main(path)
+                while job in self.delegate._open_jobs:
+                    Gtk.main_iteration()
+        assert len(self.application.pages) == n
+        assert excepthook.called
+
+    def test_open_main__multiple(self):
+        n = len(self.application.pages)
+        paths = [self.new_subrip_file() for i in range(3)]
+        called = []
+        callback = lambda: called.append(1)
+        job = self.application.open_main(paths, callback=callback)
+        while job in self.delegate._open_jobs:
+            Gtk.main_iteration()
+        assert len(self.application.pages) == n+3
+        assert called == [1]
+
+    def test_open_main__reading(self):
+        n = len(self.application.pages)
+        path = self.new_subrip_file()
+        job = self.application.open_main(path)
+        assert self.application.open_main(path) is None
+        while job in self.delegate._open_jobs:
+            Gtk.main_iteration()
         assert len(self.application.pages) == n+1
 
     def test_open_translation(self):
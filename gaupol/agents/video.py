@@ -32,28 +32,23 @@ with aeidon.util.silent(Exception):
 
 class VideoAgent(aeidon.Delegate):
 
-    """Loading and interacting with video."""
+    """
+    Loading and interacting with video.
+
+    :ivar _subtitle_handler: ID of the next subtitle overlay update or ``None``
+
+    The subtitle overlay is not polled, but updated once at each position
+    where the subtitles shown change, as found from the interval index of the
+    project, and again after playing, pausing or editing subtitles and, since
+    position is reported correctly only then, once the player's seek is done.
+    """
 
     def __init__(self, master):
         """Initialize an :class:`VideoAgent` instance."""
         aeidon.Delegate.__init__(self, master)
-        # Maintain an up-to-date cache of subtitle positions in seconds and
-        # subtitle texts in order to allow fast polled updates in video player.
-        # This cache must be updated when page or subtitle data changes.
-        self._cache = []
+        self._subtitle_handler = None
         self._update_handlers = []
 
-    def _clear_subtitle_cache(self):
-        """Clear subtitle position and text cache."""
-        self._cache = []
-
-    def _init_cache_updates(self):
-        """Initialize cache updates on application signals."""
-        self.connect("page-added",    self._update_subtitle_cache)
-        self.connect("page-changed",  self._update_subtitle_cache)
-        self.connect("page-closed",   self._update_subtitle_cache)
-        self.connect("page-switched", self._update_subtitle_cache)
-
     def _init_player_toolbar(self):
         """Initialize the video player toolbar."""
         self.player_toolbar = Gtk.Toolbar()
@@ -127,6 +122,7 @@ class VideoAgent(aeidon.Delegate):
         """Initialize the video player and related widgets."""
         vbox = gaupol.util.new_vbox(spacing=0)
         self.player = gaupol.VideoPlayer()
+        aeidon.util.connect(self, "player", "seek-done")
         aeidon.util.connect(self, "player", "state-changed")
         gaupol.util.pack_start_expand(vbox, self.player.widget)
         self._init_player_toolbar()
@@ -142,15 +138,22 @@ class VideoAgent(aeidon.Delegate):
         self.paned.set_position(int(size/2))
         self.get_action("toggle-player").set_state(True)
 
+    def _init_subtitle_updates(self):
+        """Initialize subtitle overlay updates on application signals."""
+        self.connect("page-added",    self._update_subtitle_soon)
+        self.connect("page-changed",  self._update_subtitle_soon)
+        self.connect("page-closed",   self._update_subtitle_soon)
+        self.connect("page-switched", self._update_subtitle_soon)
+
     def _init_update_handlers(self):
         """Initialize timed updates of widgets."""
         while self._update_handlers:
             GLib.source_remove(self._update_handlers.pop())
         self._update_handlers = [
-            GLib.timeout_add( 10, self._on_player_update_subtitle),
             GLib.timeout_add( 50, self._on_player_update_seekbar),
             GLib.timeout_add(100, self._on_player_update_volume),
         ]
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def load_video(self, path):
@@ -159,9 +162,8 @@ class VideoAgent(aeidon.Delegate):
         page.project.video_path = path
         if self.player is None:
             self._init_player_widgets()
-            self._init_cache_updates()
+            self._init_subtitle_updates()
             self._init_update_handlers()
-            self._update_subtitle_cache()
         else: # Player exists
             if self.player.is_playing():
                 self.get_action("play-pause").activate()
@@ -214,6 +216,11 @@ class VideoAgent(aeidon.Delegate):
         start = page.project.subtitles[rows[0]].start_seconds - offset
         end = page.project.subtitles[rows[-1]].end_seconds + offset
         self.player.play_segment(start, end)
+        self._update_subtitle_soon()
+
+    def _on_player_seek_done(self, player):
+        """Update subtitle overlay for the new position."""
+        self._update_subtitle_soon()
 
     def _on_player_state_changed(self, player, state):
         """Update UI to match `state` of `player`."""
@@ -221,6 +228,7 @@ class VideoAgent(aeidon.Delegate):
             "media-playback-pause"
             if state == Gst.State.PLAYING
             else "media-playback-start")
+        self._update_subtitle_soon()
 
     def _on_player_update_seekbar(self, data=None):
         """Update seekbar from video position."""
@@ -232,19 +240,33 @@ class VideoAgent(aeidon.Delegate):
         return True # to be called again.
 
     def _on_player_update_subtitle(self, data=None):
-        """Update subtitle overlay from video position."""
+        """Update subtitle overlay and schedule the next update."""
+        self._subtitle_handler = None
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None:
-            return True # to be called again.
-        subtitles = list(filter(lambda x: x[0] <= pos <= x[1], self._cache))
-        if subtitles:
-            text = subtitles[-1][2]
+            # Position is not available while the pipeline
+            # is being set up, try again a bit later.
+            self._update_subtitle_soon(delay=100)
+            return False # to not be called again.
+        page = self.get_current_page()
+        index = (page.project.get_interval_index()
+                 if page is not None else None)
+        indices = (index.get_at(pos) if index is not None else [])
+        if indices:
+            text = page.project.subtitles[indices[-1]].main_text
             if text != self.player.subtitle_text_raw:
                 self.player.subtitle_text = text
         else:
             if self.player.subtitle_text:
                 self.player.subtitle_text = ""
-        return True # to be called again.
+        bound = (index.get_next_boundary(pos)
+                 if index is not None and self.player.is_playing()
+                 else None)
+        if bound is not None:
+            # If the video lags behind, we'll be called early,
+            # see no change and schedule again for the rest.
+            self._update_subtitle_soon(delay=int((bound - pos) * 1000) + 1)
+        return False # to not be called again.
 
     def _on_player_update_volume(self, data=None):
         """Update volume from player."""
@@ -259,6 +281,7 @@ class VideoAgent(aeidon.Delegate):
         pos = pos - gaupol.conf.video_player.seek_length
         pos = max(pos, 0)
         self.player.seek(pos)
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def _on_seek_forward_activate(self, *args):
@@ -270,22 +293,29 @@ class VideoAgent(aeidon.Delegate):
         position = position + gaupol.conf.video_player.seek_length
         position = min(position, duration)
         self.player.seek(position)
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def _on_seek_next_activate(self, *args):
         """Seek to the start of the next subtitle."""
+        page = self.get_current_page()
         pos = self.player.get_position(aeidon.modes.SECONDS)
-        subtitles = list(filter(lambda x: x[0] > pos + 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[0][0])
+        if page is None or pos is None: return
+        index = page.project.get_interval_index().get_next(pos + 0.001)
+        if index is None: return
+        self.player.seek(page.project.subtitles[index].start_seconds)
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def _on_seek_previous_activate(self, *args):
         """Seek to the start of the previous subtitle."""
+        page = self.get_current_page()
         pos = self.player.get_position(aeidon.modes.SECONDS)
-        subtitles = list(filter(lambda x: x[1] < pos - 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[-1][0])
+        if page is None or pos is None: return
+        index = page.project.get_interval_index().get_previous(pos - 0.001)
+        if index is None: return
+        self.player.seek(page.project.subtitles[index].start_seconds)
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def _on_seek_selection_end_activate(self, *args):
@@ -295,6 +325,7 @@ class VideoAgent(aeidon.Delegate):
         pos = page.project.subtitles[rows[-1]].end_seconds
         offset = gaupol.conf.video_player.context_length
         self.player.seek(pos - offset)
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def _on_seek_selection_start_activate(self, *args):
@@ -304,6 +335,7 @@ class VideoAgent(aeidon.Delegate):
         pos = page.project.subtitles[rows[0]].start_seconds
         offset = gaupol.conf.video_player.context_length
         self.player.seek(pos - offset)
+        self._update_subtitle_soon()
 
     def _on_seekbar_change_value(self, seekbar, scroll, value, data=None):
         """Seek to specified position in video."""
@@ -311,6 +343,7 @@ class VideoAgent(aeidon.Delegate):
         duration = self.player.get_duration(aeidon.modes.SECONDS)
         if duration is None: return
         self.player.seek(value * duration)
+        self._update_subtitle_soon()
 
     @aeidon.deco.export
     def _on_set_audio_language_activate(self, action, parameter):
@@ -355,10 +388,11 @@ class VideoAgent(aeidon.Delegate):
                 action = self.get_action("set-audio-language")
                 action.set_state(str(i))
 
-    def _update_subtitle_cache(self, *args, **kwargs):
-        """Update subtitle position and text cache."""
-        page = self.get_current_page()
-        if self.player is None or page is None:
-            return self._clear_subtitle_cache()
-        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
-                       for x in page.project.subtitles]
+    def _update_subtitle_soon(self, *args, delay=0):
+        """Replace scheduled subtitle overlay update with one after `delay`."""
+        if self._subtitle_handler is not None:
+            GLib.source_remove(self._subtitle_handler)
+            self._subtitle_handler = None
+        if self.player is None: return
+        self._subtitle_handler = GLib.timeout_add(
+            delay, self._on_player_update_subtitle)
@@ -53,7 +53,12 @@ class ApplicationManager(Gtk.Application):
         """Initialize application and open files from `args`."""
         application = gaupol.Application()
         paths = list(map(os.path.abspath, args))
-        application.open_main(paths, opts.encoding)
+        callback = lambda: self._init_files(application, opts)
+        if application.open_main(paths, opts.encoding, callback) is None:
+            callback()
+
+    def _init_files(self, application, opts):
+        """Open translation and video files after opening main files."""
         page = application.get_current_page()
         if page is None: return
         if opts.translation_file is not None:
@@ -74,6 +79,8 @@ class ApplicationManager(Gtk.Application):
         gaupol.conf.path = os.path.join(
             aeidon.CONFIG_HOME_DIR, "gaupol.conf")
         gaupol.conf.read_from_file()
+        aeidon.encodings.detected_cache_path = os.path.join(
+            aeidon.DATA_HOME_DIR, "cache", "encodings.json")
         if (gaupol.conf.general.dark_theme or
             os.getenv("GTK_THEME", "").endswith(":dark")):
             Gtk.Settings.get_default().set_property(
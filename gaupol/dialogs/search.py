@@ -46,6 +46,7 @@ class SearchDialog(gaupol.BuilderDialog):
     """
     Dialog for searching for and replacing text.
 
+    :ivar _counts: Dictionary mapping pages to amounts of matches
     :ivar _handle_page_changes: ``True`` to invalidate search on page changes
     :ivar _match_doc: :attr:`gaupol.documents` item of the last match
     :ivar _match_page: :class:`gaupol.Page` instance of the last match
@@ -79,6 +80,7 @@ class SearchDialog(gaupol.BuilderDialog):
         """Initialize a :class:`SearchDialog` instance."""
         gaupol.BuilderDialog.__init__(self, "search-dialog.ui")
         self.application = application
+        self._counts = {}
         self._handle_page_changes = True
         self._match_doc = None
         self._match_page = None
@@ -234,6 +236,7 @@ class SearchDialog(gaupol.BuilderDialog):
         """Initialize signal handlers."""
         aeidon.util.connect(self, "_pattern_entry", "changed")
         aeidon.util.connect(self, "application", "page-changed")
+        aeidon.util.connect(self, "application", "page-closed")
         callback = lambda *args: args[-1]._update_search_targets()
         self.application.connect("page-added", callback, self)
         gaupol.conf.search.connect("notify::fields", callback, self)
@@ -299,6 +302,8 @@ class SearchDialog(gaupol.BuilderDialog):
 
     def _on_application_page_changed(self, application, page):
         """Invalidate the current search if underlying data has changed."""
+        # Amounts of matches change with any edit, including replacing.
+        self._counts.clear()
         # If data in page was changed from outside the search dialog,
         # the current search must be invalidated to avoid making edits
         # (especially via the text view's focus-out handler) based on data
@@ -309,6 +314,10 @@ class SearchDialog(gaupol.BuilderDialog):
             if self._match_page is not None:
                 self._reset_properties()
 
+    def _on_application_page_closed(self, application, page):
+        """Remove the cached amount of matches in `page`."""
+        self._counts.pop(page, None)
+
     def _on_current_radio_toggled(self, radio_button):
         """Save search target."""
         gaupol.conf.search.target = self._get_target()
@@ -320,6 +329,7 @@ class SearchDialog(gaupol.BuilderDialog):
     def _on_ignore_case_check_toggled(self, check_button):
         """Save ignore case setting."""
         gaupol.conf.search.ignore_case = check_button.get_active()
+        self._counts.clear()
 
     def _on_main_check_toggled(self, check_button):
         """Save search target."""
@@ -334,6 +344,7 @@ class SearchDialog(gaupol.BuilderDialog):
 
     def _on_pattern_entry_changed(self, entry):
         """Update action sensitivities."""
+        self._counts.clear()
         have_pattern = bool(entry.get_text())
         self._next_button.set_sensitive(have_pattern)
         self._previous_button.set_sensitive(have_pattern)
@@ -349,6 +360,7 @@ class SearchDialog(gaupol.BuilderDialog):
         """Save regular expression setting."""
         use_regex = check_button.get_active()
         gaupol.conf.search.regex = use_regex
+        self._counts.clear()
         self.set_response_sensitive(Gtk.ResponseType.HELP, use_regex)
 
     def _on_replace_all_button_clicked(self, *args):
@@ -529,6 +541,15 @@ class SearchDialog(gaupol.BuilderDialog):
         page.view.set_focus(row, col)
         page.view.scroll_to_row(row)
         self._replace_button.set_sensitive(True)
+        # Count matches only once per pattern and target,
+        # not again on every find next and previous.
+        if page not in self._counts:
+            self._counts[page] = page.project.find_all(count=True)
+        count = self._counts[page]
+        self._statuslabel.flash_text(n_(
+            "Found {:d} occurence",
+            "Found {:d} occurences",
+            count).format(count))
 
     def _set_text(self, page, row, doc, match_span):
         """Set subtitle text to text view."""
@@ -571,6 +592,7 @@ class SearchDialog(gaupol.BuilderDialog):
                         gaupol.conf.search.fields))
 
         wrap = (gaupol.conf.search.target != gaupol.targets.ALL)
+        self._counts.clear()
         for page in self.application.pages:
             page.project.set_search_target(None, docs, wrap)
 
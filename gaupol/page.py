@@ -50,8 +50,13 @@ class Page(aeidon.Observable):
     """
     signals = ("close-request", "view-created")
 
-    def __init__(self, count=0):
-        """Initialize a :class:`Page` instance."""
+    def __init__(self, count=0, project=None):
+        """
+        Initialize a :class:`Page` instance.
+
+        `project` can be an already opened :class:`aeidon.Project` instance
+        to use instead of a new blank one.
+        """
         aeidon.Observable.__init__(self)
         self.edit_mode = gaupol.conf.editor.mode
         self.project = None
@@ -59,10 +64,12 @@ class Page(aeidon.Observable):
         self.tab_widget = None
         self.untitle = _("Untitled {:d}").format(count)
         self.view = gaupol.View(self.edit_mode)
-        self._init_project()
+        self._init_project(project)
         self._init_widgets()
         self._init_signal_handlers()
         self.update_tab_label()
+        if project is not None:
+            self.reload_view_all()
         self.emit("view-created", self.view)
 
     def document_to_text_column(self, doc):
@@ -144,10 +151,15 @@ class Page(aeidon.Observable):
                 basename = basename[:-len(extension)]
         return _("{} translation").format(basename)
 
-    def _init_project(self):
+    def _init_project(self, project=None):
         """Initialize :class:`aeidon.Project` with proper properties."""
         framerate = gaupol.conf.editor.framerate
-        self.project = aeidon.Project(framerate)
+        self.project = (project if project is not None else
+                        aeidon.Project(framerate))
+        # Keep only recent undoable actions in memory.
+        self.project.undo_memory_limit = 1000
+        # Merge successive keystroke edits into one undoable action.
+        self.project.undo_merge_window = 1
 
     def _init_signal_handlers(self):
         """Initialize signal handlers."""
@@ -50,10 +50,11 @@ class VideoPlayer(aeidon.Observable):
     :ivar widget: :class:`Gtk.DrawingArea` used to render video
 
     Signals and their arguments for callback functions:
+     * ``seek-done``: player
      * ``state-changed``: player new state
     """
 
-    signals = ("state-changed",)
+    signals = ("seek-done", "state-changed")
 
     def __init__(self):
         """Initialize a :class:`VideoPlayer` instance."""
@@ -149,6 +150,7 @@ class VideoPlayer(aeidon.Observable):
         """Initialize the GStreamer message bus."""
         bus = self._playbin.get_bus()
         bus.add_signal_watch()
+        bus.connect("message::async-done", self._on_bus_message_async_done)
         bus.connect("message::eos", self._on_bus_message_eos)
         bus.connect("message::error", self._on_bus_message_error)
         bus.connect("message::state-changed", self._on_bus_message_state_changed)
@@ -221,6 +223,12 @@ class VideoPlayer(aeidon.Observable):
                 current == Gst.State.PLAYING or
                 pending == Gst.State.PLAYING)
 
+    def _on_bus_message_async_done(self, bus, message):
+        """Emit signal once position is valid after seeking."""
+        # Async-done is posted when a flushing seek has completed,
+        # before that position can still be the one prior to seeking.
+        self.emit("seek-done")
+
     def _on_bus_message_eos(self, bus, message):
         """Handle EOS message from the bus."""
         self._ensure_default_segment()